@@ -1,30 +1,23 @@
 # Import Qt using unified import utility
-from hub.core.qt_import import import_qt
+from hub.core.qt_import import import_qt, qt_core
 QtWidgets = import_qt()
+QtCore = qt_core()  # None without Qt (window attributes, main-thread scheduling)
 
-# Try to import QtCore for window attributes
-try:
-    from Qt import QtCore
-except ImportError:
-    try:
-        from PySide2 import QtCore
-    except ImportError:
-        try:
-            from PySide6 import QtCore
-        except ImportError:
-            QtCore = None
-
-from hub.core.command_bus import CommandBus
+from hub.bootstrap import (  # noqa: F401 - re-exported for existing callers
+    build_core,
+    create_hda_bridge,
+    create_hda_catalog,
+    create_services,
+    detect_dcc,
+)
+from hub.core.diagnostics import DEFAULT_FRAMES, get_tracker
 from hub.core.event_bus import EventBus
-from hub.core.job_center import JobCenter
+from hub.core.ipc import IpcServer
 from hub.core.logging import get_logger, set_console_widget
-from hub.core.plugins import BaseToolPlugin, ToolContext
-from hub.core.registry import ToolRegistry
-from hub.core.settings import Settings
+from hub.core.plugins import BaseToolPlugin
+from hub.core.settings import Settings, default_layers
+from hub.core.state_journal import StateJournal, default_state_dir
 from hub.core.state_store import StateStore
-from hub.dcc.maya_backend import MayaFacade
-from hub.services.aigc_client import AigcClientStub
-from hub.services.hda_bridge import HdaBridgeStub
 from hub.ui.main_window import MainWindow
 
 logger = get_logger(__name__)
@@ -33,6 +26,68 @@ logger = get_logger(__name__)
 _window_instance = None
 # 模块级变量：保持 state 引用，避免 reload 时丢失
 _state_instance = None
+# 模块级变量：服务注册表（reload 前需关闭其中的进程与连接）
+_services_instance = None
+# 模块级变量：本地 IPC 服务器（供外部进程调用命令）
+_ipc_server = None
+# 模块级变量：DCC 外观（reload 前需移除其 DCC 事件回调）
+_dcc_instance = None
+# 模块级变量：设置（reload 前需停止其层文件轮询线程）
+_settings_instance = None
+
+
+def get_state_snapshot():
+    """Get a copy-on-write snapshot of the session state (None if no state yet)."""
+    return _state_instance.snapshot() if _state_instance is not None else None
+
+
+def restore_state(snapshot):
+    """Adopt session state carried over from a previous module generation.
+    
+    Called by reload_hub() so StateStore survives hot reload without copying.
+    
+    Args:
+        snapshot: Mapping from get_state_snapshot(), or None
+    """
+    global _state_instance
+    if snapshot is not None and _state_instance is None:
+        _state_instance = StateStore.from_snapshot(snapshot)
+        logger.debug(f"Restored {len(_state_instance)} state key(s) after reload")
+
+
+def shutdown_services():
+    """Tear down built services (worker processes, connections), release
+    the DCC facade's event callbacks, close the state journal, stop
+    settings layer polling and the IPC server.
+
+    Called by reload_hub() before the hub modules are dropped.
+    """
+    global _services_instance, _ipc_server, _dcc_instance, _settings_instance
+    if _state_instance is not None and _state_instance.journal is not None:
+        _state_instance.journal.close()
+        _state_instance.attach_journal(None)
+    if _settings_instance is not None:
+        _settings_instance.stop_refresh()
+        _settings_instance = None
+    if _services_instance is not None:
+        _services_instance.shutdown()
+        _services_instance = None
+    if _dcc_instance is not None:
+        _dcc_instance.shutdown()
+        _dcc_instance = None
+    if _ipc_server is not None:
+        _ipc_server.stop()
+        _ipc_server = None
+
+
+def _open_state_journal():
+    """Open the session state journal, or None if another Maya session owns it."""
+    journal = StateJournal(default_state_dir())
+    if journal.lock():
+        return journal
+    journal.close()
+    logger.warning("Session state journal is in use by another session; state is not persisted")
+    return None
 
 
 def get_maya_main_window():
@@ -77,39 +132,17 @@ def get_maya_main_window():
     return None
 
 
-def detect_dcc():
-    """Detect DCC environment and return appropriate facade.
-    
-    Returns:
-        DCCFacade instance (currently always MayaFacade stub).
-    """
-    return MayaFacade()  # stub
-
-
 def run() -> int:
     """AppShell entry point - creates and shows main window."""
-    global _window_instance, _state_instance
+    global _window_instance, _state_instance, _services_instance, _ipc_server, _dcc_instance, \
+        _settings_instance
     
     logger.info("Starting Hub application")
     
-    dcc = detect_dcc()
-    logger.info(f"DCC detected: {dcc.name}")
-    
-    # Initialize CommandBus
-    logger.debug("Initializing CommandBus")
-    cmd_bus = CommandBus()
-    
-    # Register echo command
-    def echo_handler(msg):
-        """Echo command handler - prints the message."""
-        logger.debug(f"Echo command: {msg}")
-        return msg
-    
-    cmd_bus.register("echo", echo_handler)
-    logger.debug("Registered 'echo' command")
-    
-    # Test echo command
-    result = cmd_bus.dispatch("echo", msg="hi")
+    # A previous run()'s facade is replaced; drop its DCC event callbacks
+    if _dcc_instance is not None:
+        _dcc_instance.shutdown()
+    dcc = _dcc_instance = detect_dcc()
     
     # Initialize EventBus
     logger.debug("Initializing EventBus")
@@ -125,29 +158,33 @@ def run() -> int:
     # Publish test event
     evt_bus.publish("mvp/test", {"ok": 1})
     
-    # Initialize JobCenter
-    logger.debug("Initializing JobCenter")
-    job_center = JobCenter(event_bus=evt_bus)
-    logger.info("JobCenter initialized and connected to EventBus")
-    
     # Initialize Settings
     logger.debug("Initializing Settings")
-    settings = Settings()
+    # Changes are published as settings/changed and written in the background
+    # Studio/project layers come from HUB_STUDIO_SETTINGS / HUB_PROJECT_SETTINGS
+    if _settings_instance is not None:
+        _settings_instance.stop_refresh()
+    settings = _settings_instance = Settings(event_bus=evt_bus, save_delay=1.0, layers=default_layers())
     
-    # Test settings: set, save, load
+    # Test settings: unchanged values are skipped, changes are saved debounced
     settings.set("ui.theme", "dark")
-    settings.save()
-    settings.load()
     
     # Verify settings
     theme = settings.get("ui.theme", "light")
     logger.info(f"Settings loaded: ui.theme = {theme}")
     
     # Initialize StateStore - reuse existing instance if available (for reload support)
+    # With state.persist on, changes are journaled to disk and the last
+    # session is restored lazily per namespace (survives Maya restart/crash)
+    persist = settings.get_bool("state.persist", False)
     if _state_instance is None:
-        _state_instance = StateStore()
+        _state_instance = StateStore(journal=_open_state_journal() if persist else None)
         logger.debug("Created new StateStore instance")
     else:
+        if persist and _state_instance.journal is None:
+            journal = _open_state_journal()
+            if journal is not None:
+                _state_instance.attach_journal(journal)
         logger.debug("Reusing existing StateStore instance (preserved across reload)")
     state = _state_instance
     
@@ -158,16 +195,41 @@ def run() -> int:
     
     # Initialize Services
     logger.debug("Initializing Services")
-    services = {
-        "aigc": AigcClientStub(),
-        "hda": HdaBridgeStub()
-    }
-    logger.info(f"Services initialized: {list(services.keys())}")
+    # Services are built on first access, health-checked every
+    # services.check_interval seconds and released when idle; a previous
+    # run()'s services (worker processes, connections) are shut down first
+    if _services_instance is not None:
+        _services_instance.shutdown()
+    services = _services_instance = create_services(settings, evt_bus)
+    logger.info(f"Services declared: {list(services.keys())}")
+    
+    # CommandBus, JobCenter, ToolRegistry and the tool.execute middleware
+    # pipeline are wired by the shared (UI-free) bootstrap
+    core = build_core(dcc, evt_bus=evt_bus, settings=settings, state=state, services=services)
+    cmd_bus, job_center, registry, ctx = core.cmd_bus, core.job_center, core.registry, core.context
+    logger.info("JobCenter initialized and connected to EventBus")
     
-    # Test ToolContext and BaseToolPlugin
-    ctx = ToolContext(dcc, settings, state, cmd_bus, evt_bus, job_center=job_center, services=services)
+    # Pick up edits to the studio/project layer files during the session;
+    # files are checked off the main thread, changes are applied on it
+    settings.start_refresh(settings.get_float("settings.refresh_interval", 30.0),
+                           schedule=job_center.call_in_main_thread)
+    
+    # Memory diagnostics for long sessions: with diagnostics.memory on,
+    # allocations are traced and checkpointed at every run() and reload
+    # (Diagnostics tab, or python -m hub.core.diagnostics from a shell)
+    tracker = get_tracker()
+    if settings.get_bool("diagnostics.memory", False) and not tracker.tracing:
+        tracker.start(settings.get_int("diagnostics.frames", DEFAULT_FRAMES))
+    tracker.checkpoint("run")
+    
+    # Test echo command
+    result = cmd_bus.dispatch("echo", msg="hi")
     
-    # Create a test plugin subclass
+    # Defer main-thread commands to the Qt event loop so the UI can repaint first
+    if QtCore is not None:
+        cmd_bus.set_main_thread_scheduler(lambda fn: QtCore.QTimer.singleShot(0, fn))
+    
+    # Test ToolContext and BaseToolPlugin
     class TestPlugin(BaseToolPlugin):
         def create_ui(self, parent=None):
             return None
@@ -178,68 +240,25 @@ def run() -> int:
     test_plugin = TestPlugin(ctx)
     logger.debug(f"Test plugin instantiated: {type(test_plugin).__name__}")
     
-    # Test ToolRegistry
-    logger.debug("Initializing ToolRegistry")
-    registry = ToolRegistry()
-    tools = registry.list_tools()
-    logger.info(f"Discovered {len(tools)} plugin(s): {tools}")
-    
-    # Register tool.execute command in CommandBus
-    def tool_execute_handler(key, **kwargs):
-        """Command handler for tool execution with exception handling.
-        
-        Args:
-            key: Plugin key (e.g., "poly.smooth_normals")
-            **kwargs: Plugin-specific parameters to pass to execute()
-            
-        Returns:
-            Result from plugin.execute()
-        """
-        logger.info(f"Dispatching tool.execute for key: {key}, kwargs: {kwargs}")
+    # Local IPC server: pipeline scripts and other DCCs drive the CommandBus
+    # and subscribe to events (see hub.core.ipc.IpcClient); commands are
+    # marshalled onto the main thread through JobCenter. It runs any
+    # registered command for a local client holding the token, so it is
+    # off unless a pipeline/farm setup opts in with ipc.enabled
+    if _ipc_server is not None:
+        _ipc_server.stop()
+        _ipc_server = None
+    if settings.get_bool("ipc.enabled", False):
+        schedule = job_center.call_in_main_thread if job_center.dispatcher.deferred else None
+        # A drain that runs out of its time slice must go back through the
+        # event loop rather than straight into the next drain
+        reschedule = (lambda fn: QtCore.QTimer.singleShot(0, fn)) if QtCore is not None else None
         try:
-            # Instantiate plugin and execute
-            plugin_instance, manifest = registry.instantiate(key, ctx)
-            logger.debug(f"Executing plugin: {key}")
-            result = plugin_instance.execute(**kwargs)
-            logger.info(f"Tool execution completed for key: {key}")
-            
-            # Publish tool/done event
-            payload = {
-                "key": key,
-                "result": result,
-                "kwargs": kwargs
-            }
-            evt_bus.publish("tool/done", payload)
-            logger.debug(f"Published tool/done event for key: {key}")
-            
-            return result
-        except Exception as e:
-            # Log error with full stack trace
-            logger.error(f"Error executing tool '{key}': {e}", exc_info=True)
-            
-            # Get plugin label for user-friendly error message
-            manifest = registry.get_manifest(key)
-            plugin_label = manifest.get("label", key) if manifest else key
-            
-            # Show user-friendly error message
-            error_msg = f"Error in {plugin_label}: {str(e)}"
-            dcc.show_message(error_msg, level="error")
-            
-            # Publish tool/failed event
-            failed_payload = {
-                "key": key,
-                "error": str(e),
-                "error_type": type(e).__name__,
-                "kwargs": kwargs
-            }
-            evt_bus.publish("tool/failed", failed_payload)
-            logger.debug(f"Published tool/failed event for key: {key}")
-            
-            # Re-raise the exception to maintain error propagation
-            raise
-    
-    cmd_bus.register("tool.execute", tool_execute_handler)
-    logger.debug("Registered 'tool.execute' command in CommandBus")
+            _ipc_server = IpcServer(cmd_bus, evt_bus, schedule=schedule, reschedule=reschedule)
+            _ipc_server.start()
+        except OSError as e:
+            logger.warning(f"IPC server not started: {e}")
+            _ipc_server = None
     
     # Get or create QApplication instance
     # In Maya, QApplication already exists, so instance() returns it
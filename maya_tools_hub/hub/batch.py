@@ -0,0 +1,314 @@
+"""Headless batch runner - run hub tools over many scenes without a UI.
+
+Bootstraps only the core (see hub.bootstrap) in a pool of worker
+processes, each with its own DCC session (Maya standalone, or the fake
+backend), opens every scene of a job manifest, runs its tools through the
+normal tool.execute pipeline and writes a JSON report.
+
+Usage:
+    mayapy -m hub.batch manifest.json [--report report.json] [--workers 4]
+    python -m hub.batch manifest.json --dcc fake      (CI, no Maya)
+
+Manifest::
+
+    {
+      "dcc": "maya",                        # or "fake" (default: HUB_DCC, else maya)
+      "workers": 4,                         # worker processes (0: run in this process)
+      "scenes": ["/shots/a.ma", "/shots/b.ma"],
+      "tools": [                            # run on every scene, in order
+        {"key": "poly.smooth_normals", "kwargs": {"angle": 45}, "select": "*"}
+      ],
+      "save": false,                        # true: save in place, "<dir>": save copies there
+      "continue_on_error": false,           # keep running a scene's tools after a failure
+      "recycle_after": 20,                  # fresh worker process after this many scenes
+      "jobs": [{"scene": "...", "tools": [...], "save": ...}]   # explicit jobs (optional)
+    }
+
+"select" is a list of nodes, "*" for every mesh, or omitted to keep the
+scene's saved selection. Jobs get "tools", "save" and "continue_on_error"
+from the manifest unless they set their own. The process exits with 1 if
+any job failed.
+"""
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+from hub.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+REPORT_VERSION = 1
+MAX_ATTEMPTS = 2  # a scene whose worker process dies is retried once
+
+# Core of the current worker process (see _init_worker)
+_core = None
+# Queue the worker reports each job index to as it starts (see _run_indexed)
+_started = None
+
+
+def load_manifest(path):
+    """Read a manifest and expand it into per-scene jobs.
+
+    Args:
+        path: Manifest JSON path
+
+    Returns:
+        (manifest dict, list of job dicts with scene, tools, save,
+        continue_on_error)
+
+    Raises:
+        ValueError: Manifest has no jobs or a tool without "key"
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    defaults = {
+        "tools": manifest.get("tools", []),
+        "save": manifest.get("save", False),
+        "continue_on_error": manifest.get("continue_on_error", False),
+    }
+    jobs = [dict(defaults, scene=scene) for scene in manifest.get("scenes", ())]
+    jobs += [dict(defaults, **job) for job in manifest.get("jobs", ())]
+    if not jobs:
+        raise ValueError(f"Manifest {path} has no scenes or jobs")
+    for job in jobs:
+        for tool in job["tools"]:
+            if not tool.get("key"):
+                raise ValueError(f"Tool entry without 'key' in job for {job.get('scene')}")
+    return manifest, jobs
+
+
+# ---- worker side ----
+
+def _init_worker(dcc_name, log_level, started=None):
+    """Process initializer: start the DCC session and build the core once."""
+    global _core, _started
+    _started = started
+    if log_level is not None:
+        logging.getLogger().setLevel(log_level)
+    if dcc_name == "fake":
+        os.environ["HUB_DCC"] = "fake"
+    else:
+        os.environ.pop("HUB_DCC", None)
+        import maya.standalone
+        maya.standalone.initialize(name="python")
+    from hub.bootstrap import build_core
+    from hub.core.dispatch import SyncDispatcher
+    # No event loop runs in a worker: a Qt dispatcher (mayapy ships a
+    # binding) would queue job results that are never delivered
+    _core = build_core(dispatcher=SyncDispatcher())
+
+
+def _select(selection):
+    """Apply a tool entry's "select" (list of nodes or "*" for all meshes)."""
+    import maya.cmds as cmds
+    if selection == "*":
+        selection = cmds.ls(type="mesh", l=True) or []
+    if selection:
+        cmds.select(selection, r=True)
+    else:
+        cmds.select(clear=True)
+
+
+def run_job(job):
+    """Open a scene, run its tools and optionally save it (worker process).
+
+    Args:
+        job: Job dict from load_manifest()
+
+    Returns:
+        Scene report dict (ok, error, tools, saved, duration, pid)
+    """
+    core = _core
+    start = time.perf_counter()
+    report = {"scene": job.get("scene"), "ok": True, "error": None, "tools": [], "saved": None,
+              "pid": os.getpid()}
+    try:
+        if job.get("scene"):
+            core.dcc.open_scene(job["scene"])
+        for tool in job["tools"]:
+            tool_report = {"key": tool["key"], "ok": True}
+            tool_start = time.perf_counter()
+            try:
+                if "select" in tool:
+                    _select(tool["select"])
+                result = core.run_tool(tool["key"], **(tool.get("kwargs") or {}))
+                tool_report["result"] = result
+            except Exception as e:
+                tool_report.update(ok=False, error=str(e), error_type=type(e).__name__)
+                report["ok"] = False
+            tool_report["duration"] = round(time.perf_counter() - tool_start, 4)
+            report["tools"].append(tool_report)
+            if not tool_report["ok"] and not job.get("continue_on_error"):
+                break
+        save = job.get("save")
+        if save and report["ok"]:
+            target = os.path.join(save, os.path.basename(job["scene"])) if isinstance(save, str) else None
+            report["saved"] = core.dcc.save_scene(target)
+    except Exception as e:
+        report.update(ok=False, error=f"{type(e).__name__}: {e}", traceback=traceback.format_exc())
+    report["duration"] = round(time.perf_counter() - start, 4)
+    return report
+
+
+def _run_indexed(index, job):
+    """run_job() for the pool, reporting index to the driver first."""
+    if _started is not None:
+        _started.put(index)
+    return run_job(job)
+
+
+# ---- driver side ----
+
+def _json_safe(report):
+    """Make tool results JSON-serializable (repr for anything else)."""
+    return json.loads(json.dumps(report, default=repr))
+
+
+def run_batch(jobs, dcc_name="maya", workers=None, recycle_after=None, log_level=logging.WARNING):
+    """Run jobs across worker processes.
+
+    Args:
+        jobs: Job dicts from load_manifest()
+        dcc_name: "maya" (each worker initializes Maya standalone) or "fake"
+        workers: Worker process count (default: CPU count; 0 runs in this process)
+        recycle_after: Replace a worker process after this many jobs
+        log_level: Log level inside the workers
+
+    Returns:
+        List of scene reports in job order
+    """
+    reports = [None] * len(jobs)
+    if workers == 0:
+        _init_worker(dcc_name, None)
+        try:
+            for index, job in enumerate(jobs):
+                reports[index] = _json_safe(run_job(job))
+                _log_progress(index, reports, len(jobs))
+        finally:
+            _core.shutdown()
+        return reports
+
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    context = multiprocessing.get_context("spawn")
+    attempts = [0] * len(jobs)
+    pending = list(range(len(jobs)))
+    while pending:
+        # recycle_after: each pool generation runs at most that many jobs
+        # per worker, then its processes exit and a fresh pool takes over
+        # (ProcessPoolExecutor's max_tasks_per_child can hang on 3.11)
+        size = workers * recycle_after if recycle_after else len(pending)
+        generation, pending = pending[:size], pending[size:]
+        retry = []
+        # A crashed worker breaks the whole pool: rerun what did not finish
+        # in the next one. Only jobs a worker had started count as an
+        # attempt (a job that keeps killing its worker is given up); jobs
+        # still queued behind the crash are simply resubmitted. A pool that
+        # breaks before any job starts (worker initialization failed)
+        # charges every unfinished job, so it cannot be rebuilt forever
+        started_queue = context.SimpleQueue()
+        started = None
+        with ProcessPoolExecutor(workers, mp_context=context, initializer=_init_worker,
+                                 initargs=(dcc_name, log_level, started_queue)) as pool:
+            futures = {pool.submit(_run_indexed, index, jobs[index]): index for index in generation}
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    reports[index] = _json_safe(future.result())
+                except BrokenProcessPool:
+                    if started is None:
+                        started = set()
+                        while not started_queue.empty():
+                            started.add(started_queue.get())
+                    if index in started or not started:
+                        attempts[index] += 1
+                    if attempts[index] < MAX_ATTEMPTS:
+                        retry.append(index)
+                        continue
+                    error = "Worker process died" if started else "Worker process failed to start"
+                    reports[index] = {"scene": jobs[index].get("scene"), "ok": False, "tools": [],
+                                      "error": error, "saved": None}
+                except Exception as e:
+                    reports[index] = {"scene": jobs[index].get("scene"), "ok": False, "tools": [],
+                                      "error": f"{type(e).__name__}: {e}", "saved": None}
+                _log_progress(index, reports, len(jobs))
+        if retry:
+            logger.warning(f"Worker process died, retrying {len(retry)} job(s)")
+            pending = sorted(retry) + pending
+        started_queue.close()
+    return reports
+
+
+def _log_progress(index, reports, total):
+    done = sum(1 for report in reports if report is not None)
+    report = reports[index]
+    status = "ok" if report["ok"] else f"FAILED ({report.get('error') or 'tool error'})"
+    logger.info(f"[{done}/{total}] {report.get('scene')}: {status}")
+
+
+def write_report(path, manifest_path, dcc_name, reports, started, duration):
+    """Write the batch report atomically.
+
+    Returns:
+        The report dict
+    """
+    tools = [tool for report in reports for tool in report.get("tools", ())]
+    report = {
+        "version": REPORT_VERSION,
+        "manifest": os.path.abspath(manifest_path),
+        "dcc": dcc_name,
+        "started": started,
+        "duration": round(duration, 3),
+        "summary": {
+            "jobs": len(reports),
+            "ok": sum(1 for r in reports if r["ok"]),
+            "failed": sum(1 for r in reports if not r["ok"]),
+            "tools_run": len(tools),
+            "tools_failed": sum(1 for t in tools if not t["ok"]),
+        },
+        "jobs": reports,
+    }
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=".report.", suffix=".tmp", dir=directory)
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    os.replace(tmp_path, path)
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run hub tools over scenes headlessly")
+    parser.add_argument("manifest", help="Job manifest (JSON)")
+    parser.add_argument("--report", help="Report path (default: <manifest>.report.json)")
+    parser.add_argument("--workers", type=int, help="Worker processes (0: run in this process)")
+    parser.add_argument("--dcc", choices=("maya", "fake"), help="DCC backend for the workers")
+    parser.add_argument("--verbose", action="store_true", help="Log at INFO level inside the workers")
+    args = parser.parse_args(argv)
+
+    manifest, jobs = load_manifest(args.manifest)
+    dcc_name = args.dcc or manifest.get("dcc") or (
+        "fake" if os.environ.get("HUB_DCC", "").lower() == "fake" else "maya")
+    workers = args.workers if args.workers is not None else manifest.get("workers")
+    report_path = args.report or os.path.splitext(args.manifest)[0] + ".report.json"
+
+    logger.info(f"Batch: {len(jobs)} job(s) on {dcc_name}, workers={workers if workers is not None else 'auto'}")
+    started = time.time()
+    start = time.perf_counter()
+    reports = run_batch(jobs, dcc_name, workers, manifest.get("recycle_after"),
+                        logging.INFO if args.verbose else logging.WARNING)
+    report = write_report(report_path, args.manifest, dcc_name, reports, started, time.perf_counter() - start)
+    summary = report["summary"]
+    logger.info(f"Batch finished in {report['duration']:.1f}s: {summary['ok']} ok, "
+                f"{summary['failed']} failed; report: {report_path}")
+    return 0 if summary["failed"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
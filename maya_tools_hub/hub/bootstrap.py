@@ -0,0 +1,311 @@
+"""Core bootstrap - builds the hub without any UI.
+
+Shared by the Qt application (hub.app.run) and headless entry points such
+as the batch runner (hub.batch): DCC detection, service declarations and
+the CommandBus tool pipeline live here, so both paths wire the core the
+same way. Nothing in this module imports Qt widgets.
+"""
+import os
+
+from hub.core.command_bus import CommandBus
+from hub.core.diagnostics import DiagnosticsMiddleware
+from hub.core.diagnostics import register_commands as register_diagnostics_commands
+from hub.core.event_bus import EventBus
+from hub.core.job_center import JobCenter
+from hub.core.logging import get_logger
+from hub.core.memo import MemoizeMiddleware
+from hub.core.middleware import (
+    ErrorMessageMiddleware,
+    EventMiddleware,
+    TimingMiddleware,
+    UndoMiddleware,
+    ValidationMiddleware,
+)
+from hub.core.plugins import ToolContext
+from hub.core.profiler import ProfilerMiddleware, ToolProfiler
+from hub.core.profiler import register_commands as register_profiler_commands
+from hub.core.registry import ToolRegistry
+from hub.core.settings import Settings, default_layers
+from hub.core.state_store import StateStore
+from hub.dcc.fake_backend import FakeFacade
+from hub.dcc.maya_backend import MayaFacade
+from hub.services.aigc_cache import AigcResultCache
+from hub.services.aigc_client import AigcClient, AigcClientStub
+from hub.services.hda_bridge import HdaBridge, HdaBridgeStub
+from hub.services.hda_catalog import HdaCatalog
+from hub.services.hda_pool import HdaWorkerPool, hython_command, standin_command
+from hub.services.registry import ServiceRegistry
+
+logger = get_logger(__name__)
+
+
+def detect_dcc():
+    """Detect DCC environment and return appropriate facade.
+    
+    Set the HUB_DCC environment variable to "fake" to use the headless
+    in-memory scene backend (benchmarks / CI without Maya).
+    
+    Returns:
+        DCCFacade instance (FakeFacade or MayaFacade).
+    """
+    if os.environ.get("HUB_DCC", "").lower() == "fake":
+        facade = FakeFacade()
+        facade.install_cmds()
+        return facade
+    return MayaFacade()
+
+
+def create_hda_bridge(settings, catalog=None):
+    """Create the HDA bridge service.
+
+    HUB_HYTHON selects a pool of persistent hython workers, HUB_HDA_STANDIN=1
+    a pool of stand-in Python workers (no Houdini); otherwise the stub.
+    An HdaCatalog, if given, answers list_hdas() from its index.
+    """
+    hython = os.environ.get("HUB_HYTHON")
+    if hython:
+        command = hython_command(hython)
+    elif os.environ.get("HUB_HDA_STANDIN") == "1":
+        command = standin_command()
+    else:
+        return HdaBridgeStub(catalog=catalog)
+    pool = HdaWorkerPool(
+        command,
+        size=settings.get_int("hda.workers", 2),
+        max_cooks=settings.get_int("hda.max_cooks", 200),
+        cook_timeout=settings.get_float("hda.cook_timeout", 600.0) or None,
+    )
+    return HdaBridge(pool, catalog=catalog)
+
+
+def create_hda_catalog(settings):
+    """Create the HDA library catalog (None if no library is configured).
+
+    Libraries come from the hda.library_paths setting and HUB_HDA_LIBRARY
+    (os.pathsep-separated). The saved index answers queries immediately;
+    it is refreshed in the background every hda.catalog_refresh seconds.
+    """
+    roots = list(settings.get("hda.library_paths") or [])
+    roots += [p for p in os.environ.get("HUB_HDA_LIBRARY", "").split(os.pathsep) if p]
+    if not roots:
+        return None
+    catalog = HdaCatalog(roots)
+    catalog.start(interval=settings.get_float("hda.catalog_refresh", 300.0))
+    return catalog
+
+
+def create_services(settings, event_bus=None):
+    """Declare the hub services on a lazy ServiceRegistry.
+
+    Nothing is constructed here: HUB_AIGC_URL picks the AIGC client, the
+    HDA bridge and catalog follow create_hda_bridge / create_hda_catalog.
+    HDA workers are released after hda.idle_timeout seconds without use and
+    AIGC connections after aigc.idle_timeout; hda.warm_up starts the
+    workers in the background right away.
+
+    Returns:
+        Started ServiceRegistry
+    """
+    services = ServiceRegistry(event_bus=event_bus)
+    # HUB_AIGC_URL points the AIGC client at a real (or stand-in) service;
+    # aigc.model_version keys the result cache (no version, no caching)
+    aigc_url = os.environ.get("HUB_AIGC_URL")
+    services.declare(
+        "aigc",
+        lambda: AigcClient(aigc_url, model_version=settings.get_str("aigc.model_version") or None)
+        if aigc_url else AigcClientStub(),
+        idle_timeout=settings.get_float("aigc.idle_timeout", 600.0) or None,
+        in_use=lambda client: getattr(client, "busy", False),
+    )
+    # AIGC results are cached by input hash; aigc.shared_cache_dir adds a
+    # studio-wide cache shared between workstations
+    services.declare("aigc_cache", lambda: AigcResultCache(
+        settings.get_str("aigc.cache_dir") or None,
+        max_bytes=settings.get_int("aigc.cache_max_mb", 5120) * 1024 * 1024,
+        shared_dir=settings.get_str("aigc.shared_cache_dir") or None,
+    ))
+    services.declare("hda_catalog", lambda: create_hda_catalog(settings))
+    services.declare(
+        "hda",
+        lambda: create_hda_bridge(settings, services.get("hda_catalog")),
+        warm=settings.get_bool("hda.warm_up", False),
+        idle_timeout=settings.get_float("hda.idle_timeout", 900.0) or None,
+        in_use=lambda bridge: getattr(bridge, "busy", False),
+    )
+    services.start(interval=settings.get_float("services.check_interval", 30.0))
+    services.warm_up()
+    return services
+
+
+def install_tool_pipeline(cmd_bus, evt_bus, dcc, registry, ctx, profiler=None):
+    """Register the tool.execute command and its middleware pipeline.
+
+    Args:
+        cmd_bus: CommandBus
+        evt_bus: EventBus receiving tool/done and tool/failed
+        dcc: DCC facade (undo chunks, user messages, memo fingerprints)
+        registry: ToolRegistry
+        ctx: ToolContext passed to plugins
+        profiler: Optional ToolProfiler sampling tool runs (inside timing,
+            around everything else)
+    """
+    def tool_execute_handler(key, **kwargs):
+        """Command handler for tool execution.
+        
+        Error logging, user messages, undo grouping and tool/done / tool/failed
+        events are handled by the CommandBus middleware registered below.
+        
+        Args:
+            key: Plugin key (e.g., "poly.smooth_normals")
+            **kwargs: Plugin-specific parameters to pass to execute()
+            
+        Returns:
+            Result from plugin.execute()
+        """
+        logger.info(f"Dispatching tool.execute for key: {key}, kwargs: {kwargs}")
+        plugin_instance, manifest = registry.instantiate(key, ctx)
+        logger.debug(f"Executing plugin: {key}")
+        result = plugin_instance.execute(**kwargs)
+        logger.info(f"Tool execution completed for key: {key}")
+        return result
+    
+    def tool_label(name, kwargs):
+        """Get user-friendly plugin label for messages and undo chunks."""
+        key = kwargs.get("key")
+        manifest = registry.get_manifest(key) if key else None
+        return manifest.get("label", key) if manifest else str(key)
+    
+    def tool_payload(name, kwargs):
+        """Build base tool/done and tool/failed event payload."""
+        return {
+            "key": kwargs.get("key"),
+            "kwargs": {k: v for k, v in kwargs.items() if k != "key"}
+        }
+    
+    def validate_tool_kwargs(kwargs):
+        """Reject tool.execute calls without a registered plugin key."""
+        key = kwargs.get("key")
+        if not key or registry.get_manifest(key) is None:
+            raise KeyError(f"Plugin '{key}' not found in registry")
+    
+    # Middleware pipeline (outermost first)
+    tool_commands = ["tool.execute"]
+    cmd_bus.use(TimingMiddleware())
+    if profiler is not None:
+        cmd_bus.use(ProfilerMiddleware(profiler, commands=tool_commands))
+    cmd_bus.use(EventMiddleware(evt_bus, "tool/done", "tool/failed", commands=tool_commands, payload=tool_payload))
+    cmd_bus.use(ErrorMessageMiddleware(dcc, commands=tool_commands, describe=tool_label))
+    cmd_bus.use(MemoizeMiddleware(registry, dcc, evt_bus))
+    cmd_bus.use(ValidationMiddleware({"tool.execute": validate_tool_kwargs}))
+    cmd_bus.use(UndoMiddleware(dcc, commands=tool_commands, label=tool_label))
+    
+    cmd_bus.register("tool.execute", tool_execute_handler)
+    logger.debug("Registered 'tool.execute' command in CommandBus")
+
+
+class Core:
+    """The hub core without UI: DCC facade, buses, JobCenter, settings,
+    state, services, tool registry, the ToolContext handed to plugins and
+    the tool profiler."""
+
+    def __init__(self, dcc, settings, state, cmd_bus, evt_bus, job_center, services, registry, context,
+                 profiler=None):
+        self.dcc = dcc
+        self.settings = settings
+        self.state = state
+        self.cmd_bus = cmd_bus
+        self.evt_bus = evt_bus
+        self.job_center = job_center
+        self.services = services
+        self.registry = registry
+        self.context = context
+        self.profiler = profiler
+
+    def run_tool(self, key, **kwargs):
+        """Run a tool through the full tool.execute pipeline.
+
+        Args:
+            key: Plugin key (e.g. "poly.smooth_normals")
+            **kwargs: Plugin parameters
+
+        Returns:
+            Result from plugin.execute()
+        """
+        return self.cmd_bus.dispatch("tool.execute", key=key, **kwargs)
+
+    def shutdown(self):
+        """Tear down services, release DCC callbacks, stop settings layer
+        polling and write pending settings."""
+        if hasattr(self.services, "shutdown"):
+            self.services.shutdown()
+        self.dcc.shutdown()
+        self.settings.stop_refresh()
+        self.settings.flush()
+
+
+def build_core(dcc=None, evt_bus=None, settings=None, state=None, services=None, plugins_root=None,
+               dispatcher=None):
+    """Build the hub core. Every component not passed in is created.
+
+    The defaults suit headless use: settings are read but never autosaved,
+    session state is in-memory only (no journal), and services are
+    declared lazily (see create_services).
+
+    Args:
+        dcc: DCC facade (default: detect_dcc())
+        evt_bus: EventBus
+        settings: Settings
+        state: StateStore
+        services: Services mapping (default: create_services())
+        plugins_root: Plugin directory (default: hub/plugins)
+        dispatcher: Main-thread Dispatcher for JobCenter (default: Qt if
+            available, else synchronous; see hub.core.dispatch)
+
+    Returns:
+        Core
+    """
+    dcc = dcc or detect_dcc()
+    logger.info(f"DCC detected: {dcc.name}")
+    evt_bus = evt_bus or EventBus()
+    
+    cmd_bus = CommandBus()
+    
+    def echo_handler(msg):
+        """Echo command handler - returns the message."""
+        logger.debug(f"Echo command: {msg}")
+        return msg
+    
+    cmd_bus.register("echo", echo_handler)
+    
+    # Route CommandBus.dispatch_async() through JobCenter
+    job_center = JobCenter(event_bus=evt_bus, dispatcher=dispatcher)
+    cmd_bus.set_job_center(job_center)
+    
+    # Studio/project layers come from HUB_STUDIO_SETTINGS / HUB_PROJECT_SETTINGS
+    if settings is None:
+        settings = Settings(event_bus=evt_bus, layers=default_layers())
+    if state is None:
+        state = StateStore()
+    if services is None:
+        services = create_services(settings, evt_bus)
+    
+    ctx = ToolContext(dcc, settings, state, cmd_bus, evt_bus, job_center=job_center, services=services)
+    
+    registry = ToolRegistry(plugins_root)
+    tools = registry.list_tools()
+    logger.info(f"Discovered {len(tools)} plugin(s): {tools}")
+    # Register typed setting defaults declared in plugin manifests
+    for tool_key in tools:
+        settings.register_schema(tool_key, registry.get_manifest(tool_key).get("settings"))
+    
+    # Opt-in sampling profiler for tool runs and jobs (profiler.* settings)
+    profiler = ToolProfiler.from_settings(settings, evt_bus, schedule=job_center.call_in_main_thread)
+    job_center.set_profiler(profiler)
+    register_profiler_commands(cmd_bus, profiler)
+    
+    install_tool_pipeline(cmd_bus, evt_bus, dcc, registry, ctx, profiler=profiler)
+    # Memory diagnostics (only measures while tracing; see hub.core.diagnostics)
+    cmd_bus.use(DiagnosticsMiddleware(commands=["tool.execute"],
+                                      snapshots=settings.get_bool("diagnostics.snapshot_tools", False)))
+    register_diagnostics_commands(cmd_bus, evt_bus)
+    return Core(dcc, settings, state, cmd_bus, evt_bus, job_center, services, registry, ctx, profiler)
@@ -1,47 +1,241 @@
 """CommandBus - synchronous command dispatch system."""
+from collections import namedtuple
+from concurrent.futures import Future
+from contextlib import ExitStack
+
 from hub.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Phases of a background-capable command (see CommandBus.register)
+_AsyncSpec = namedtuple("_AsyncSpec", "prepare finalize")
+
 
 class CommandBus:
     """Synchronous command bus for tool execution.
-    
+
     Commands are registered with a name and can be dispatched with keyword arguments.
+    Cross-cutting concerns (timing, validation, undo, error mapping, events) are
+    added as middleware, see hub.core.middleware.
     """
-    
-    def __init__(self):
-        """Initialize empty command registry."""
+
+    def __init__(self, job_center=None):
+        """Initialize empty command registry.
+
+        Args:
+            job_center: Optional JobCenter used by dispatch_async()
+        """
         self._commands = {}
-    
-    def register(self, name, func):
+        self._async = {}  # name -> _AsyncSpec for background-capable commands
+        self._middleware = []
+        self._chains = {}  # name -> compiled pipeline callable(kwargs)
+        self._job_center = job_center
+        self._schedule = None  # callable(fn) deferring fn to the main thread
+
+    def register(self, name, func, background=False, prepare=None, finalize=None):
         """Register a command handler.
-        
+
+        Background-capable commands are run by dispatch_async() in three phases:
+        prepare (main thread, may read the scene) -> func (JobCenter worker
+        thread, must not touch Qt or the scene) -> finalize (main thread, may
+        write the scene). Synchronous dispatch() runs func directly.
+
         Args:
             name: Command name (string)
             func: Callable that accepts **kwargs
+            background: Whether func may run in a worker thread
+            prepare: Optional callable(**kwargs) -> kwargs dict for func
+            finalize: Optional callable(result) -> final command result
         """
         self._commands[name] = func
+        if background:
+            self._async[name] = _AsyncSpec(prepare, finalize)
+        else:
+            self._async.pop(name, None)
+        self._chains.pop(name, None)
         logger.debug(f"Registered command: {name}")
-    
+
+    def is_background(self, name):
+        """Check whether a command was registered as background-capable."""
+        return name in self._async
+
+    def set_job_center(self, job_center):
+        """Set the JobCenter used to run background commands."""
+        self._job_center = job_center
+
+    def set_main_thread_scheduler(self, schedule):
+        """Set how dispatch_async() defers main-thread commands.
+
+        Deferring lets the UI repaint (e.g. show a busy indicator) before a
+        scene-touching command blocks the main thread.
+
+        Args:
+            schedule: Callable(fn) running fn later on the main thread, or
+                None to run main-thread commands immediately
+        """
+        self._schedule = schedule
+
+    def use(self, middleware):
+        """Add a middleware to the dispatch pipeline.
+
+        Middleware added first is the outermost layer.
+
+        Args:
+            middleware: Middleware instance (see hub.core.middleware.Middleware)
+        """
+        self._middleware.append(middleware)
+        self._chains.clear()
+        logger.debug(f"Added command middleware: {type(middleware).__name__}")
+
+    def _check(self, name):
+        """Raise KeyError if a command is not registered."""
+        if name not in self._commands:
+            logger.error(f"Command '{name}' is not registered")
+            raise KeyError(f"Command '{name}' is not registered")
+
+    def _compose(self, name, terminal):
+        """Wrap a terminal callable(kwargs) in the command's middleware."""
+        chain = terminal
+        for middleware in reversed(self._middleware):
+            if middleware.applies_to(name):
+                chain = _bind(middleware, name, chain)
+        return chain
+
+    def _chain(self, name):
+        """Get (building and caching if needed) the pipeline for a command."""
+        chain = self._chains.get(name)
+        if chain is not None:
+            return chain
+        self._check(name)
+        handler = self._commands[name]
+
+        def terminal(kwargs):
+            return handler(**kwargs)
+
+        chain = self._chains[name] = self._compose(name, terminal)
+        return chain
+
     def dispatch(self, name, **kwargs):
         """Dispatch a command by name.
-        
+
         Args:
             name: Command name
             **kwargs: Arguments to pass to the command handler
-            
+
         Returns:
             Return value from the command handler
-            
+
         Raises:
             KeyError: If command is not registered
         """
-        if name not in self._commands:
-            logger.error(f"Command '{name}' is not registered")
-            raise KeyError(f"Command '{name}' is not registered")
-        
         logger.debug(f"Dispatching command: {name}")
+        return self._chain(name)(kwargs)
+
+    def dispatch_many(self, commands, stop_on_error=True):
+        """Dispatch a list of commands under shared middleware setup.
+
+        Each middleware's batch() scope is entered once for the whole list
+        (e.g. one undo chunk for all commands) instead of per command.
+
+        Args:
+            commands: Iterable of (name, kwargs_dict) tuples
+            stop_on_error: Raise on the first failure if True, otherwise
+                store the exception in the results list and continue
+
+        Returns:
+            List of results in command order
+        """
+        commands = list(commands)
+        # Resolve up front so an unknown name fails before anything runs;
+        # without stop_on_error the lookup error is that item's result
+        chains = []
+        for name, _ in commands:
+            try:
+                chains.append(self._chain(name))
+            except KeyError as e:
+                if stop_on_error:
+                    raise
+                chains.append(e)
+        logger.debug(f"Dispatching batch of {len(commands)} command(s)")
+        results = []
+        with ExitStack() as stack:
+            for middleware in self._middleware:
+                stack.enter_context(middleware.batch(commands))
+            for chain, (name, kwargs) in zip(chains, commands):
+                if isinstance(chain, KeyError):
+                    results.append(chain)
+                    continue
+                try:
+                    results.append(chain(dict(kwargs)))
+                except Exception as e:
+                    if stop_on_error:
+                        raise
+                    results.append(e)
+        return results
+
+    def dispatch_async(self, name, **kwargs):
+        """Dispatch a command without blocking the caller.
+
+        Background-capable commands run their worker phase through JobCenter;
+        other commands run on the main thread (deferred via the main-thread
+        scheduler if one is set). Middleware wraps the main-thread completion
+        phase, so done/failed events, error messages and undo still apply.
+
+        Args:
+            name: Command name
+            **kwargs: Arguments to pass to the command
+
+        Returns:
+            concurrent.futures.Future resolved (on the main thread) with the
+            command result or exception
+        """
+        self._check(name)
+        future = Future()
+        future.set_running_or_notify_cancel()
+        spec = self._async.get(name)
+
+        if spec is None or self._job_center is None:
+            def run_now():
+                try:
+                    future.set_result(self.dispatch(name, **kwargs))
+                except Exception as e:
+                    future.set_exception(e)
+
+            if self._schedule is not None:
+                self._schedule(run_now)
+            else:
+                run_now()
+            return future
+
+        def complete(outcome, failed):
+            # Main thread: run middleware around the finalize phase
+            def terminal(_kwargs):
+                if failed:
+                    raise outcome
+                return spec.finalize(outcome) if spec.finalize else outcome
+            try:
+                future.set_result(self._compose(name, terminal)(kwargs))
+            except Exception as e:
+                future.set_exception(e)
+
+        try:
+            work_kwargs = spec.prepare(**kwargs) if spec.prepare else kwargs
+        except Exception as e:
+            complete(e, True)
+            return future
+
         handler = self._commands[name]
-        return handler(**kwargs)
+        logger.debug(f"Dispatching command to background: {name}")
+        self._job_center.run_in_thread(
+            lambda: handler(**work_kwargs),
+            callback=lambda result: complete(result, False),
+            error_callback=lambda error: complete(error, True),
+        )
+        return future
+
 
+def _bind(middleware, name, call_next):
+    """Bind a middleware layer around the next pipeline callable."""
+    def layer(kwargs):
+        return middleware(name, kwargs, call_next)
+    return layer
@@ -0,0 +1,356 @@
+"""Memory diagnostics - leak hunting for long DCC sessions.
+
+Artists keep Maya open for days, through many reload_hub() and run()
+calls. Objects from an earlier module generation that are still alive
+after a reload are leaks by definition, and so are EventBus subscribers
+whose owner is gone. This module finds them:
+
+    MemoryTracker        tracemalloc checkpoints (before/after reloads and
+                         tool runs) and the top growth sites between them
+    count_objects()      live hub objects by type
+    stale_objects()      instances of classes from a reloaded module
+                         generation (old plugins, widgets, services)
+    orphaned_subscribers()  EventBus callbacks from reloaded modules or
+                         bound to deleted Qt widgets
+    report() / format_report()  all of the above, for the diagnostics
+                         panel, the "diagnostics.report" command or
+                         ``python -m hub.core.diagnostics`` (asks a running
+                         hub over IPC; needs ipc.enabled)
+
+The tracker is process-wide (get_tracker()) and lives in hub.core.memtrack,
+which reload_hub() keeps loaded so checkpoints survive reloads; this module
+reloads with the rest of the hub.
+"""
+import gc
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+
+from hub.core.logging import get_logger
+from hub.core.memtrack import DEFAULT_FRAMES, get_tracker
+from hub.core.memtrack import DEFAULT_KEEP, Checkpoint, MemoryTracker  # noqa: F401 - re-exported
+from hub.core.middleware import Middleware
+
+logger = get_logger(__name__)
+
+
+class DiagnosticsMiddleware(Middleware):
+    """Track the traced-memory change of every command run.
+
+    Net growth per tool shows which tool keeps memory alive between runs.
+    With snapshots on, each run is also bracketed by "<key>:before" and
+    "<key>:after" checkpoints (slow; for hunting one tool's leak).
+    """
+
+    def __init__(self, tracker=None, commands=None, snapshots=False):
+        """Initialize middleware.
+
+        Args:
+            tracker: MemoryTracker (default: get_tracker())
+            commands: Command names to track (default: all)
+            snapshots: Take checkpoints around every run
+        """
+        super().__init__(commands)
+        self.tracker = tracker or get_tracker()
+        self.snapshots = snapshots
+
+    def __call__(self, name, kwargs, call_next):
+        if not tracemalloc.is_tracing():
+            return call_next(kwargs)
+        key = kwargs.get("key") or name
+        if self.snapshots:
+            self.tracker.checkpoint(f"{key}:before")
+        before = tracemalloc.get_traced_memory()[0]
+        try:
+            return call_next(kwargs)
+        finally:
+            self.tracker.record_run(key, tracemalloc.get_traced_memory()[0] - before)
+            if self.snapshots:
+                self.tracker.checkpoint(f"{key}:after")
+
+
+# ---- live object inspection ----
+
+def _is_hub_module(name, prefix):
+    return name == prefix or name.startswith(prefix + ".")
+
+
+def _defining_globals(cls):
+    """Globals of the module generation a class was defined in (or None)."""
+    for value in vars(cls).values():
+        if isinstance(value, (staticmethod, classmethod)):
+            value = value.__func__
+        globals_ = getattr(value, "__globals__", None)
+        if globals_ is not None:
+            return globals_
+    return None
+
+
+def is_stale_class(cls):
+    """Whether a class comes from a module generation that was reloaded
+    (or unloaded) since it was defined."""
+    module = sys.modules.get(cls.__module__)
+    if module is None:
+        return True
+    globals_ = _defining_globals(cls)
+    if globals_ is not None:
+        return globals_ is not vars(module)
+    # No functions to go by: resolve the class by name
+    current = module
+    for part in cls.__qualname__.split("."):
+        current = getattr(current, part, None)
+        if current is None:
+            return False  # defined in a function; cannot tell
+    return current is not cls
+
+
+def is_stale_function(fn):
+    """Whether a function (or bound method) comes from a reloaded module."""
+    fn = getattr(fn, "__func__", fn)
+    globals_ = getattr(fn, "__globals__", None)
+    name = getattr(fn, "__module__", None)
+    if globals_ is None or not name:
+        return False
+    module = sys.modules.get(name)
+    return module is None or vars(module) is not globals_
+
+
+def _is_deleted_qobject(obj):
+    """Whether obj wraps a Qt object whose C++ side is gone (never imports Qt)."""
+    shiboken = sys.modules.get("shiboken6") or sys.modules.get("shiboken2")
+    if shiboken is None:
+        return False
+    try:
+        return not shiboken.isValid(obj)
+    except TypeError:
+        return False  # not a Qt object
+
+
+def count_objects(prefix="hub", collect=True):
+    """Count live objects whose class is defined in the hub.
+
+    Args:
+        prefix: Top-level package
+        collect: Run the garbage collector first (count only reachable objects)
+
+    Returns:
+        Counter: "module.QualName" -> count (stale generations are tagged
+        " [stale]")
+    """
+    if collect:
+        gc.collect()
+    counts = Counter()
+    stale_cache = {}
+    for obj in gc.get_objects():
+        cls = type(obj)
+        module = getattr(cls, "__module__", None)
+        if not isinstance(module, str) or not _is_hub_module(module, prefix):
+            continue
+        stale = stale_cache.get(cls)
+        if stale is None:
+            stale = stale_cache[cls] = is_stale_class(cls)
+        counts[f"{module}.{cls.__qualname__}{' [stale]' if stale else ''}"] += 1
+    return counts
+
+
+def stale_objects(prefix="hub", collect=True):
+    """Live instances of hub classes from a reloaded module generation.
+
+    Returns:
+        dict: "module.QualName" -> count
+    """
+    suffix = " [stale]"
+    return {name[:-len(suffix)]: count for name, count in count_objects(prefix, collect).most_common()
+            if name.endswith(suffix)}
+
+
+def live_plugins(collect=True):
+    """Live tool plugin instances (by class name, so reloads do not hide them).
+
+    ToolRegistry creates a plugin per tool run; instances that stay alive
+    beyond the ones held by open panels are leaks.
+
+    Returns:
+        List of dicts (key, type, stale)
+    """
+    if collect:
+        gc.collect()
+    plugins = []
+    for obj in gc.get_objects():
+        cls = type(obj)
+        if not any(base.__name__ == "BaseToolPlugin" and base.__module__ == "hub.core.plugins"
+                   for base in cls.__mro__[1:]):
+            continue
+        plugins.append({"key": getattr(obj, "_plugin_key", None),
+                        "type": f"{cls.__module__}.{cls.__qualname__}", "stale": is_stale_class(cls)})
+    return plugins
+
+
+def live_event_buses(collect=True):
+    """All live EventBus objects, current generation or not."""
+    if collect:
+        gc.collect()
+    return [obj for obj in gc.get_objects()
+            if type(obj).__name__ == "EventBus" and type(obj).__module__ == "hub.core.event_bus"]
+
+
+def _describe_callback(callback):
+    fn = getattr(callback, "__func__", callback)
+    owner = getattr(callback, "__self__", None)
+    name = getattr(fn, "__qualname__", None) or repr(fn)
+    if owner is not None:
+        name = f"{type(owner).__qualname__}.{getattr(fn, '__name__', name)}"
+    return f"{getattr(fn, '__module__', '?')}.{name}"
+
+
+def orphaned_subscribers(evt_bus):
+    """EventBus subscribers whose owner is gone.
+
+    Args:
+        evt_bus: EventBus
+
+    Returns:
+        List of dicts (topic, callback, reason): reason is "stale module"
+        (defined in a module generation that was reloaded) or "deleted
+        widget" (bound to a Qt object whose C++ side was destroyed)
+    """
+    orphans = []
+    for topic, callbacks in evt_bus.subscriptions().items():
+        for callback in callbacks:
+            reason = None
+            owner = getattr(callback, "__self__", None)
+            if is_stale_function(callback) or (owner is not None and is_stale_class(type(owner))):
+                reason = "stale module"
+            elif owner is not None and _is_deleted_qobject(owner):
+                reason = "deleted widget"
+            if reason:
+                orphans.append({"topic": topic, "callback": _describe_callback(callback), "reason": reason})
+    return orphans
+
+
+def report(evt_bus=None, top=10, tracker=None):
+    """Collect a memory diagnostics report.
+
+    Args:
+        evt_bus: Current EventBus (checked for orphaned subscribers)
+        top: Number of object types / growth sites listed
+        tracker: MemoryTracker (default: get_tracker())
+
+    Returns:
+        JSON-serializable dict
+    """
+    tracker = tracker or get_tracker()
+    gc.collect()
+    counts = count_objects(collect=False)
+    buses = live_event_buses(collect=False)
+    traced = tracemalloc.get_traced_memory() if tracker.tracing else None
+    threads = Counter(thread.name.rstrip("0123456789").rstrip("-_ ") or thread.name
+                      for thread in threading.enumerate())
+    return {
+        "time": time.time(),
+        "tracing": tracker.tracing,
+        "traced": {"current": traced[0], "peak": traced[1]} if traced else None,
+        "checkpoints": [{"label": c.label, "time": c.time, "traced": c.traced} for c in tracker.checkpoints],
+        "growth": tracker.compare(top=top),
+        "growth_since_start": tracker.compare(older="start", top=top) if tracker.find("start") else [],
+        "tool_growth": {key: {"runs": runs, "bytes": size} for key, (runs, size)
+                        in sorted(tracker.tool_growth.items(), key=lambda item: -item[1][1])},
+        "objects": dict(counts.most_common(top)),
+        "hub_objects": sum(counts.values()),
+        "stale_objects": {name[:-len(" [stale]")]: count for name, count in counts.most_common()
+                          if name.endswith(" [stale]")},
+        "plugins": live_plugins(collect=False),
+        "event_buses": len(buses),
+        "orphaned_subscribers": orphaned_subscribers(evt_bus) if evt_bus is not None else [],
+        "threads": dict(threads),
+        "gc_garbage": len(gc.garbage),
+    }
+
+
+def format_report(data):
+    """Render a report() dict as text."""
+    lines = []
+    if data["traced"]:
+        lines.append(f"Traced memory: {data['traced']['current'] / 2 ** 20:.1f} MB "
+                     f"(peak {data['traced']['peak'] / 2 ** 20:.1f} MB)")
+    else:
+        lines.append("Memory tracing off (enable diagnostics.memory or start the tracker)")
+    for title, sites in (("Growth since last checkpoint", data["growth"]),
+                         ("Growth since start", data["growth_since_start"])):
+        if sites:
+            lines.append(f"\n{title}:")
+            lines += [f"  {site['size_diff'] / 1024:+9.1f} KB {site['count_diff']:+7d}  {site['site']}"
+                      for site in sites]
+    if data["tool_growth"]:
+        lines.append("\nNet growth per tool:")
+        lines += [f"  {entry['bytes'] / 1024:+9.1f} KB over {entry['runs']} run(s)  {key}"
+                  for key, entry in data["tool_growth"].items()]
+    lines.append(f"\nLive hub objects: {data['hub_objects']} (EventBus instances: {data['event_buses']})")
+    lines += [f"  {count:7d}  {name}" for name, count in data["objects"].items()]
+    if data["stale_objects"]:
+        lines.append("\nStale objects (from reloaded modules - leaked):")
+        lines += [f"  {count:7d}  {name}" for name, count in data["stale_objects"].items()]
+    plugins = Counter((p["type"], p["key"], p["stale"]) for p in data["plugins"])
+    if plugins:
+        lines.append("\nLive plugin instances:")
+        lines += [f"  {count:7d}  {key or '?'} ({name}){' [stale]' if stale else ''}"
+                  for (name, key, stale), count in plugins.most_common()]
+    if data["orphaned_subscribers"]:
+        lines.append("\nOrphaned EventBus subscribers:")
+        lines += [f"  {o['topic']}: {o['callback']} ({o['reason']})" for o in data["orphaned_subscribers"]]
+    lines.append("\nThreads: " + ", ".join(f"{name} x{count}" for name, count in sorted(data["threads"].items())))
+    if data["gc_garbage"]:
+        lines.append(f"gc.garbage: {data['gc_garbage']} uncollectable object(s)")
+    return "\n".join(lines)
+
+
+def register_commands(cmd_bus, evt_bus=None, tracker=None):
+    """Register diagnostics.* commands (reachable over IPC as well).
+
+    Commands:
+        diagnostics.report(top=10): report() dict
+        diagnostics.checkpoint(label): take a checkpoint
+        diagnostics.start(frames=10) / diagnostics.stop(): tracing on/off
+    """
+    tracker = tracker or get_tracker()
+
+    def checkpoint(label="manual"):
+        result = tracker.checkpoint(label)
+        return None if result is None else {"label": result.label, "traced": result.traced}
+
+    cmd_bus.register("diagnostics.report", lambda top=10: report(evt_bus, top, tracker))
+    cmd_bus.register("diagnostics.checkpoint", checkpoint)
+    cmd_bus.register("diagnostics.start", lambda frames=DEFAULT_FRAMES: tracker.start(frames))
+    cmd_bus.register("diagnostics.stop", tracker.stop)
+
+
+def main(argv=None):
+    """Print the memory report of a running hub (over local IPC)."""
+    import argparse
+    from hub.core.ipc import IpcClient
+
+    parser = argparse.ArgumentParser(description="Memory diagnostics of a running hub")
+    parser.add_argument("--top", type=int, default=10, help="Object types / growth sites listed")
+    parser.add_argument("--checkpoint", metavar="LABEL", help="Take a checkpoint before reporting")
+    parser.add_argument("--start", action="store_true", help="Start memory tracing in the hub")
+    parser.add_argument("--json", action="store_true", help="Print the raw report as JSON")
+    args = parser.parse_args(argv)
+
+    with IpcClient() as hub:
+        if args.start:
+            hub.call("diagnostics.start")
+        if args.checkpoint:
+            hub.call("diagnostics.checkpoint", label=args.checkpoint)
+        data = hub.call("diagnostics.report", top=args.top, timeout=120)
+    if args.json:
+        import json
+        print(json.dumps(data, indent=2))
+    else:
+        print(format_report(data))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
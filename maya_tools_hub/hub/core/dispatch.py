@@ -0,0 +1,122 @@
+"""Main-thread dispatchers - how results get back to the main thread.
+
+JobCenter and other core components hand callables to a dispatcher instead
+of talking to Qt directly, so the core runs the same way under a Qt event
+loop, an asyncio loop, or no loop at all:
+
+    QtDispatcher       queued signal, runs on the Qt main thread
+    AsyncioDispatcher  loop.call_soon_threadsafe, runs on the loop's thread
+    SyncDispatcher     runs immediately on the calling thread
+
+default_dispatcher() picks Qt when a binding is available (see qt_import)
+and synchronous dispatch otherwise.
+"""
+from hub.core.logging import get_logger
+from hub.core.qt_import import resolve_binding
+
+logger = get_logger(__name__)
+
+
+def _run(fn):
+    try:
+        fn()
+    except Exception as e:
+        logger.error(f"Error in dispatched call: {e}", exc_info=True)
+
+
+class Dispatcher:
+    """Base dispatcher. call_soon() may be called from any thread."""
+
+    name = "base"
+    # Whether call_soon() defers to another thread (JobCenter runs jobs on
+    # worker threads only when results can be delivered back)
+    deferred = True
+
+    def call_soon(self, fn):
+        """Run fn (no arguments) on the dispatcher's thread."""
+        raise NotImplementedError
+
+
+class SyncDispatcher(Dispatcher):
+    """Runs callables immediately on the calling thread (no event loop)."""
+
+    name = "sync"
+    deferred = False
+
+    def call_soon(self, fn):
+        _run(fn)
+
+
+class AsyncioDispatcher(Dispatcher):
+    """Delivers callables to an asyncio event loop."""
+
+    name = "asyncio"
+
+    def __init__(self, loop=None):
+        """Initialize dispatcher.
+
+        Args:
+            loop: Target event loop (default: the running loop)
+        """
+        if loop is None:
+            import asyncio
+            loop = asyncio.get_running_loop()
+        self.loop = loop
+
+    def call_soon(self, fn):
+        self.loop.call_soon_threadsafe(_run, fn)
+
+
+_receiver_class = None
+
+
+def _make_receiver(QtCore):
+    """QObject with a signal whose slot runs the emitted callable."""
+    global _receiver_class
+    if _receiver_class is None:
+        class _Receiver(QtCore.QObject):
+            called = QtCore.Signal(object)
+
+            def __init__(self, parent=None):
+                super().__init__(parent)
+                # Always queued: with AutoConnection an emit on the main
+                # thread would run the callable synchronously, inside the
+                # caller
+                self.called.connect(_run, QtCore.Qt.QueuedConnection)
+
+        _receiver_class = _Receiver
+    return _receiver_class()
+
+
+class QtDispatcher(Dispatcher):
+    """Delivers callables to the Qt main thread through a queued signal.
+
+    Create it on the main thread; call_soon() from any thread, the main
+    thread included, queues the call on the main thread's event loop.
+    """
+
+    name = "qt"
+
+    def __init__(self, binding=None):
+        """Initialize dispatcher.
+
+        Args:
+            binding: QtBinding (default: qt_import.resolve_binding())
+
+        Raises:
+            RuntimeError: No Qt binding available
+        """
+        binding = binding or resolve_binding()
+        if binding is None:
+            raise RuntimeError("QtDispatcher requires a Qt binding")
+        self._receiver = _make_receiver(binding.QtCore)
+
+    def call_soon(self, fn):
+        self._receiver.called.emit(fn)
+
+
+def default_dispatcher():
+    """Get a QtDispatcher when Qt is available, else a SyncDispatcher."""
+    if resolve_binding() is not None:
+        return QtDispatcher()
+    return SyncDispatcher()
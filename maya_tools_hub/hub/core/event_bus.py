@@ -26,6 +26,36 @@ class EventBus:
         self._subscribers[topic].append(callback)
         logger.debug(f"Subscribed to topic: {topic}")
     
+    def unsubscribe(self, topic, callback):
+        """Unsubscribe a callback from a topic.
+        
+        Long-lived buses keep every subscriber (and whatever it references)
+        alive, so widgets and servers must unsubscribe when they go away.
+        
+        Args:
+            topic: Event topic
+            callback: Callable previously passed to subscribe()
+            
+        Returns:
+            bool: True if the callback was subscribed
+        """
+        callbacks = self._subscribers.get(topic)
+        if not callbacks or callback not in callbacks:
+            return False
+        callbacks.remove(callback)
+        if not callbacks:
+            del self._subscribers[topic]
+        logger.debug(f"Unsubscribed from topic: {topic}")
+        return True
+    
+    def subscriptions(self):
+        """Get a copy of the current subscribers.
+        
+        Returns:
+            dict: topic -> list of callbacks
+        """
+        return {topic: list(callbacks) for topic, callbacks in self._subscribers.items()}
+    
     def publish(self, topic, payload):
         """Publish an event to a topic.
         
@@ -37,7 +67,7 @@ class EventBus:
         if topic in self._subscribers:
             subscriber_count = len(self._subscribers[topic])
             logger.debug(f"Event '{topic}' has {subscriber_count} subscriber(s)")
-            for callback in self._subscribers[topic]:
+            for callback in list(self._subscribers[topic]):
                 try:
                     callback(payload)
                 except Exception as e:
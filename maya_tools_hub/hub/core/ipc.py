@@ -0,0 +1,648 @@
+"""Local IPC - drive a running hub from external processes.
+
+IpcServer exposes CommandBus.dispatch / dispatch_many and EventBus topics
+on a Unix domain socket (localhost TCP where AF_UNIX is unavailable, e.g.
+Windows). Each hub writes a discovery file with its address and an access
+token to ~/.studio_name/maya_tools_hub/ipc/, readable only by the user;
+IpcClient finds the newest live hub through it.
+
+Frames are a 4-byte big-endian length followed by a UTF-8 JSON object:
+
+    hello:     {"op": "hello", "token": "..."}                (first frame)
+    request:   {"id": 1, "op": "dispatch", "name": "echo", "kwargs": {...}}
+               {"id": 2, "op": "batch", "commands": [["echo", {...}], ...]}
+               {"id": 3, "op": "subscribe", "topic": "tool/done"}
+               {"id": 4, "op": "unsubscribe", "topic": "tool/done"}
+               {"id": 5, "op": "ping"}
+    response:  {"id": 1, "ok": true, "result": ...}
+               {"id": 1, "ok": false, "error": "...", "type": "KeyError"}
+    event:     {"event": "tool/done", "payload": {...}}          (no id)
+
+Requests are multiplexed: a client may send many before reading, and
+responses carry the request id (background commands may complete out of
+order). Commands run one at a time on the main thread (or a dispatcher
+thread when no main-thread scheduler is given); queued requests are drained
+in batches per main-thread wake-up. Backpressure: at most ``max_in_flight``
+unanswered requests per connection and ``max_pending`` queued overall; a
+client beyond either limit stops being read until responses go out.
+
+app.run() starts a server only when the ``ipc.enabled`` setting is true
+(off by default).
+"""
+import json
+import os
+import queue
+import secrets
+import socket
+import struct
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from pathlib import Path
+
+from hub.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+_HEADER = struct.Struct(">I")
+MAX_FRAME = 64 * 1024 * 1024
+HAS_UNIX = hasattr(socket, "AF_UNIX")
+
+
+class IpcError(Exception):
+    """Connection, protocol or authentication failure."""
+
+
+class RemoteError(Exception):
+    """A command failed inside the hub.
+
+    Attributes:
+        type_name: Exception class name raised in the hub
+    """
+
+    def __init__(self, type_name, message):
+        super().__init__(f"{type_name}: {message}")
+        self.type_name = type_name
+
+
+def default_ipc_dir():
+    """Get the directory holding hub sockets and discovery files."""
+    return Path.home() / ".studio_name" / "maya_tools_hub" / "ipc"
+
+
+def encode_frame(message):
+    """Encode one message as a frame (non-JSON values are sent as str)."""
+    data = json.dumps(message, separators=(",", ":"), default=str).encode("utf-8")
+    return _HEADER.pack(len(data)) + data
+
+
+def read_frame(stream):
+    """Read one frame from a binary stream.
+
+    Raises:
+        IpcError: Stream closed or frame malformed
+    """
+    header = stream.read(_HEADER.size)
+    if len(header) < _HEADER.size:
+        raise IpcError("Connection closed")
+    (size,) = _HEADER.unpack(header)
+    if size > MAX_FRAME:
+        raise IpcError(f"Frame too large: {size} bytes")
+    data = stream.read(size)
+    if len(data) < size:
+        raise IpcError("Connection closed")
+    try:
+        return json.loads(data)
+    except ValueError as e:
+        raise IpcError(f"Malformed frame: {e}")
+
+
+def _error_response(request_id, error):
+    return {"id": request_id, "ok": False, "error": str(error), "type": type(error).__name__}
+
+
+class _Connection:
+    """One client connection: a reader thread and a coalescing writer thread."""
+
+    def __init__(self, server, sock, number):
+        self.server = server
+        self.sock = sock
+        self.number = number
+        self.topics = set()
+        self.closed = False
+        self.dropped_events = 0
+        self._in_flight = threading.BoundedSemaphore(server.max_in_flight)
+        self._outgoing = deque()  # (frame bytes, is_response)
+        self._cond = threading.Condition()
+        self._reader = threading.Thread(target=self._read_loop, name=f"ipc-read-{number}", daemon=True)
+        self._writer = threading.Thread(target=self._write_loop, name=f"ipc-write-{number}", daemon=True)
+
+    def start(self):
+        self._reader.start()
+        self._writer.start()
+
+    # ---- outgoing ----
+
+    def send(self, message, response=True):
+        """Queue a frame; events beyond max_outgoing are dropped."""
+        with self._cond:
+            if self.closed:
+                return
+            if not response and len(self._outgoing) >= self.server.max_outgoing:
+                self.dropped_events += 1
+                return
+            self._outgoing.append((encode_frame(message), response))
+            self._cond.notify()
+
+    def _write_loop(self):
+        while True:
+            with self._cond:
+                while not self._outgoing and not self.closed:
+                    self._cond.wait()
+                if not self._outgoing:
+                    return
+                items, self._outgoing = self._outgoing, deque()
+            try:
+                # One syscall for everything queued since the last write
+                self.sock.sendall(b"".join(frame for frame, _ in items))
+            except OSError:
+                self.close()
+                return
+            finally:
+                for _, response in items:
+                    if response:
+                        self._in_flight.release()
+
+    # ---- incoming ----
+
+    def _read_loop(self):
+        stream = self.sock.makefile("rb", buffering=65536)
+        try:
+            hello = read_frame(stream)
+            if hello.get("op") != "hello" or not secrets.compare_digest(
+                    str(hello.get("token", "")), self.server.token):
+                logger.warning(f"IPC connection {self.number} rejected: bad token")
+                self.sock.sendall(encode_frame({"id": 0, "ok": False, "error": "Authentication failed",
+                                                "type": "IpcError"}))
+                return
+            self._in_flight.acquire()
+            self.send({"id": 0, "ok": True, "result": self.server.info()})
+            while True:
+                request = read_frame(stream)
+                # Blocks while max_in_flight responses are outstanding
+                self._in_flight.acquire()
+                if request.get("op") == "ping":
+                    self.send({"id": request.get("id"), "ok": True, "result": "pong"})
+                else:
+                    # Blocks while max_pending requests are queued
+                    self.server.enqueue(self, request)
+        except (IpcError, OSError, ValueError):
+            pass
+        finally:
+            stream.close()
+            self.close()
+
+    def close(self):
+        with self._cond:
+            if self.closed:
+                return
+            self.closed = True
+            self._cond.notify()
+        try:
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self.sock.close()
+        self.server._forget(self)
+
+
+class IpcServer:
+    """Local command/event server for external processes. Thread-safe."""
+
+    def __init__(self, cmd_bus, evt_bus=None, schedule=None, directory=None, use_tcp=None,
+                 max_in_flight=256, max_pending=4096, max_outgoing=10000, time_slice=0.02,
+                 reschedule=None):
+        """Initialize server (call start() to listen).
+
+        Args:
+            cmd_bus: CommandBus whose commands are exposed
+            evt_bus: Optional EventBus whose topics clients may subscribe to
+            schedule: Callable(fn) running fn on the main thread (e.g.
+                JobCenter.call_in_main_thread); None runs commands on a
+                dispatcher thread
+            directory: Socket/discovery directory (default: default_ipc_dir())
+            use_tcp: Force localhost TCP (default: only without AF_UNIX)
+            max_in_flight: Unanswered requests allowed per connection
+            max_pending: Requests queued for the main thread overall
+            max_outgoing: Queued frames per connection beyond which events
+                are dropped for that connection
+            time_slice: Seconds the main thread spends per drain before
+                yielding back to the event loop
+            reschedule: Callable(fn) queueing fn on the main thread's event
+                loop, used by a drain that ran out of time (e.g.
+                QTimer.singleShot(0, fn)). It is called on the main thread,
+                where schedule may run fn synchronously and recurse into
+                the drain instead of yielding (default: schedule)
+        """
+        self.cmd_bus = cmd_bus
+        self.evt_bus = evt_bus
+        self.directory = Path(directory or default_ipc_dir())
+        self.use_tcp = (not HAS_UNIX) if use_tcp is None else use_tcp
+        self.max_in_flight = max_in_flight
+        self.max_outgoing = max_outgoing
+        self.time_slice = time_slice
+        self.token = secrets.token_hex(16)
+        self.address = None
+        self._schedule = schedule
+        self._reschedule = reschedule or schedule
+        self._queue = queue.Queue(max_pending)
+        self._lock = threading.Lock()
+        self._scheduled = False
+        self._connections = set()
+        self._topics = {}  # topic -> set of connections
+        self._hooked = {}  # topic -> callback subscribed on the EventBus
+        self._sock = None
+        self._threads = []
+        self._closed = False
+        self._count = 0
+        self.stats = {"connections": 0, "requests": 0, "drains": 0}
+
+    @property
+    def discovery_path(self):
+        return self.directory / f"hub-{os.getpid()}.json"
+
+    def info(self):
+        """Server description sent to clients after hello."""
+        return {"pid": os.getpid(), "address": self.address}
+
+    def start(self):
+        """Bind, write the discovery file and start accepting connections."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        if self.use_tcp:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.bind(("127.0.0.1", 0))
+            self.address = list(sock.getsockname())
+        else:
+            path = str(self.directory / f"hub-{os.getpid()}.sock")
+            if os.path.exists(path):
+                os.remove(path)
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.bind(path)
+            os.chmod(path, 0o600)
+            self.address = path
+        sock.listen(64)
+        self._sock = sock
+        self._write_discovery()
+        targets = [(self._accept_loop, "ipc-accept")]
+        if self._schedule is None:
+            targets.append((self._dispatch_loop, "ipc-dispatch"))
+        for target, name in targets:
+            thread = threading.Thread(target=target, name=name, daemon=True)
+            self._threads.append(thread)
+            thread.start()
+        logger.info(f"IPC server listening on {self.address}")
+
+    def _write_discovery(self):
+        data = json.dumps({"pid": os.getpid(), "address": self.address, "token": self.token,
+                           "started": time.time()})
+        tmp_path = str(self.discovery_path) + ".tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(data)
+        os.replace(tmp_path, self.discovery_path)
+
+    def _accept_loop(self):
+        while not self._closed:
+            try:
+                sock, _ = self._sock.accept()
+            except OSError:
+                return
+            if sock.family == socket.AF_INET:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            with self._lock:
+                self._count += 1
+                connection = _Connection(self, sock, self._count)
+                self._connections.add(connection)
+                self.stats["connections"] += 1
+            logger.debug(f"IPC connection {connection.number} opened")
+            connection.start()
+
+    def _forget(self, connection):
+        with self._lock:
+            self._connections.discard(connection)
+            for subscribers in self._topics.values():
+                subscribers.discard(connection)
+        logger.debug(f"IPC connection {connection.number} closed")
+
+    # ---- request handling ----
+
+    def enqueue(self, connection, request):
+        """Queue a request for the main thread (blocks when full)."""
+        self._queue.put((connection, request))
+        if self._schedule is None:
+            return
+        with self._lock:
+            if self._scheduled:
+                return
+            self._scheduled = True
+        self._schedule(self._drain)
+
+    def _drain(self):
+        """Handle queued requests on the main thread, yielding after time_slice."""
+        with self._lock:
+            self._scheduled = False
+        self.stats["drains"] += 1
+        deadline = time.perf_counter() + self.time_slice
+        while True:
+            try:
+                connection, request = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            self._handle(connection, request)
+            if time.perf_counter() >= deadline:
+                if not self._queue.empty():
+                    with self._lock:
+                        if self._scheduled:
+                            return
+                        self._scheduled = True
+                    self._reschedule(self._drain)
+                return
+
+    def _dispatch_loop(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            self._handle(*item)
+
+    def _handle(self, connection, request):
+        self.stats["requests"] += 1
+        request_id = request.get("id")
+        op = request.get("op")
+        try:
+            if op == "dispatch":
+                name = request["name"]
+                kwargs = request.get("kwargs") or {}
+                if self.cmd_bus.is_background(name):
+                    future = self.cmd_bus.dispatch_async(name, **kwargs)
+                    future.add_done_callback(lambda f: self._reply(connection, request_id, f))
+                    return
+                result = self.cmd_bus.dispatch(name, **kwargs)
+            elif op == "batch":
+                commands = [(name, kwargs or {}) for name, kwargs in request.get("commands") or ()]
+                results = self.cmd_bus.dispatch_many(commands, stop_on_error=False)
+                result = [
+                    _error_response(None, r) if isinstance(r, Exception) else {"ok": True, "result": r}
+                    for r in results
+                ]
+            elif op == "subscribe":
+                self._subscribe(connection, request["topic"])
+                result = True
+            elif op == "unsubscribe":
+                with self._lock:
+                    self._topics.get(request["topic"], set()).discard(connection)
+                    connection.topics.discard(request["topic"])
+                result = True
+            else:
+                raise ValueError(f"Unknown op: {op}")
+        except Exception as e:
+            connection.send(_error_response(request_id, e))
+            return
+        connection.send({"id": request_id, "ok": True, "result": result})
+
+    @staticmethod
+    def _reply(connection, request_id, future):
+        error = future.exception()
+        if error is not None:
+            connection.send(_error_response(request_id, error))
+        else:
+            connection.send({"id": request_id, "ok": True, "result": future.result()})
+
+    def _subscribe(self, connection, topic):
+        """Forward an EventBus topic to a connection (main thread)."""
+        if self.evt_bus is None:
+            raise IpcError("No event bus")
+        with self._lock:
+            self._topics.setdefault(topic, set()).add(connection)
+            connection.topics.add(topic)
+            hook = None
+            if topic not in self._hooked:
+                # One bus subscriber per topic fans out to all connections
+                hook = self._hooked[topic] = lambda payload, t=topic: self._broadcast(t, payload)
+        if hook is not None:
+            self.evt_bus.subscribe(topic, hook)
+
+    def _broadcast(self, topic, payload):
+        with self._lock:
+            subscribers = list(self._topics.get(topic, ()))
+        for connection in subscribers:
+            connection.send({"event": topic, "payload": payload}, response=False)
+
+    # ---- lifecycle ----
+
+    @property
+    def connection_count(self):
+        return len(self._connections)
+
+    def stop(self):
+        """Close all connections, stop listening and remove the discovery file."""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._sock.close()
+        except (OSError, AttributeError):
+            pass
+        with self._lock:
+            connections = list(self._connections)
+        for connection in connections:
+            connection.close()
+        # Release the bus hooks (they keep this server alive otherwise)
+        with self._lock:
+            hooks, self._hooked = self._hooked, {}
+        for topic, callback in hooks.items():
+            self.evt_bus.unsubscribe(topic, callback)
+        if self._schedule is None:
+            self._queue.put(None)
+        for path in (self.discovery_path, None if self.use_tcp else self.address):
+            if path and os.path.exists(path):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+        logger.info("IPC server stopped")
+
+
+def discover(directory=None):
+    """List running hubs, newest first.
+
+    Args:
+        directory: Discovery directory (default: default_ipc_dir())
+
+    Returns:
+        List of discovery dicts (pid, address, token, started)
+    """
+    directory = Path(directory or default_ipc_dir())
+    hubs = []
+    for path in directory.glob("hub-*.json"):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                hubs.append(json.load(f))
+        except (OSError, ValueError):
+            continue
+    hubs.sort(key=lambda hub: hub.get("started", 0), reverse=True)
+    return hubs
+
+
+class IpcClient:
+    """Client for a running hub's IpcServer. Thread-safe.
+
+    Example:
+        with IpcClient() as hub:
+            hub.call("echo", msg="hi")
+            futures = [hub.call_async("tool.execute", key="poly.smooth_normals") for _ in range(100)]
+            results = hub.batch([("echo", {"msg": i}) for i in range(1000)])
+    """
+
+    def __init__(self, address=None, token=None, directory=None, timeout=10.0):
+        """Connect and authenticate.
+
+        Args:
+            address: Socket path or [host, port] (default: newest discovered hub)
+            token: Access token (default: from the discovery file)
+            directory: Discovery directory (default: default_ipc_dir())
+            timeout: Connect timeout in seconds
+
+        Raises:
+            IpcError: No hub found, connection refused or bad token
+        """
+        candidates = [{"address": address, "token": token}] if address else discover(directory)
+        if not candidates:
+            raise IpcError("No running hub found")
+        error = None
+        for candidate in candidates:
+            try:
+                self._sock = self._connect(candidate["address"], timeout)
+                break
+            except OSError as e:
+                error = e
+        else:
+            raise IpcError(f"Cannot connect to hub: {error}")
+        self._send_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._pending = {}  # id -> Future
+        self._handlers = {}  # topic -> [callbacks]
+        self._next_id = 0
+        self._closed = False
+        self._stream = self._sock.makefile("rb", buffering=65536)
+        self._sock.sendall(encode_frame({"op": "hello", "token": candidate["token"] or token}))
+        hello = read_frame(self._stream)
+        if not hello.get("ok"):
+            self._sock.close()
+            raise IpcError(hello.get("error", "Handshake failed"))
+        self.server = hello.get("result")
+        self._reader = threading.Thread(target=self._read_loop, name="ipc-client", daemon=True)
+        self._reader.start()
+
+    @staticmethod
+    def _connect(address, timeout):
+        if isinstance(address, (list, tuple)):
+            sock = socket.create_connection(tuple(address), timeout)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        else:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(timeout)
+            sock.connect(address)
+        sock.settimeout(None)
+        return sock
+
+    def _request(self, message):
+        future = Future()
+        with self._lock:
+            if self._closed:
+                raise IpcError("Client is closed")
+            self._next_id += 1
+            message["id"] = self._next_id
+            self._pending[self._next_id] = future
+        frame = encode_frame(message)
+        try:
+            with self._send_lock:
+                self._sock.sendall(frame)
+        except OSError as e:
+            with self._lock:
+                self._pending.pop(message["id"], None)
+            raise IpcError(f"Send failed: {e}")
+        return future
+
+    def _read_loop(self):
+        try:
+            while True:
+                message = read_frame(self._stream)
+                if "event" in message:
+                    for callback in list(self._handlers.get(message["event"], ())):
+                        try:
+                            callback(message.get("payload"))
+                        except Exception as e:
+                            logger.error(f"Error in IPC event handler: {e}", exc_info=True)
+                    continue
+                with self._lock:
+                    future = self._pending.pop(message.get("id"), None)
+                if future is None:
+                    continue
+                if message.get("ok"):
+                    future.set_result(message.get("result"))
+                else:
+                    future.set_exception(RemoteError(message.get("type", "Exception"), message.get("error")))
+        except (IpcError, OSError, ValueError):
+            pass
+        finally:
+            with self._lock:
+                self._closed = True
+                pending, self._pending = self._pending, {}
+            for future in pending.values():
+                future.set_exception(IpcError("Connection closed"))
+
+    # ---- public API ----
+
+    def call_async(self, name, **kwargs):
+        """Dispatch a command without waiting.
+
+        Returns:
+            Future resolving to the command result (RemoteError on failure)
+        """
+        return self._request({"op": "dispatch", "name": name, "kwargs": kwargs})
+
+    def call(self, name, timeout=None, **kwargs):
+        """Dispatch a command and wait for its result.
+
+        Raises:
+            RemoteError: The command raised in the hub
+        """
+        return self.call_async(name, **kwargs).result(timeout)
+
+    def batch(self, commands, timeout=None):
+        """Dispatch many commands in one request (one undo chunk in the hub).
+
+        Args:
+            commands: Iterable of (name, kwargs_dict)
+
+        Returns:
+            List of results in order; failed commands are RemoteError instances
+        """
+        results = self._request({"op": "batch", "commands": [[n, k or {}] for n, k in commands]}).result(timeout)
+        return [
+            r.get("result") if r.get("ok") else RemoteError(r.get("type", "Exception"), r.get("error"))
+            for r in results
+        ]
+
+    def subscribe(self, topic, callback):
+        """Receive hub events for a topic (callback runs on the client's reader thread)."""
+        first = topic not in self._handlers
+        self._handlers.setdefault(topic, []).append(callback)
+        if first:
+            self._request({"op": "subscribe", "topic": topic}).result()
+
+    def unsubscribe(self, topic):
+        """Stop receiving a topic."""
+        if self._handlers.pop(topic, None) is not None:
+            self._request({"op": "unsubscribe", "topic": topic}).result()
+
+    def ping(self, timeout=None):
+        """Round-trip without touching the main thread."""
+        return self._request({"op": "ping"}).result(timeout)
+
+    def close(self):
+        """Close the connection; pending calls fail with IpcError."""
+        try:
+            self._sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._sock.close()
+        self._reader.join(timeout=5)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -1,112 +1,74 @@
 """JobCenter - background job execution with threading."""
+import threading
 import time
+from hub.core.dispatch import default_dispatcher
 from hub.core.logging import get_logger
 
 logger = get_logger(__name__)
 
-# Import Qt components
-try:
-    from Qt import QtCore
-    QObject = QtCore.QObject
-    QThread = QtCore.QThread
-    Signal = QtCore.Signal
-    QMetaObject = QtCore.QMetaObject
-    Qt = QtCore.Qt
-except ImportError:
-    try:
-        from PySide2 import QtCore
-        QObject = QtCore.QObject
-        QThread = QtCore.QThread
-        Signal = QtCore.Signal
-        QMetaObject = QtCore.QMetaObject
-        Qt = QtCore.Qt
-    except ImportError:
-        try:
-            from PySide6 import QtCore
-            QObject = QtCore.QObject
-            QThread = QtCore.QThread
-            Signal = QtCore.Signal
-            QMetaObject = QtCore.QMetaObject
-            Qt = QtCore.Qt
-        except ImportError:
-            # Fallback for non-Qt environments
-            logger.warning("Qt not available, JobCenter will use stub implementation")
-            QObject = object
-            QThread = object
-            Signal = lambda x: None
-            QMetaObject = None
-            Qt = None
+# Job ID of the job running on the current thread (see JobCenter.current_job_id)
+_current = threading.local()
 
 
-class _Worker(QObject):
-    """Worker object that runs in a separate thread.
-    
-    Executes a user-provided function and emits the result via signal.
-    
-    THREAD SAFETY:
-    - This object lives in a worker thread
-    - The function passed should NOT access Qt widgets or Maya scene
-    - Use signals to communicate back to main thread
-    """
-    
-    finished = Signal(object)  # Emits result when job completes
-    error = Signal(object)     # Emits exception if job fails
-    
-    def __init__(self, fn):
-        """Initialize worker with function to execute.
-        
-        Args:
-            fn: Callable to execute in thread (must be thread-safe)
-        """
-        super().__init__()
-        self._fn = fn
-    
-    def run(self):
-        """Execute the function and emit result or error.
-        
-        This runs in the worker thread, NOT the main thread.
-        """
-        logger.debug(f"Worker thread starting: {self._fn}")
-        try:
-            result = self._fn()
-            logger.debug(f"Worker thread completed successfully")
-            # Signal emission is thread-safe in Qt
-            self.finished.emit(result)
-        except Exception as e:
-            logger.error(f"Worker thread failed: {e}", exc_info=True)
-            self.error.emit(e)
-
-
-class JobCenter(QObject):
+class JobCenter:
     """Job center for executing background tasks in threads.
     
     Provides a thread-safe interface for running functions asynchronously
-    without blocking the main UI thread.
+    without blocking the main UI thread. Results reach the main thread
+    through a dispatcher (see hub.core.dispatch): a Qt event loop, an
+    asyncio loop, or - without either - synchronous delivery.
     
     THREAD SAFETY DESIGN:
     1. Worker runs in separate thread
-    2. Signals automatically use Qt's queued connections (thread-safe)
+    2. Completion is handed to the dispatcher (thread-safe)
     3. Callbacks execute in main thread
     4. No shared mutable state between threads
+    5. report_progress() may be called from any thread; job/progress events
+       are published on the main thread
     """
     
-    def __init__(self, event_bus=None, parent=None):
+    def __init__(self, event_bus=None, parent=None, dispatcher=None, threaded=None):
         """Initialize job center.
         
         Args:
             event_bus: Optional EventBus for publishing job events
-            parent: Optional QObject parent (for Qt object hierarchy)
+            parent: Unused; kept for callers that passed a QObject parent
+            dispatcher: Main-thread Dispatcher (default: Qt if available,
+                else synchronous)
+            threaded: Run jobs on worker threads. Default: only when the
+                dispatcher defers to a main thread; with synchronous
+                dispatch jobs run inline on the caller's thread. Headless
+                callers may pass True to get real concurrency (callbacks
+                then run on the worker threads).
         """
-        super().__init__(parent)
         self._event_bus = event_bus
-        self._thread = None
-        self._worker = None
+        self._dispatcher = dispatcher or default_dispatcher()
+        self._threaded = self._dispatcher.deferred if threaded is None else threaded
+        self._jobs = {}  # job_id -> thread for running jobs
+        self._lock = threading.Lock()
         self._job_count = 0  # Track number of jobs submitted
-        logger.info("JobCenter initialized")
+        self._profiler = None  # Optional ToolProfiler (see set_profiler)
+        logger.info(f"JobCenter initialized ({self._dispatcher.name} dispatch, "
+                    f"{'threaded' if self._threaded else 'inline'} jobs)")
     
-    def run_in_thread(self, fn, callback=None):
+    @property
+    def dispatcher(self):
+        """Dispatcher delivering results to the main thread."""
+        return self._dispatcher
+    
+    def set_profiler(self, profiler):
+        """Set the ToolProfiler deciding which jobs are profiled.
+        
+        Args:
+            profiler: hub.core.profiler.ToolProfiler, or None
+        """
+        self._profiler = profiler
+    
+    def run_in_thread(self, fn, callback=None, error_callback=None):
         """Execute a function in a background thread.
         
+        Several jobs may run concurrently, each in its own thread.
+        
         THREAD SAFETY GUIDELINES:
         - fn() should NOT access Qt widgets or Maya scene directly
         - fn() should only work with data passed as parameters
@@ -115,53 +77,83 @@ class JobCenter(QObject):
         Args:
             fn: Callable to execute (must be thread-safe, no Qt/Maya access)
             callback: Optional callback function(result) called in main thread
+            error_callback: Optional callback function(exception) called in
+                main thread if fn() raises
             
         Returns:
-            None (result is delivered via callback or event)
+            int: Job ID (result is delivered via callback or event)
         """
-        self._job_count += 1
-        job_id = self._job_count
+        with self._lock:
+            self._job_count += 1
+            job_id = self._job_count
         
         logger.info(f"Submitting job #{job_id} to background thread: {fn.__name__ if hasattr(fn, '__name__') else fn}")
         
-        # Clean up previous thread if exists
-        if self._thread is not None:
-            if self._thread.isRunning():
-                logger.warning("Previous job still running, waiting for completion...")
-                self._thread.quit()
-                self._thread.wait(5000)  # Wait up to 5 seconds
-            
-            # Clean up old thread
-            self._cleanup_sync()
+        if self._profiler is not None:
+            fn = self._profiler.wrap_job(fn, getattr(fn, "__name__", None) or f"job{job_id}")
         
-        # Create new thread and worker
-        self._thread = QThread(self)  # Set parent for auto cleanup
-        self._worker = _Worker(fn)
+        if not self._threaded:
+            # No main-thread loop: run synchronously (headless / fake backend)
+            self._run_inline(fn, callback, error_callback, job_id)
+            return job_id
         
-        # Move worker to thread (worker will live in the thread)
-        self._worker.moveToThread(self._thread)
-        
-        # Connect signals (these use Qt::QueuedConnection automatically for cross-thread)
-        # started signal -> worker.run (in worker thread)
-        self._thread.started.connect(self._worker.run)
-        
-        # Worker signals -> handlers (back to main thread via queued connection)
-        self._worker.finished.connect(lambda result: self._on_finished(result, callback, job_id))
-        self._worker.error.connect(lambda error: self._on_error(error, callback, job_id))
+        thread = threading.Thread(
+            target=self._run_worker, args=(fn, callback, error_callback, job_id),
+            name=f"job-{job_id}", daemon=True,
+        )
+        with self._lock:
+            self._jobs[job_id] = thread
+        logger.debug(f"Starting worker thread for job #{job_id}")
+        thread.start()
+        return job_id
+    
+    def _run_worker(self, fn, callback, error_callback, job_id):
+        """Run a job on its worker thread and dispatch the outcome.
         
-        # Thread cleanup signals
-        self._worker.finished.connect(self._thread.quit)
-        self._worker.error.connect(self._thread.quit)
-        self._thread.finished.connect(self._cleanup)
+        This runs in the worker thread, NOT the main thread.
+        """
+        logger.debug(f"Worker thread starting: {fn}")
+        _current.job_id = job_id
+        try:
+            try:
+                result = fn()
+            except Exception as e:
+                logger.error(f"Worker thread failed: {e}", exc_info=True)
+                outcome = lambda: self._on_error(e, error_callback, job_id)
+            else:
+                logger.debug(f"Worker thread completed successfully")
+                outcome = lambda: self._on_finished(result, callback, job_id)
+            self._dispatcher.call_soon(outcome)
+        finally:
+            # Still counted as running until the outcome is handed over
+            with self._lock:
+                self._jobs.pop(job_id, None)
+    
+    def _run_inline(self, fn, callback, error_callback, job_id):
+        """Run a job on the calling thread (no main-thread loop).
         
-        # Start thread
-        logger.debug(f"Starting worker thread for job #{job_id}")
-        self._thread.start()
+        Args:
+            fn: Callable to execute
+            callback: Optional user callback
+            error_callback: Optional user error callback
+            job_id: Job identifier
+        """
+        previous = getattr(_current, "job_id", None)
+        _current.job_id = job_id
+        try:
+            result = fn()
+        except Exception as e:
+            logger.error(f"Job #{job_id} failed: {e}", exc_info=True)
+            self._on_error(e, error_callback, job_id)
+            return
+        finally:
+            _current.job_id = previous
+        self._on_finished(result, callback, job_id)
     
     def _on_finished(self, result, callback, job_id):
         """Handle job completion.
         
-        This executes in the MAIN thread (via Qt's queued connection).
+        This executes in the MAIN thread (via the dispatcher).
         Safe to access Qt widgets and Maya scene here.
         
         Args:
@@ -188,18 +180,24 @@ class JobCenter(QObject):
             self._event_bus.publish("job/done", payload)
             logger.debug(f"Published job/done event for job #{job_id}")
     
-    def _on_error(self, error, callback, job_id):
+    def _on_error(self, error, error_callback, job_id):
         """Handle job error.
         
-        This executes in the MAIN thread (via Qt's queued connection).
+        This executes in the MAIN thread (via the dispatcher).
         
         Args:
             error: Exception from the job function
-            callback: Optional user callback (not called on error)
+            error_callback: Optional user error callback
             job_id: Job identifier
         """
         logger.error(f"Job #{job_id} failed with error: {error}")
         
+        if error_callback is not None:
+            try:
+                error_callback(error)
+            except Exception as e:
+                logger.error(f"Error in job error callback: {e}", exc_info=True)
+        
         # Publish error event if event bus available (main thread, safe)
         if self._event_bus is not None:
             payload = {
@@ -211,35 +209,53 @@ class JobCenter(QObject):
             self._event_bus.publish("job/failed", payload)
             logger.debug(f"Published job/failed event for job #{job_id}")
     
-    def _cleanup(self):
-        """Clean up thread resources asynchronously.
+    @staticmethod
+    def current_job_id():
+        """Get the ID of the job running on the calling thread.
+        
+        Call it at the start of a job function and pass the ID on to any
+        helper threads that report progress.
         
-        This is called when the thread finishes (in main thread).
-        Uses deleteLater() for safe Qt object destruction.
+        Returns:
+            int or None: Job ID, or None outside a JobCenter job
         """
-        logger.debug("Scheduling thread cleanup")
-        if self._thread is not None:
-            self._thread.deleteLater()
-            self._thread = None
-        if self._worker is not None:
-            self._worker.deleteLater()
-            self._worker = None
-    
-    def _cleanup_sync(self):
-        """Synchronous cleanup for thread switching."""
-        logger.debug("Performing synchronous thread cleanup")
-        if self._worker is not None:
-            try:
-                self._worker.deleteLater()
-            except:
-                pass
-            self._worker = None
-        if self._thread is not None:
-            try:
-                self._thread.deleteLater()
-            except:
-                pass
-            self._thread = None
+        return getattr(_current, "job_id", None)
+    
+    def report_progress(self, progress, message=None, job_id=None):
+        """Report job progress. Thread-safe; may be called from any thread.
+        
+        Published as a "job/progress" event on the main thread.
+        
+        Args:
+            progress: Fraction done (0.0-1.0), or None if unknown
+            message: Optional status text
+            job_id: Job identifier (default: the job on the calling thread)
+        """
+        payload = {
+            "job_id": job_id if job_id is not None else self.current_job_id(),
+            "progress": progress,
+            "message": message
+        }
+        self._dispatcher.call_soon(lambda: self._on_progress(payload))
+    
+    def _on_progress(self, payload):
+        """Publish a progress report (main thread).
+        
+        Args:
+            payload: Progress payload from report_progress()
+        """
+        if self._event_bus is not None:
+            self._event_bus.publish("job/progress", payload)
+    
+    def call_in_main_thread(self, fn):
+        """Run fn on the main thread. Thread-safe; may be called from any thread.
+        
+        With synchronous dispatch, fn runs immediately on the calling thread.
+        
+        Args:
+            fn: Callable taking no arguments
+        """
+        self._dispatcher.call_soon(fn)
     
     def is_running(self):
         """Check if a job is currently running.
@@ -247,5 +263,33 @@ class JobCenter(QObject):
         Returns:
             bool: True if a job is running
         """
-        return self._thread is not None and self._thread.isRunning()
-
+        return bool(self._jobs)
+    
+    def active_count(self):
+        """Get the number of jobs currently running.
+        
+        Returns:
+            int: Number of running jobs
+        """
+        return len(self._jobs)
+    
+    def wait(self, timeout=None):
+        """Block until all running jobs have finished (headless use).
+        
+        Args:
+            timeout: Maximum seconds to wait, or None
+            
+        Returns:
+            bool: True if no job is running any more
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                threads = list(self._jobs.values())
+            if not threads:
+                return True
+            for thread in threads:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                thread.join(remaining)
@@ -0,0 +1,175 @@
+"""Memo - opt-in result memoization for idempotent tools.
+
+Plugins opt in from manifest.json:
+
+    "memoize": {
+        "max_entries": 32,
+        "invalidate_on": ["settings/changed"]
+    }
+
+(or simply ``"memoize": true`` for defaults). Results are cached by tool key,
+normalized kwargs and the DCC scene/selection fingerprint.
+"""
+import json
+from collections import OrderedDict
+
+from hub.core.logging import get_logger
+from hub.core.middleware import Middleware
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_ENTRIES = 32
+# Scene changes are covered by the DCC fingerprint; topics are opt-in
+DEFAULT_INVALIDATE_ON = ()
+
+
+class ResultCache:
+    """Size-bounded LRU cache."""
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES):
+        """Initialize cache.
+
+        Args:
+            max_entries: Maximum number of cached results
+        """
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+
+    def get(self, key, default=None):
+        """Get a cached value and mark it most recently used."""
+        try:
+            self._entries.move_to_end(key)
+        except KeyError:
+            return default
+        return self._entries[key]
+
+    def put(self, key, value):
+        """Store a value, evicting the least recently used entry if full."""
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop all entries."""
+        self._entries.clear()
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+
+def normalize_kwargs(kwargs):
+    """Build a canonical, hashable key from command kwargs.
+
+    Args:
+        kwargs: Keyword arguments dict
+
+    Returns:
+        Canonical JSON string (sorted keys, non-JSON values via repr)
+    """
+    return json.dumps(kwargs, sort_keys=True, default=repr, separators=(",", ":"))
+
+
+class MemoizeMiddleware(Middleware):
+    """Serve repeat tool.execute calls from a per-tool result cache.
+
+    Only tools whose manifest declares "memoize" are cached, and only when the
+    DCC backend can provide a scene fingerprint. Caches are dropped when a
+    configured invalidation event is published, or when any non-memoized tool
+    runs (it may have changed the scene).
+    """
+
+    def __init__(self, registry, dcc, evt_bus=None, command="tool.execute"):
+        """Initialize memoization middleware.
+
+        Args:
+            registry: ToolRegistry (for manifest lookup)
+            dcc: DCCFacade providing scene_fingerprint()
+            evt_bus: Optional EventBus for invalidation events
+            command: Command name to memoize
+        """
+        super().__init__([command])
+        self._registry = registry
+        self._dcc = dcc
+        self._evt_bus = evt_bus
+        self._caches = {}  # tool key -> ResultCache
+        self._topics = set()
+        self.hits = 0
+        self.misses = 0
+        if evt_bus is not None:
+            evt_bus.subscribe("tool/done", self._on_tool_event)
+            evt_bus.subscribe("tool/failed", self._on_tool_event)
+
+    def _config(self, key):
+        """Get normalized memoize config for a tool, or None if not opted in."""
+        manifest = self._registry.get_manifest(key) if key else None
+        config = manifest.get("memoize") if manifest else None
+        if not config:
+            return None
+        return config if isinstance(config, dict) else {}
+
+    def _cache_for(self, key, config):
+        cache = self._caches.get(key)
+        if cache is None:
+            cache = self._caches[key] = ResultCache(config.get("max_entries", DEFAULT_MAX_ENTRIES))
+            for topic in config.get("invalidate_on", DEFAULT_INVALIDATE_ON):
+                self._watch(topic)
+        return cache
+
+    def _watch(self, topic):
+        """Subscribe to an invalidation topic once."""
+        if self._evt_bus is None or topic in self._topics:
+            return
+        self._topics.add(topic)
+        self._evt_bus.subscribe(topic, lambda payload, t=topic: self.invalidate_topic(t))
+
+    def __call__(self, name, kwargs, call_next):
+        key = kwargs.get("key")
+        config = self._config(key)
+        if config is None:
+            return call_next(kwargs)
+        fingerprint = self._dcc.scene_fingerprint()
+        if fingerprint is None:
+            return call_next(kwargs)
+
+        cache = self._cache_for(key, config)
+        cache_key = (normalize_kwargs(kwargs), fingerprint)
+        if cache_key in cache:
+            self.hits += 1
+            logger.debug(f"Memoized result for '{key}' (cache hit)")
+            return cache.get(cache_key)
+
+        self.misses += 1
+        result = call_next(kwargs)
+        # Key on the fingerprint after the run, in case the tool itself
+        # touched the selection or scene
+        cache.put((cache_key[0], self._dcc.scene_fingerprint()), result)
+        return result
+
+    def _on_tool_event(self, payload):
+        """Drop all caches when a non-memoized tool ran."""
+        if self._caches and self._config(payload.get("key")) is None:
+            self.invalidate()
+
+    def invalidate_topic(self, topic):
+        """Drop caches of tools that declared an invalidation topic."""
+        for key, cache in self._caches.items():
+            config = self._config(key) or {}
+            if topic in config.get("invalidate_on", DEFAULT_INVALIDATE_ON):
+                cache.clear()
+        logger.debug(f"Memo caches invalidated by '{topic}'")
+
+    def invalidate(self, key=None):
+        """Drop cached results.
+
+        Args:
+            key: Optional tool key (default: all tools)
+        """
+        if key is None:
+            for cache in self._caches.values():
+                cache.clear()
+        elif key in self._caches:
+            self._caches[key].clear()
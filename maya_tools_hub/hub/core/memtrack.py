@@ -0,0 +1,155 @@
+"""Memory tracker - tracemalloc checkpoints that survive reload_hub().
+
+reload_hub() keeps this module loaded (see hub_launcher._RELOAD_KEEP), so
+the process-wide tracker and its checkpoints outlive every module
+generation and can be compared across reloads. It therefore imports
+nothing from the hub: a kept module that did would pin the old generation
+of whatever it imported. The rest of the memory diagnostics live in
+hub.core.diagnostics, which reloads normally.
+"""
+import gc
+import logging
+import threading
+import time
+import tracemalloc
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FRAMES = 10
+DEFAULT_KEEP = 20
+
+_tracker = None
+
+
+class Checkpoint:
+    """A labelled tracemalloc snapshot."""
+
+    def __init__(self, label, snapshot, traced):
+        self.label = label
+        self.time = time.time()
+        self.snapshot = snapshot
+        self.traced = traced  # bytes traced when taken
+
+    def __repr__(self):
+        return f"Checkpoint({self.label!r}, {self.traced} bytes)"
+
+
+class MemoryTracker:
+    """tracemalloc snapshots at labelled checkpoints.
+
+    Tracing costs memory and speed, so it only runs between start() and
+    stop() (the "diagnostics.memory" setting starts it with the hub).
+    """
+
+    def __init__(self, keep=DEFAULT_KEEP):
+        """Initialize tracker.
+
+        Args:
+            keep: Checkpoints kept (oldest dropped first)
+        """
+        self.keep = keep
+        self.checkpoints = []
+        self.tool_growth = {}  # command key -> [runs, net bytes]
+        self._lock = threading.Lock()
+
+    @property
+    def tracing(self):
+        return tracemalloc.is_tracing()
+
+    def start(self, frames=DEFAULT_FRAMES):
+        """Start tracing allocations and take a "start" checkpoint.
+
+        Args:
+            frames: Stack frames stored per allocation
+        """
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+            logger.info(f"Memory tracing started ({frames} frames)")
+        self.checkpoint("start")
+
+    def stop(self):
+        """Stop tracing and drop the checkpoints."""
+        with self._lock:
+            self.checkpoints = []
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+            logger.info("Memory tracing stopped")
+
+    def checkpoint(self, label):
+        """Take a snapshot (no-op unless tracing).
+
+        Args:
+            label: Checkpoint label (e.g. "before reload")
+
+        Returns:
+            Checkpoint, or None when not tracing
+        """
+        if not tracemalloc.is_tracing():
+            return None
+        gc.collect()
+        checkpoint = Checkpoint(label, tracemalloc.take_snapshot(), tracemalloc.get_traced_memory()[0])
+        with self._lock:
+            self.checkpoints.append(checkpoint)
+            del self.checkpoints[:-self.keep]
+        logger.debug(f"Memory checkpoint '{label}': {checkpoint.traced / 1024:.0f} KB traced")
+        return checkpoint
+
+    def find(self, label):
+        """Get the newest checkpoint with a label (or None)."""
+        with self._lock:
+            for checkpoint in reversed(self.checkpoints):
+                if checkpoint.label == label:
+                    return checkpoint
+        return None
+
+    def compare(self, older=None, newer=None, top=10, group_by="lineno"):
+        """Top allocation growth sites between two checkpoints.
+
+        Args:
+            older: Checkpoint or label (default: second newest)
+            newer: Checkpoint or label (default: newest)
+            top: Number of sites
+            group_by: "lineno", "filename" or "traceback"
+
+        Returns:
+            List of dicts (site, size_diff, count_diff, size), largest growth
+            first; empty without two checkpoints
+        """
+        with self._lock:
+            checkpoints = list(self.checkpoints)
+        if isinstance(older, str):
+            older = self.find(older)
+        if isinstance(newer, str):
+            newer = self.find(newer)
+        if newer is None and checkpoints:
+            newer = checkpoints[-1]
+        if older is None and len(checkpoints) >= 2:
+            older = checkpoints[-2] if newer is checkpoints[-1] else checkpoints[-1]
+        if older is None or newer is None or older is newer:
+            return []
+        stats = newer.snapshot.compare_to(older.snapshot, group_by)
+        return [
+            {"site": _format_site(stat.traceback), "size_diff": stat.size_diff,
+             "count_diff": stat.count_diff, "size": stat.size}
+            for stat in stats[:top] if stat.size_diff > 0
+        ]
+
+    def record_run(self, key, size_diff):
+        """Accumulate the traced-memory change of one tool run."""
+        with self._lock:
+            entry = self.tool_growth.setdefault(key, [0, 0])
+            entry[0] += 1
+            entry[1] += size_diff
+
+
+def get_tracker():
+    """Get the process-wide MemoryTracker."""
+    global _tracker
+    if _tracker is None:
+        _tracker = MemoryTracker()
+    return _tracker
+
+
+def _format_site(traceback):
+    frame = traceback[0]
+    return f"{frame.filename}:{frame.lineno}"
@@ -0,0 +1,205 @@
+"""CommandBus middleware - timing, validation, undo, error mapping and events."""
+import time
+from contextlib import contextmanager, nullcontext
+
+from hub.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class Middleware:
+    """Base class for CommandBus middleware.
+
+    Subclasses override __call__ and optionally batch(). A middleware wraps
+    every dispatched command it applies to; call_next(kwargs) runs the rest of
+    the pipeline and returns the handler result.
+    """
+
+    def __init__(self, commands=None):
+        """Initialize middleware.
+
+        Args:
+            commands: Optional iterable of command names to apply to
+                (default: all commands)
+        """
+        self.commands = set(commands) if commands is not None else None
+
+    def applies_to(self, name):
+        """Check whether this middleware wraps a command.
+
+        Args:
+            name: Command name
+
+        Returns:
+            bool
+        """
+        return self.commands is None or name in self.commands
+
+    def __call__(self, name, kwargs, call_next):
+        """Run the middleware around a command.
+
+        Args:
+            name: Command name
+            kwargs: Command keyword arguments (dict)
+            call_next: Callable(kwargs) running the rest of the pipeline
+
+        Returns:
+            Command result
+        """
+        return call_next(kwargs)
+
+    def batch(self, commands):
+        """Shared setup scope entered once per CommandBus.dispatch_many() call.
+
+        Args:
+            commands: List of (name, kwargs) tuples in the batch
+
+        Returns:
+            Context manager
+        """
+        return nullcontext()
+
+
+class TimingMiddleware(Middleware):
+    """Record per-command call counts and durations."""
+
+    def __init__(self, commands=None):
+        super().__init__(commands)
+        self.stats = {}  # name -> [count, total_seconds, max_seconds]
+
+    def __call__(self, name, kwargs, call_next):
+        start = time.perf_counter()
+        try:
+            return call_next(kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            entry = self.stats.get(name)
+            if entry is None:
+                entry = self.stats[name] = [0, 0.0, 0.0]
+            entry[0] += 1
+            entry[1] += elapsed
+            if elapsed > entry[2]:
+                entry[2] = elapsed
+            logger.debug(f"Command '{name}' took {elapsed * 1000:.2f} ms")
+
+
+class ValidationMiddleware(Middleware):
+    """Validate command kwargs before the handler runs."""
+
+    def __init__(self, validators=None):
+        """Initialize validation middleware.
+
+        Args:
+            validators: Optional dict of command name -> callable(kwargs)
+                raising ValueError for invalid arguments
+        """
+        self._validators = dict(validators or {})
+        super().__init__(self._validators)
+
+    def add(self, name, validator):
+        """Register a validator for a command.
+
+        Note: call before the middleware is added to a CommandBus, since
+        command pipelines are compiled on first dispatch.
+        """
+        self._validators[name] = validator
+        self.commands.add(name)
+
+    def __call__(self, name, kwargs, call_next):
+        self._validators[name](kwargs)
+        return call_next(kwargs)
+
+
+class UndoMiddleware(Middleware):
+    """Wrap commands in a DCC undo transaction.
+
+    Nested transactions collapse into the outermost one, so dispatch_many()
+    produces a single undo step for the whole batch.
+    """
+
+    def __init__(self, dcc, commands=None, label=None):
+        """Initialize undo middleware.
+
+        Args:
+            dcc: DCCFacade instance
+            commands: Optional command names to wrap (default: all)
+            label: Optional callable(name, kwargs) -> undo label
+        """
+        super().__init__(commands)
+        self._dcc = dcc
+        self._label = label or (lambda name, kwargs: name)
+
+    def __call__(self, name, kwargs, call_next):
+        with self._dcc.transaction(self._label(name, kwargs)):
+            return call_next(kwargs)
+
+    @contextmanager
+    def batch(self, commands):
+        if not any(self.applies_to(name) for name, _ in commands):
+            yield
+            return
+        with self._dcc.transaction(f"Batch ({len(commands)} commands)"):
+            yield
+
+
+class ErrorMessageMiddleware(Middleware):
+    """Log command errors and show a user-friendly message through the DCC."""
+
+    def __init__(self, dcc, commands=None, describe=None):
+        """Initialize error mapping middleware.
+
+        Args:
+            dcc: DCCFacade instance
+            commands: Optional command names to wrap (default: all)
+            describe: Optional callable(name, kwargs) -> user-facing label
+        """
+        super().__init__(commands)
+        self._dcc = dcc
+        self._describe = describe or (lambda name, kwargs: name)
+
+    def __call__(self, name, kwargs, call_next):
+        try:
+            return call_next(kwargs)
+        except Exception as e:
+            label = self._describe(name, kwargs)
+            # Log error with full stack trace
+            logger.error(f"Error executing '{label}': {e}", exc_info=True)
+            self._dcc.show_message(f"Error in {label}: {str(e)}", level="error")
+            # Re-raise the exception to maintain error propagation
+            raise
+
+
+class EventMiddleware(Middleware):
+    """Publish done/failed events on the EventBus after a command runs."""
+
+    def __init__(self, evt_bus, done_topic, failed_topic, commands=None, payload=None):
+        """Initialize event publishing middleware.
+
+        Args:
+            evt_bus: EventBus instance
+            done_topic: Topic published on success (result added to payload)
+            failed_topic: Topic published on failure (error info added to payload)
+            commands: Optional command names to wrap (default: all)
+            payload: Optional callable(name, kwargs) -> base payload dict
+        """
+        super().__init__(commands)
+        self._evt_bus = evt_bus
+        self._done_topic = done_topic
+        self._failed_topic = failed_topic
+        self._payload = payload or (lambda name, kwargs: {"command": name, "kwargs": kwargs})
+
+    def __call__(self, name, kwargs, call_next):
+        try:
+            result = call_next(kwargs)
+        except Exception as e:
+            payload = self._payload(name, kwargs)
+            payload["error"] = str(e)
+            payload["error_type"] = type(e).__name__
+            self._evt_bus.publish(self._failed_topic, payload)
+            logger.debug(f"Published {self._failed_topic} event for '{name}'")
+            raise
+        payload = self._payload(name, kwargs)
+        payload["result"] = result
+        self._evt_bus.publish(self._done_topic, payload)
+        logger.debug(f"Published {self._done_topic} event for '{name}'")
+        return result
@@ -2,9 +2,6 @@
 from abc import ABC, abstractmethod
 from typing import Any, Optional
 
-from hub.core.qt_import import import_qt
-QtWidgets = import_qt()
-
 
 class ToolContext:
     """Context object passed to plugins, containing all system components.
@@ -23,7 +20,7 @@ class ToolContext:
             cmd_bus: CommandBus instance
             evt_bus: EventBus instance
             job_center: JobCenter instance (optional, for future use)
-            services: Services dict (optional, for future use)
+            services: Services mapping - a ServiceRegistry or plain dict (optional)
         """
         self.dcc = dcc
         self.settings = settings
@@ -0,0 +1,435 @@
+"""Sampling profiler for tool executions and JobCenter jobs.
+
+Opt-in: "the tool is slow on my scene" becomes a flame graph the artist
+can hand over. While a profiled tool (or job) runs, a background thread
+samples the stack of the thread running it every interval through
+sys._current_frames() - the profiled code itself is not instrumented, so
+the overhead stays low and independent of how many calls it makes.
+
+Each execution is saved as its own profile under
+~/.studio_name/maya_tools_hub/profiles (next to the hub's other per-user
+files) in speedscope JSON (open in https://www.speedscope.app) and/or
+collapsed-stack text (flamegraph.pl, inferno, speedscope).
+
+Settings (all live, see ToolProfiler.configure):
+    profiler.enabled      profile every tool run (default false)
+    profiler.tools        tool keys to profile, e.g. ["poly.smooth_normals"]
+    profiler.jobs         also profile every JobCenter job (jobs submitted
+                          while a profiled tool runs are always profiled)
+    profiler.interval_ms  sampling interval (default 5)
+    profiler.format       "speedscope", "collapsed" or "both"
+    profiler.keep         profiles kept on disk (oldest deleted first)
+"""
+import json
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+
+from hub.core.logging import get_logger
+from hub.core.middleware import Middleware
+
+logger = get_logger(__name__)
+
+DEFAULT_INTERVAL = 0.005
+DEFAULT_KEEP = 50
+FORMATS = ("speedscope", "collapsed", "both")
+SPEEDSCOPE_SCHEMA = "https://www.speedscope.app/file-format-schema.json"
+
+# Label of the profiled execution running on the current thread (jobs
+# submitted from it are profiled too)
+_active = threading.local()
+
+
+def default_profile_dir():
+    """Get the directory profiles are saved to."""
+    return Path.home() / ".studio_name" / "maya_tools_hub" / "profiles"
+
+
+def _frame_name(code):
+    name = getattr(code, "co_qualname", code.co_name)
+    return f"{name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class Profile:
+    """Aggregated stack samples of one execution.
+
+    Stacks are tuples of code objects, leaf first; weights are the seconds
+    each stack was observed for (the time since the previous sample, so
+    delayed samples still add up to the real duration).
+    """
+
+    def __init__(self, label, thread_name, interval, metadata=None):
+        self.label = label
+        self.thread_name = thread_name
+        self.interval = interval
+        self.metadata = metadata or {}
+        self.started = time.time()
+        self.duration = 0.0
+        self.samples = 0
+        self.weights = Counter()  # stack -> seconds
+
+    def add(self, frame, weight):
+        """Record one sample of a thread's current frame."""
+        stack = []
+        while frame is not None:
+            stack.append(frame.f_code)
+            frame = frame.f_back
+        self.weights[tuple(stack)] += weight
+        self.samples += 1
+
+    def top_functions(self, count=5):
+        """Functions with the most self time.
+
+        Returns:
+            List of (frame name, seconds)
+        """
+        own = Counter()
+        for stack, weight in self.weights.items():
+            own[stack[0]] += weight
+        return [(_frame_name(code), seconds) for code, seconds in own.most_common(count)]
+
+    def to_collapsed(self):
+        """Collapsed-stack text: "root;...;leaf <microseconds>" per line."""
+        lines = []
+        for stack, weight in self.weights.items():
+            names = ";".join(_frame_name(code).replace(";", ":") for code in reversed(stack))
+            lines.append(f"{names} {max(1, round(weight * 1e6))}")
+        return "\n".join(sorted(lines)) + "\n"
+
+    def to_speedscope(self):
+        """Speedscope file (sampled profile, weights in seconds)."""
+        frames, index = [], {}
+        samples, weights = [], []
+        for stack, weight in self.weights.items():
+            sample = []
+            for code in reversed(stack):
+                if code not in index:
+                    index[code] = len(frames)
+                    frames.append({"name": getattr(code, "co_qualname", code.co_name),
+                                   "file": code.co_filename, "line": code.co_firstlineno})
+                sample.append(index[code])
+            samples.append(sample)
+            weights.append(weight)
+        name = self.label
+        if self.metadata.get("kwargs"):
+            name += " " + ", ".join(f"{k}={v!r}" for k, v in self.metadata["kwargs"].items())
+        return {
+            "$schema": SPEEDSCOPE_SCHEMA,
+            "name": name,
+            "exporter": "maya_tools_hub profiler",
+            "shared": {"frames": frames},
+            "profiles": [{
+                "type": "sampled",
+                "name": f"{name} [{self.thread_name}]",
+                "unit": "seconds",
+                "startValue": 0,
+                "endValue": self.duration,
+                "samples": samples,
+                "weights": weights,
+            }],
+        }
+
+
+class _Session:
+    def __init__(self, profile, thread_id, interval):
+        self.profile = profile
+        self.thread_id = thread_id
+        self.interval = interval
+        self.last = time.perf_counter()
+
+
+class _Sampler:
+    """One background thread sampling every active session.
+
+    The thread exists only while something is being profiled. Pure Python
+    code only hands over the GIL every sys.getswitchinterval() (5 ms by
+    default), so while sampling the switch interval is lowered to the
+    shortest session interval and restored when the thread exits.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._sessions = []
+        self._thread = None
+        self._switch_interval = None
+
+    def add(self, session):
+        with self._lock:
+            self._sessions.append(session)
+            if self._switch_interval is None:
+                self._switch_interval = sys.getswitchinterval()
+            sys.setswitchinterval(min(self._switch_interval, session.interval,
+                                      sys.getswitchinterval()))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="profiler", daemon=True)
+                self._thread.start()
+
+    def remove(self, session):
+        with self._lock:
+            if session in self._sessions:
+                self._sessions.remove(session)
+
+    def _run(self):
+        while True:
+            # Sample under the lock: once remove() returns, the session's
+            # profile is no longer written to
+            with self._lock:
+                if not self._sessions:
+                    sys.setswitchinterval(self._switch_interval)
+                    self._switch_interval = None
+                    self._thread = None
+                    return
+                frames = sys._current_frames()
+                now = time.perf_counter()
+                for session in self._sessions:
+                    frame = frames.get(session.thread_id)
+                    if frame is not None and now - session.last >= session.interval * 0.5:
+                        session.profile.add(frame, now - session.last)
+                        session.last = now
+                del frames, frame
+                delay = min(session.interval for session in self._sessions)
+            time.sleep(delay)
+
+
+_sampler = _Sampler()
+
+
+class ToolProfiler:
+    """Decides what to profile, runs the sampling sessions and saves profiles."""
+
+    def __init__(self, directory=None, interval=DEFAULT_INTERVAL, enabled=False, tools=(), jobs=False,
+                 format="speedscope", keep=DEFAULT_KEEP, evt_bus=None, schedule=None):
+        """Initialize profiler.
+
+        Args:
+            directory: Profile directory (default: default_profile_dir())
+            interval: Sampling interval in seconds
+            enabled: Profile every tool run
+            tools: Tool keys to profile
+            jobs: Profile every JobCenter job
+            format: "speedscope", "collapsed" or "both"
+            keep: Profiles kept on disk (0: keep all)
+            evt_bus: Optional EventBus, receives "profile/saved"
+            schedule: Callable(fn) running fn on the main thread (events
+                from job profiles); default: publish directly
+        """
+        self.directory = Path(directory) if directory else default_profile_dir()
+        self.interval = interval
+        self.enabled = enabled
+        self.tools = set(tools)
+        self.jobs = jobs
+        self.format = format
+        self.keep = keep
+        self._evt_bus = evt_bus
+        self._schedule = schedule
+        self._counter = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, settings, evt_bus=None, schedule=None):
+        """Create a profiler configured from profiler.* settings that
+        follows later changes to them."""
+        profiler = cls(evt_bus=evt_bus, schedule=schedule)
+        profiler._apply_settings(settings)
+
+        def on_changed(key, value, old):
+            if key.startswith("profiler."):
+                try:
+                    profiler._apply_settings(settings)
+                except ValueError as e:
+                    logger.warning(f"Ignoring profiler settings: {e}")
+        settings.subscribe(on_changed)
+        return profiler
+
+    def _apply_settings(self, settings):
+        tools = settings.get("profiler.tools", [])
+        self.configure(
+            enabled=settings.get_bool("profiler.enabled", False),
+            tools=[tools] if isinstance(tools, str) else tools or [],
+            jobs=settings.get_bool("profiler.jobs", False),
+            interval=settings.get_float("profiler.interval_ms", DEFAULT_INTERVAL * 1000) / 1000,
+            format=settings.get_str("profiler.format", "speedscope"),
+            keep=settings.get_int("profiler.keep", DEFAULT_KEEP),
+            directory=settings.get_str("profiler.directory", "") or None,
+        )
+
+    def configure(self, enabled=None, tools=None, jobs=None, interval=None, format=None, keep=None,
+                  directory=None):
+        """Change what is profiled (arguments left as None are unchanged).
+
+        Returns:
+            dict: Current configuration
+        """
+        if enabled is not None:
+            self.enabled = bool(enabled)
+        if tools is not None:
+            self.tools = set(tools)
+        if jobs is not None:
+            self.jobs = bool(jobs)
+        if interval is not None:
+            self.interval = max(0.0005, float(interval))
+        if format is not None:
+            if format not in FORMATS:
+                raise ValueError(f"Unknown profile format '{format}' (expected one of {FORMATS})")
+            self.format = format
+        if keep is not None:
+            self.keep = int(keep)
+        if directory is not None:
+            self.directory = Path(directory)
+        return self.config()
+
+    def config(self):
+        return {"enabled": self.enabled, "tools": sorted(self.tools), "jobs": self.jobs,
+                "interval_ms": self.interval * 1000, "format": self.format, "keep": self.keep,
+                "directory": str(self.directory)}
+
+    def wants(self, key):
+        """Whether runs of a tool key are profiled."""
+        return self.enabled or key in self.tools
+
+    @contextmanager
+    def profile(self, label, metadata=None):
+        """Profile the calling thread for the duration of the block.
+
+        Args:
+            label: Profile label (tool key or job name)
+            metadata: Optional dict stored with the profile (e.g. kwargs)
+
+        Yields:
+            Profile (complete and saved after the block)
+        """
+        thread = threading.current_thread()
+        profile = Profile(label, thread.name, self.interval, metadata)
+        session = _Session(profile, threading.get_ident(), self.interval)
+        previous = getattr(_active, "label", None)
+        _active.label = label
+        start = time.perf_counter()
+        _sampler.add(session)
+        try:
+            yield profile
+        finally:
+            _sampler.remove(session)
+            profile.duration = time.perf_counter() - start
+            _active.label = previous
+            self._save(profile)
+
+    def wrap_job(self, fn, name):
+        """Wrap a JobCenter job so it is profiled when it should be.
+
+        Called on the submitting thread: a job submitted while a profiled
+        tool runs there is profiled as "<tool key>/<job name>".
+
+        Returns:
+            fn itself, or a profiling wrapper
+        """
+        parent = getattr(_active, "label", None)
+        if parent is None and not self.jobs:
+            return fn
+        label = f"{parent}/{name}" if parent else f"job/{name}"
+
+        def profiled():
+            with self.profile(label):
+                return fn()
+        return profiled
+
+    def _save(self, profile):
+        """Write a profile in the configured format(s)."""
+        if not profile.samples:
+            logger.info(f"Profile '{profile.label}': no samples in {profile.duration * 1000:.1f} ms "
+                        f"(shorter than the {self.interval * 1000:.1f} ms interval)")
+            return []
+        with self._lock:
+            self._counter += 1
+            counter = self._counter
+        stem = "{}_{}_{}_{}".format(time.strftime("%Y%m%d-%H%M%S", time.localtime(profile.started)),
+                                    re.sub(r"[^\w.-]+", "_", profile.label), os.getpid(), counter)
+        paths = []
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            if self.format in ("speedscope", "both"):
+                path = self.directory / f"{stem}.speedscope.json"
+                with open(path, "w", encoding="utf-8") as f:
+                    json.dump(profile.to_speedscope(), f, default=repr)
+                paths.append(str(path))
+            if self.format in ("collapsed", "both"):
+                path = self.directory / f"{stem}.collapsed.txt"
+                with open(path, "w", encoding="utf-8") as f:
+                    f.write(profile.to_collapsed())
+                paths.append(str(path))
+        except OSError as e:
+            logger.error(f"Could not save profile '{profile.label}': {e}")
+            return paths
+        self._prune()
+
+        top = ", ".join(f"{name} {seconds * 1000:.0f} ms" for name, seconds in profile.top_functions(3))
+        logger.info(f"Profile '{profile.label}' ({profile.duration * 1000:.0f} ms, {profile.samples} samples) "
+                    f"saved: {paths[0]}; top: {top}")
+        if self._evt_bus is not None:
+            payload = {"label": profile.label, "paths": paths, "duration": profile.duration,
+                       "samples": profile.samples}
+            publish = lambda: self._evt_bus.publish("profile/saved", payload)
+            if self._schedule is not None:
+                self._schedule(publish)
+            else:
+                publish()
+        return paths
+
+    def _prune(self):
+        """Delete the oldest profiles beyond keep."""
+        if self.keep <= 0:
+            return
+        stems = {}
+        try:
+            for suffix in (".speedscope.json", ".collapsed.txt"):
+                for path in self.directory.glob(f"*{suffix}"):
+                    stems.setdefault(path.name[:-len(suffix)], []).append(path)
+            ages = {stem: max(path.stat().st_mtime for path in paths) for stem, paths in stems.items()}
+        except OSError:
+            return
+        for stem in sorted(stems, key=lambda stem: (ages[stem], stem))[:-self.keep]:
+            for path in stems[stem]:
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+
+class ProfilerMiddleware(Middleware):
+    """Profile command runs for tool keys the ToolProfiler wants."""
+
+    def __init__(self, profiler, commands=None):
+        """Initialize middleware.
+
+        Args:
+            profiler: ToolProfiler
+            commands: Command names to profile (default: all)
+        """
+        super().__init__(commands)
+        self.profiler = profiler
+
+    def __call__(self, name, kwargs, call_next):
+        key = kwargs.get("key") or name
+        if not self.profiler.wants(key):
+            return call_next(kwargs)
+        metadata = {"command": name, "kwargs": {k: v for k, v in kwargs.items() if k != "key"}}
+        with self.profiler.profile(key, metadata):
+            return call_next(kwargs)
+
+
+def register_commands(cmd_bus, profiler):
+    """Register profiler.* commands (reachable over IPC as well).
+
+    Commands:
+        profiler.configure(enabled=, tools=, jobs=, interval_ms=, format=, keep=)
+        profiler.status(): current configuration
+    """
+    def configure(interval_ms=None, **kwargs):
+        return profiler.configure(interval=None if interval_ms is None else interval_ms / 1000, **kwargs)
+
+    cmd_bus.register("profiler.configure", configure)
+    cmd_bus.register("profiler.status", profiler.config)
@@ -1,44 +1,100 @@
-"""Unified Qt import utility - prioritizes vendor Qt.py, falls back to DCC Qt or stub."""
+"""Unified Qt import utility - resolves the Qt binding once per process.
+
+Priority: a vendored Qt.py, then PySide2, then PySide6. The result (or its
+absence) is cached, so importing several hub modules probes the bindings
+only once. Core modules (hub.core, hub.dcc, hub.services) never import Qt
+at module level; they call these helpers when they actually need it.
+
+Set HUB_QT=none to skip Qt entirely (headless batch/CI processes, where a
+DCC's bundled PySide would otherwise be imported for nothing), or to a
+binding name ("PySide2", "PySide6", "Qt") to force one.
+"""
+import importlib
+import importlib.util
+import os
 import warnings
-import sys
+from collections import namedtuple
 
+QT_ENV = "HUB_QT"
+BINDINGS = ("Qt", "PySide2", "PySide6")
+
+QtBinding = namedtuple("QtBinding", "name QtCore QtGui QtWidgets")
+
+_UNRESOLVED = object()
+_binding = _UNRESOLVED
+_stub = None
+
+
+def _is_qt_py():
+    """Whether "Qt" is the Qt.py shim module (not the hub's Qt package,
+    which itself re-exports the resolved binding)."""
+    try:
+        spec = importlib.util.find_spec("Qt")
+    except (ImportError, ValueError):
+        return False
+    return spec is not None and bool(spec.origin) and os.path.basename(spec.origin) == "Qt.py"
+
+
+def resolve_binding():
+    """Resolve the Qt binding (first call only; cached afterwards).
 
-def import_qt():
-    """Import Qt with fallback strategy.
-    
-    Priority:
-    1. Vendor's Qt.py (if available and Qt bindings exist)
-    2. Direct PySide2/PySide6 (in DCC environments)
-    3. Minimal stub (for non-GUI testing)
-    
     Returns:
-        QtWidgets module or stub
+        QtBinding(name, QtCore, QtGui, QtWidgets), or None without Qt
     """
-    # Try vendor's Qt.py first
-    try:
-        from Qt import QtWidgets
-        return QtWidgets
-    except ImportError:
-        pass
-    
-    # Fallback: try direct PySide imports (Maya/Max environments)
-    try:
-        from PySide2 import QtWidgets
-        return QtWidgets
-    except ImportError:
+    global _binding
+    if _binding is not _UNRESOLVED:
+        return _binding
+    choice = os.environ.get(QT_ENV, "").strip()
+    if choice.lower() in ("none", "off", "0"):
+        _binding = None
+        return None
+    candidates = [name for name in BINDINGS if name.lower() == choice.lower()] or BINDINGS
+    _binding = None
+    for name in candidates:
+        if name == "Qt" and not _is_qt_py():
+            continue
         try:
-            from PySide6 import QtWidgets
-            return QtWidgets
+            modules = [importlib.import_module(f"{name}.{sub}") for sub in ("QtCore", "QtGui", "QtWidgets")]
         except ImportError:
-            pass
-    
+            continue
+        _binding = QtBinding(name, *modules)
+        break
+    return _binding
+
+
+def qt_available():
+    """Check whether a Qt binding is available (resolves it if needed)."""
+    return resolve_binding() is not None
+
+
+def qt_core():
+    """Get QtCore of the resolved binding, or None without Qt."""
+    binding = resolve_binding()
+    return binding.QtCore if binding is not None else None
+
+
+def import_qt():
+    """Import Qt with fallback strategy.
+
+    Returns:
+        QtWidgets module of the resolved binding, or a minimal stub (for
+        non-GUI testing) when no binding is available
+    """
+    global _stub
+    binding = resolve_binding()
+    if binding is not None:
+        return binding.QtWidgets
+    if _stub is not None:
+        return _stub
+
     # No Qt available - create minimal stub for non-GUI testing
-    warnings.warn(
-        "Qt not available. Running in stub mode. "
-        "For full functionality, run in Maya or install PySide2/PySide6.",
-        UserWarning
-    )
-    
+    if os.environ.get(QT_ENV, "").strip().lower() not in ("none", "off", "0"):
+        warnings.warn(
+            "Qt not available. Running in stub mode. "
+            "For full functionality, run in Maya or install PySide2/PySide6.",
+            UserWarning
+        )
+
     # Minimal stub for testing
     class _QWidgetStub:
         def __init__(self, parent=None):
@@ -48,7 +104,7 @@ def import_qt():
             self._window_title = title
         def show(self):
             pass
-    
+
     class _QApplicationStub:
         _instance = None
         def __init__(self, argv=None):
@@ -58,10 +114,10 @@ def import_qt():
             return cls._instance
         def exec_(self):
             return 0
-    
+
     class _QtWidgetsStub:
         QWidget = _QWidgetStub
         QApplication = _QApplicationStub
-    
-    return _QtWidgetsStub()
 
+    _stub = _QtWidgetsStub()
+    return _stub
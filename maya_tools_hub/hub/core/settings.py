@@ -1,97 +1,630 @@
 """Settings - user-level JSON configuration management."""
+import atexit
+import functools
+import hashlib
 import json
+import os
+import tempfile
+import threading
+import weakref
 from pathlib import Path
 
+_MISSING = object()
+_SHADOWED = object()  # a non-dict value sits on the key's path
+
+# Instances with possibly pending debounced writes, flushed at interpreter exit
+_live_instances = weakref.WeakSet()
+
+# Environment variables pointing at the shared layer files
+STUDIO_SETTINGS_ENV = "HUB_STUDIO_SETTINGS"
+PROJECT_SETTINGS_ENV = "HUB_PROJECT_SETTINGS"
+
+
+def _coerce_bool(value):
+    if isinstance(value, str):
+        return value.strip().lower() in ("1", "true", "yes", "on")
+    return bool(value)
+
+
+# Schema "type" -> coercion function used by typed accessors
+_COERCE = {
+    "float": float,
+    "int": int,
+    "bool": _coerce_bool,
+    "str": str,
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _key_parts(key_path):
+    """Split a dot-key once and cache the compiled path."""
+    return tuple(key_path.split('.'))
+
+
+def _default_dir():
+    """Default per-user hub directory (~/.studio_name/maya_tools_hub)."""
+    return Path.home() / ".studio_name" / "maya_tools_hub"
+
+
+def _deep_merge(base, override):
+    """Merge override into a copy of base (nested dicts merged recursively).
+
+    Nested dicts are copied too, so the result never aliases layer data.
+    """
+    result = {key: _deep_merge(value, {}) if isinstance(value, dict) else value
+              for key, value in base.items()}
+    for key, value in override.items():
+        if isinstance(value, dict):
+            base_value = result.get(key)
+            result[key] = _deep_merge(base_value if isinstance(base_value, dict) else {}, value)
+        else:
+            result[key] = value
+    return result
+
+
+def _lookup(root, parts):
+    """Get the value at a split dot-key in nested dicts.
+
+    Returns:
+        The value, _MISSING if absent, or _SHADOWED if a non-dict value sits
+        on the path (it replaces lower layers' sub-trees when merged)
+    """
+    current = root
+    for part in parts[:-1]:
+        current = current.get(part, _MISSING)
+        if current is _MISSING:
+            return _MISSING
+        if not isinstance(current, dict):
+            return _SHADOWED
+    return current.get(parts[-1], _MISSING)
+
+
+def _flatten(data, prefix, out):
+    """Flatten nested dicts into dot-keys (prefix keys map to sub-dicts)."""
+    for key, value in data.items():
+        dot_key = prefix + key
+        out[dot_key] = value
+        if isinstance(value, dict):
+            _flatten(value, dot_key + ".", out)
+    return out
+
+
+class SettingsLayer:
+    """Read-only settings layer backed by a JSON file (studio or project).
+
+    Files on network storage are mirrored into a local cache directory; the
+    remote file is only re-read when its mtime changes, and the local copy is
+    used at startup (or when the share is unreachable).
+    """
+
+    def __init__(self, name, path, cache_dir=None):
+        """Initialize layer.
+
+        Args:
+            name: Layer name (e.g. "studio", "project")
+            path: Path to the layer JSON file
+            cache_dir: Optional local cache directory for the file
+        """
+        self.name = name
+        self.path = Path(path)
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.data = {}
+        self._mtime = None
+
+    def _cache_paths(self):
+        # Keyed by source path too, so switching HUB_PROJECT_SETTINGS never
+        # serves the previous project's copy when the share is unreachable
+        digest = hashlib.sha1(str(self.path).encode("utf-8")).hexdigest()[:12]
+        stem = f"{self.name}-{digest}"
+        return self.cache_dir / f"{stem}.json", self.cache_dir / f"{stem}.mtime"
+
+    def refresh(self):
+        """Reload the layer if its file changed.
+
+        Returns:
+            bool: True if the layer data changed
+        """
+        try:
+            mtime = self.path.stat().st_mtime
+        except OSError:
+            mtime = None
+
+        if mtime is None:
+            # Unreachable or missing: keep current data, fall back to local copy once
+            if self._mtime is None and self.cache_dir is not None:
+                return self._load_cached()
+            return False
+        if mtime == self._mtime:
+            return False
+
+        if self.cache_dir is not None and self._mtime is None:
+            cache_file, mtime_file = self._cache_paths()
+            try:
+                if float(mtime_file.read_text()) == mtime and self._load_cached():
+                    self._mtime = mtime
+                    return True
+            except (OSError, ValueError):
+                pass
+
+        try:
+            text = self.path.read_text(encoding="utf-8")
+            data = json.loads(text)
+        except (OSError, ValueError) as e:
+            print(f"[Settings] Error loading {self.name} layer {self.path}: {e}")
+            return False
+
+        self._mtime = mtime
+        self.data = data
+        if self.cache_dir is not None:
+            cache_file, mtime_file = self._cache_paths()
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                cache_file.write_text(text, encoding="utf-8")
+                mtime_file.write_text(repr(mtime))
+            except OSError as e:
+                print(f"[Settings] Error caching {self.name} layer: {e}")
+        return True
+
+    def _load_cached(self):
+        """Load the local copy of the layer file."""
+        cache_file, _ = self._cache_paths()
+        try:
+            self.data = json.loads(cache_file.read_text(encoding="utf-8"))
+            return True
+        except (OSError, ValueError):
+            return False
+
+
+def default_layers(cache_dir=None):
+    """Build studio/project layers from HUB_STUDIO_SETTINGS / HUB_PROJECT_SETTINGS.
+
+    Args:
+        cache_dir: Local cache directory (default: ~/.studio_name/maya_tools_hub/layer_cache)
+
+    Returns:
+        List of SettingsLayer, lowest priority first
+    """
+    cache_dir = cache_dir or _default_dir() / "layer_cache"
+    layers = []
+    for name, env in (("studio", STUDIO_SETTINGS_ENV), ("project", PROJECT_SETTINGS_ENV)):
+        path = os.environ.get(env)
+        if path:
+            layers.append(SettingsLayer(name, path, cache_dir=cache_dir))
+    return layers
+
 
 class Settings:
-    """User-level settings manager with JSON persistence.
-    
+    """Layered settings manager with JSON persistence.
+
     Supports dot-notation keys (e.g., "ui.theme") and automatic file saving.
+
+    Values resolve from schema defaults -> studio -> project -> user ->
+    session overrides (later wins). Resolved dot-keys are precomputed into a
+    flat dict, so get() is a side-effect-free dict lookup that never touches
+    disk; set() re-merges only the changed key's top-level section, and the
+    cache is only rebuilt when refresh() finds that a layer file changed
+    (polled by start_refresh()). Only the user layer is written to disk.
+
+    Writes are dirty-tracked: set() with an unchanged value is a no-op. With a
+    save_delay, changes are coalesced on a debounce timer and written off the
+    main thread; every write goes to a temp file that is then atomically
+    renamed over the settings file, so a crash never leaves it half-written.
     """
-    
-    def __init__(self, file_path=None):
+
+    def __init__(self, file_path=None, event_bus=None, save_delay=None, layers=None):
         """Initialize settings manager.
-        
+
         Args:
-            file_path: Path to settings file. If None, uses default:
+            file_path: Path to user settings file. If None, uses default:
                 ~/.studio_name/maya_tools_hub/user_settings.json
+            event_bus: Optional EventBus, receives "settings/changed" events
+            save_delay: Debounce delay in seconds for automatic background
+                saves after set(). None disables autosave (call save()).
+            layers: Optional list of read-only SettingsLayer below the user
+                layer, lowest priority first (see default_layers())
         """
         if file_path is None:
             # Default path: ~/.studio_name/maya_tools_hub/user_settings.json
-            home = Path.home()
-            default_dir = home / ".studio_name" / "maya_tools_hub"
+            default_dir = _default_dir()
             default_dir.mkdir(parents=True, exist_ok=True)
             file_path = default_dir / "user_settings.json"
-        
+
         self._file_path = Path(file_path)
-        self._data = {}
+        self._data = {}  # user layer
+        self._layers = list(layers or [])
+        self._overrides = {}  # session layer (never saved)
+        self._schema = {}  # dot-key -> spec dict ({"type": ..., "default": ...})
+        self._defaults = {}  # schema defaults layer (lowest priority)
+        self._resolved = None  # flat dot-key -> value cache
+        for layer in self._layers:
+            layer.refresh()
+        self._event_bus = event_bus
+        self._save_delay = save_delay
+        self._subscribers = []
+        self._lock = threading.RLock()  # guards _data against background serialization
+        self._write_lock = threading.Lock()  # serializes whole file writes (snapshot -> replace)
+        self._dirty = False
+        self._timer = None
+        self._refresh_stop = None
+        self._refresh_thread = None
         self.load()
-    
-    def _get_nested(self, key_path):
+        _live_instances.add(self)
+
+    def _get_nested(self, key_path, root=None):
         """Get nested value using dot-notation key.
-        
+
         Args:
             key_path: Dot-separated key (e.g., "ui.theme")
-            
+            root: Dict to navigate (default: user layer data)
+
         Returns:
             Tuple (dict, final_key) where dict is the parent dict and final_key is the last key
         """
-        keys = key_path.split('.')
-        current = self._data
-        
-        # Navigate to parent dict
+        keys = _key_parts(key_path)
+        current = self._data if root is None else root
+
+        # Navigate to parent dict (creating it - write paths only)
         for key in keys[:-1]:
             if key not in current:
                 current[key] = {}
             elif not isinstance(current[key], dict):
                 current[key] = {}
             current = current[key]
-        
+
         return current, keys[-1]
-    
+
     def get(self, key, default=None):
         """Get a setting value.
-        
+
         Args:
             key: Dot-separated key (e.g., "ui.theme")
             default: Default value if key doesn't exist
-            
+
         Returns:
             Setting value or default
         """
-        parent, final_key = self._get_nested(key)
-        return parent.get(final_key, default)
-    
+        resolved = self._resolved
+        if resolved is None:
+            resolved = self._resolve()
+        return resolved.get(key, default)
+
+    def _get_typed(self, key, default, type_name):
+        """Get a value coerced to a schema type.
+
+        Falls back to the explicit default when the stored value cannot be
+        converted.
+        """
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            return default
+        try:
+            return _COERCE[type_name](value)
+        except (TypeError, ValueError):
+            print(f"[Settings] Invalid {type_name} value for '{key}': {value!r}")
+            return default
+
+    def get_float(self, key, default=None):
+        """Get a setting as float (schema default if unset)."""
+        return self._get_typed(key, default, "float")
+
+    def get_int(self, key, default=None):
+        """Get a setting as int (schema default if unset)."""
+        return self._get_typed(key, default, "int")
+
+    def get_bool(self, key, default=None):
+        """Get a setting as bool (schema default if unset)."""
+        return self._get_typed(key, default, "bool")
+
+    def get_str(self, key, default=None):
+        """Get a setting as str (schema default if unset)."""
+        return self._get_typed(key, default, "str")
+
+    def register_schema(self, prefix, schema):
+        """Register setting specs declared in a plugin manifest.
+
+        Schema defaults form the lowest-priority layer, so get() returns
+        them when no layer sets the key.
+
+        Args:
+            prefix: Key prefix (plugin key, e.g. "poly.smooth_normals")
+            schema: Dict of name -> {"type": "float"|"int"|"bool"|"str", "default": value}
+        """
+        with self._lock:
+            for name, spec in (schema or {}).items():
+                dot_key = f"{prefix}.{name}" if prefix else name
+                if spec.get("type") not in _COERCE:
+                    print(f"[Settings] Unknown type in schema for '{dot_key}': {spec.get('type')}")
+                    continue
+                self._schema[dot_key] = spec
+                if "default" in spec:
+                    parent, final_key = self._get_nested(dot_key, self._defaults)
+                    parent[final_key] = spec["default"]
+                    self._update_resolved(dot_key)
+
+    def get_schema(self, key):
+        """Get the registered spec for a dot-key, or None."""
+        return self._schema.get(key)
+
+    def _resolve(self):
+        """Rebuild the flat resolved cache from all layers."""
+        with self._lock:
+            merged = self._defaults
+            for layer in self._layers:
+                merged = _deep_merge(merged, layer.data)
+            merged = _deep_merge(merged, self._data)
+            merged = _deep_merge(merged, self._overrides)
+            self._resolved = _flatten(merged, "", {})
+            return self._resolved
+
+    def _merged_value(self, parts):
+        """Merge the value at a split dot-key across all layers."""
+        merged = _MISSING
+        for root in [self._defaults] + [layer.data for layer in self._layers] + [self._data, self._overrides]:
+            value = _lookup(root, parts)
+            if value is _SHADOWED:
+                merged = _MISSING
+            elif value is _MISSING:
+                continue
+            elif isinstance(value, dict):
+                merged = _deep_merge(merged if isinstance(merged, dict) else {}, value)
+            else:
+                merged = value
+        return merged
+
+    def _update_resolved(self, key):
+        """Update the flat cache in place for one changed dot-key.
+
+        Only the key's top-level section (e.g. "ui" for "ui.theme") is merged
+        and flattened again; the other layers' sections are left alone.
+        """
+        resolved = self._resolved
+        if resolved is None:
+            return
+        top = _key_parts(key)[0]
+        entries = {}
+        value = self._merged_value((top,))
+        if value is not _MISSING:
+            entries[top] = value
+            if isinstance(value, dict):
+                _flatten(value, top + ".", entries)
+        old = resolved.get(top, _MISSING)
+        stale = [top] if old is not _MISSING else []
+        if isinstance(old, dict):
+            stale.extend(_flatten(old, top + ".", {}))
+        stale = [k for k in stale if k not in entries]
+        resolved.update(entries)
+        for k in stale:
+            resolved.pop(k, None)
+
+    def set_override(self, key, value):
+        """Set a session override (highest priority, never saved).
+
+        Args:
+            key: Dot-separated key
+            value: Value to set
+        """
+        old = self.get(key)
+        with self._lock:
+            parent, final_key = self._get_nested(key, self._overrides)
+            parent[final_key] = value
+            self._update_resolved(key)
+        if old != value:
+            self._notify(key, value, old)
+
+    def clear_overrides(self):
+        """Drop all session overrides."""
+        with self._lock:
+            self._overrides = {}
+            self._resolved = None
+
+    def refresh(self):
+        """Reload layer files whose mtime changed and publish changed keys.
+
+        Returns:
+            bool: True if any layer changed
+        """
+        changed = [layer.name for layer in self._layers if layer.refresh()]
+        if not changed:
+            return False
+        self._apply_layers()
+        return True
+
+    def _apply_layers(self):
+        """Rebuild the resolved cache after layer data changed and publish changed keys."""
+        old = self._resolved
+        with self._lock:
+            self._resolved = None
+        new = self._resolve()
+        if old is None:
+            return
+        for key in set(old) | set(new):
+            if old.get(key, _MISSING) != new.get(key, _MISSING) and not isinstance(new.get(key), dict):
+                self._notify(key, new.get(key), old.get(key))
+
+    def start_refresh(self, interval=30.0, schedule=None):
+        """Poll the layer files for changes every interval seconds.
+
+        The files (possibly on a network share) are checked on a daemon
+        thread; the cache rebuild and change notifications run through
+        schedule.
+
+        Args:
+            interval: Seconds between checks
+            schedule: Optional callable(fn) running fn on the main thread
+                (e.g. JobCenter.call_in_main_thread); None notifies from
+                the polling thread
+        """
+        if self._refresh_thread is not None or not self._layers:
+            return
+        stop = self._refresh_stop = threading.Event()
+
+        def loop():
+            while not stop.wait(interval):
+                try:
+                    changed = [layer.name for layer in self._layers if layer.refresh()]
+                except Exception as e:
+                    print(f"[Settings] Error checking settings layers: {e}")
+                    continue
+                if changed and not stop.is_set():
+                    if schedule is not None:
+                        schedule(self._apply_layers)
+                    else:
+                        self._apply_layers()
+
+        self._refresh_thread = threading.Thread(target=loop, name="settings-refresh", daemon=True)
+        self._refresh_thread.start()
+
+    def stop_refresh(self):
+        """Stop polling the layer files (see start_refresh())."""
+        if self._refresh_stop is not None:
+            self._refresh_stop.set()
+        self._refresh_stop = None
+        self._refresh_thread = None
+
     def set(self, key, value):
         """Set a setting value.
-        
+
+        Unchanged values are skipped (no notification, no write).
+
         Args:
             key: Dot-separated key (e.g., "ui.theme")
             value: Value to set
         """
-        parent, final_key = self._get_nested(key)
-        parent[final_key] = value
-    
+        with self._lock:
+            parent, final_key = self._get_nested(key)
+            old = parent.get(final_key, _MISSING)
+            if old is not _MISSING and type(old) is type(value) and old == value:
+                return
+            parent[final_key] = value
+            self._dirty = True
+            self._update_resolved(key)
+
+        self._notify(key, value, None if old is _MISSING else old)
+        if self._save_delay is not None:
+            self.save_async()
+
+    def subscribe(self, callback):
+        """Subscribe to setting changes.
+
+        Args:
+            callback: Callable(key, value, old_value) called after each change
+        """
+        self._subscribers.append(callback)
+
+    def _notify(self, key, value, old):
+        """Notify subscribers and publish settings/changed."""
+        for callback in self._subscribers:
+            try:
+                callback(key, value, old)
+            except Exception as e:
+                print(f"[Settings] Error in change callback: {e}")
+        if self._event_bus is not None:
+            self._event_bus.publish("settings/changed", {"key": key, "value": value, "old": old})
+
+    @property
+    def dirty(self):
+        """Whether there are changes not yet written to disk."""
+        return self._dirty
+
     def load(self):
         """Load settings from file."""
-        if self._file_path.exists():
-            try:
-                with open(self._file_path, 'r', encoding='utf-8') as f:
-                    self._data = json.load(f)
-            except (json.JSONDecodeError, IOError) as e:
-                print(f"[Settings] Error loading settings: {e}")
+        with self._lock:
+            if self._file_path.exists():
+                try:
+                    with open(self._file_path, 'r', encoding='utf-8') as f:
+                        self._data = json.load(f)
+                except (json.JSONDecodeError, IOError) as e:
+                    print(f"[Settings] Error loading settings: {e}")
+                    self._data = {}
+            else:
                 self._data = {}
-        else:
-            self._data = {}
-    
+            self._dirty = False
+            self._resolved = None
+
     def save(self):
-        """Save settings to file."""
-        try:
-            # Ensure directory exists
-            self._file_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            with open(self._file_path, 'w', encoding='utf-8') as f:
-                json.dump(self._data, f, indent=2, ensure_ascii=False)
-        except IOError as e:
-            print(f"[Settings] Error saving settings: {e}")
+        """Save settings to file synchronously (skipped if nothing changed).
+
+        Returns:
+            bool: True if the file was written
+        """
+        self._cancel_timer()
+        if not self._dirty and self._file_path.exists():
+            return False
+        return self._write()
+
+    def save_async(self):
+        """Schedule a delayed background save.
+
+        Calls made while a save is pending coalesce into that single write
+        (the data is serialized when the timer fires), so bursts of set()
+        calls cost one dict update each on the calling thread.
+        """
+        with self._lock:
+            if self._timer is not None:
+                return
+            self._timer = threading.Timer(self._save_delay or 0.0, self._on_timer)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _on_timer(self):
+        """Background timer callback: write pending changes."""
+        with self._lock:
+            self._timer = None
+            if not self._dirty:
+                return
+        self._write()
+
+    def flush(self):
+        """Write pending changes now (e.g. before shutdown)."""
+        if self._dirty:
+            self.save()
+        else:
+            self._cancel_timer()
+
+    def _cancel_timer(self):
+        with self._lock:
+            timer, self._timer = self._timer, None
+        if timer is not None:
+            timer.cancel()
+
+    def _write(self):
+        """Serialize and atomically replace the settings file.
+
+        Returns:
+            bool: True on success
+        """
+        # Snapshot and replace under one write lock: a debounced write of an
+        # older snapshot can never land after a newer save()/flush()
+        with self._write_lock:
+            with self._lock:
+                text = json.dumps(self._data, indent=2, ensure_ascii=False)
+                self._dirty = False
+
+            tmp_path = None
+            try:
+                # Ensure directory exists
+                self._file_path.parent.mkdir(parents=True, exist_ok=True)
+
+                fd, tmp_path = tempfile.mkstemp(
+                    prefix=self._file_path.name + ".", suffix=".tmp", dir=str(self._file_path.parent)
+                )
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    f.write(text)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self._file_path)
+                return True
+            except (IOError, OSError) as e:
+                print(f"[Settings] Error saving settings: {e}")
+                with self._lock:
+                    self._dirty = True
+                if tmp_path and os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                return False
+
 
+@atexit.register
+def _flush_all():
+    """Write pending debounced changes before the interpreter exits."""
+    for settings in list(_live_instances):
+        settings.flush()
@@ -0,0 +1,224 @@
+"""StateJournal - append-only on-disk log for StateStore persistence."""
+import atexit
+import json
+import os
+import tempfile
+import weakref
+from pathlib import Path
+from urllib.parse import quote, unquote
+
+from hub.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+_SUFFIX = ".jsonl"
+_LOCK_NAME = ".lock"
+
+# Journals with open log files, closed at interpreter exit
+_live_journals = weakref.WeakSet()
+
+
+def default_state_dir():
+    """Default journal directory (~/.studio_name/maya_tools_hub/session_state)."""
+    return Path.home() / ".studio_name" / "maya_tools_hub" / "session_state"
+
+
+def namespace_of(key):
+    """Get the journal namespace of a state key (its first dot component)."""
+    return key.partition(".")[0]
+
+
+class StateJournal:
+    """Append-only, compacting log of StateStore changes.
+
+    Each namespace has its own JSON-lines file. A record is ``[key, value]``
+    for a write or ``[key]`` for a delete, so a change costs one appended
+    line. When a log grows well past the number of live keys it is rewritten
+    (compacted) atomically. A torn last line from a crash is ignored on load.
+
+    Only one process may write a journal directory: call lock() first (Maya
+    sessions share the default directory; the OS releases the lock if the
+    session dies).
+    """
+
+    def __init__(self, directory, compact_ratio=4, min_compact=256):
+        """Initialize journal.
+
+        Args:
+            directory: Directory holding the per-namespace log files
+            compact_ratio: Compact when records > compact_ratio * live keys
+            min_compact: Never compact logs shorter than this many records
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.compact_ratio = compact_ratio
+        self.min_compact = min_compact
+        self._records = {}  # namespace -> record count in its log
+        self._next_check = {}  # namespace -> record count at which to re-check compaction
+        self._files = {}  # namespace -> open append handle
+        self._lock_file = None
+        self._closed = False
+        _live_journals.add(self)
+
+    def _path(self, namespace):
+        return self.directory / (quote(namespace, safe="") + _SUFFIX)
+
+    def lock(self):
+        """Take the directory's inter-process lock.
+
+        Returns:
+            bool: True if this journal now owns the directory, False if
+            another session holds it
+        """
+        if self._lock_file is not None:
+            return True
+        f = open(self.directory / _LOCK_NAME, "a+")
+        try:
+            _lock(f)
+        except OSError:
+            f.close()
+            return False
+        self._lock_file = f
+        return True
+
+    def namespaces(self):
+        """List namespaces with a log on disk."""
+        return [unquote(p.name[:-len(_SUFFIX)]) for p in self.directory.glob("*" + _SUFFIX)]
+
+    def load(self, namespace):
+        """Replay a namespace log.
+
+        Args:
+            namespace: Namespace name
+
+        Returns:
+            Dict of key -> value
+        """
+        data = {}
+        count = 0
+        path = self._path(namespace)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        logger.warning(f"Skipping corrupt state record in {path.name}")
+                        continue
+                    count += 1
+                    if len(record) == 2:
+                        data[record[0]] = record[1]
+                    else:
+                        data.pop(record[0], None)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.error(f"Error reading state journal {path}: {e}")
+        self._records[namespace] = count
+        logger.debug(f"Restored {len(data)} state key(s) for namespace '{namespace}'")
+        return data
+
+    def append(self, namespace, changes, live_count):
+        """Append changes to a namespace log.
+
+        Args:
+            namespace: Namespace name
+            changes: Iterable of (key, value, deleted) tuples
+            live_count: Callable returning the number of live keys in the
+                namespace; only called when the log has grown enough to be
+                worth compacting, so appends stay O(size of change)
+
+        Returns:
+            bool: True if the log should be compacted
+        """
+        lines = []
+        for key, value, deleted in changes:
+            try:
+                lines.append(json.dumps([key] if deleted else [key, value], ensure_ascii=False))
+            except (TypeError, ValueError):
+                logger.warning(f"State key '{key}' is not JSON-serializable, not persisted")
+        if not lines or self._closed:
+            return False
+        f = self._files.get(namespace)
+        try:
+            if f is None:
+                f = self._files[namespace] = open(self._path(namespace), "a", encoding="utf-8")
+            f.write("\n".join(lines) + "\n")
+            f.flush()
+        except OSError as e:
+            logger.error(f"Error writing state journal for '{namespace}': {e}")
+            return False
+        count = self._records.get(namespace, 0) + len(lines)
+        self._records[namespace] = count
+        if count < self._next_check.get(namespace, self.min_compact):
+            return False
+        limit = self.compact_ratio * live_count()
+        if count > limit:
+            return True
+        self._next_check[namespace] = max(self.min_compact, limit)
+        return False
+
+    def compact(self, namespace, data):
+        """Atomically rewrite a namespace log with only the live keys.
+
+        Args:
+            namespace: Namespace name
+            data: Dict of live key -> value
+        """
+        f = self._files.pop(namespace, None)
+        if f is not None:
+            f.close()
+        path = self._path(namespace)
+        lines = []
+        for key, value in data.items():
+            try:
+                lines.append(json.dumps([key, value], ensure_ascii=False))
+            except (TypeError, ValueError):
+                continue
+        fd, tmp_path = tempfile.mkstemp(prefix=path.name + ".", suffix=".tmp", dir=str(self.directory))
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as tmp:
+                tmp.write("".join(line + "\n" for line in lines))
+                tmp.flush()
+                os.fsync(tmp.fileno())
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.error(f"Error compacting state journal for '{namespace}': {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+        self._records[namespace] = len(lines)
+        self._next_check[namespace] = max(self.min_compact, self.compact_ratio * len(lines))
+        logger.debug(f"Compacted state journal '{namespace}' to {len(lines)} record(s)")
+
+    def close(self):
+        """Close open log files and release the directory lock.
+
+        Later appends are ignored.
+        """
+        self._closed = True
+        for f in self._files.values():
+            f.close()
+        self._files.clear()
+        if self._lock_file is not None:
+            self._lock_file.close()
+            self._lock_file = None
+
+
+def _lock(f):
+    """Take a non-blocking exclusive lock on an open file (OSError if held)."""
+    try:
+        import msvcrt
+    except ImportError:
+        import fcntl
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    else:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+
+
+@atexit.register
+def _close_all():
+    """Close journal files before the interpreter exits."""
+    for journal in list(_live_journals):
+        journal.close()
@@ -1,11 +1,327 @@
 """StateStore - in-memory session state container."""
+from collections.abc import Mapping, MutableMapping
+from contextlib import contextmanager
 
+from hub.core.logging import get_logger
+from hub.core.state_journal import namespace_of
 
-class StateStore(dict):
+logger = get_logger(__name__)
+
+_MISSING = object()
+
+# Re-assigning the same object of these types is a no-op; a mutable value
+# (list, dict, ...) may have been changed in place, so it is re-published
+_IMMUTABLE = (str, int, float, bool, bytes, type(None), tuple, frozenset)
+
+
+class StateStore(MutableMapping):
     """In-memory session state container.
-    
-    Inherits from dict to provide dictionary-like interface.
-    State is not persisted and only exists during the current session.
+
+    Provides a dictionary-like interface over flat dot-keys
+    (e.g. "poly.smooth_normals.last_angle"), plus:
+    - per-key and per-prefix change subscriptions
+    - transactions that fire one notification per changed key on commit
+    - copy-on-write snapshots (O(1) to take, the store copies on next write)
+    - namespaced views (store.namespace("poly.smooth_normals")["last_angle"])
+
+    Without a journal, state only exists during the current session. With a
+    StateJournal, every change is appended to disk and the previous session
+    is restored lazily, one namespace (first key component) at a time, on
+    first access. Iterating or taking len() restores every namespace.
     """
-    pass
 
+    def __init__(self, initial=None, journal=None):
+        """Initialize store.
+
+        Args:
+            initial: Optional mapping of initial values
+            journal: Optional StateJournal for on-disk persistence
+        """
+        self._data = dict(initial or {})
+        self._journal = journal
+        self._loaded = set()  # namespaces already restored from the journal
+        self._shared = False  # True while a snapshot references _data
+        self._key_subscribers = {}  # key -> [callback]
+        self._prefix_subscribers = []  # [(prefix, callback)]
+        self._txn_depth = 0
+        self._pending = {}  # key -> old value, collected during a transaction
+
+    @classmethod
+    def from_snapshot(cls, snapshot, journal=None):
+        """Create a store adopting a snapshot without copying it.
+
+        Used to carry state across reload_hub(): the new store shares the
+        snapshot's dict until its first write.
+
+        Args:
+            snapshot: Mapping returned by snapshot()
+            journal: Optional StateJournal for on-disk persistence
+        """
+        store = cls(journal=journal)
+        data = getattr(snapshot, "_hub_data", None)
+        if data is None:
+            data = dict(snapshot)
+        store._data = data
+        store._shared = True
+        return store
+
+    # ---- persistence ----
+
+    @property
+    def journal(self):
+        """Attached StateJournal, or None."""
+        return self._journal
+
+    def attach_journal(self, journal):
+        """Persist this store through a journal from now on.
+
+        Keys already in memory win over the journal when a namespace is
+        restored.
+
+        Args:
+            journal: StateJournal, or None to stop persisting
+        """
+        self._journal = journal
+        self._loaded = set()
+
+    def _restore(self, key):
+        """Restore the namespace of key from the journal, once."""
+        namespace = namespace_of(key)
+        if namespace not in self._loaded:
+            self._restore_namespace(namespace)
+
+    def _restore_namespace(self, namespace):
+        self._loaded.add(namespace)
+        restored = self._journal.load(namespace)
+        if restored:
+            data = self._writable()
+            for key, value in restored.items():
+                data.setdefault(key, value)
+
+    def _restore_all(self):
+        for namespace in self._journal.namespaces():
+            if namespace not in self._loaded:
+                self._restore_namespace(namespace)
+
+    def _persist(self, keys):
+        """Append the current value of changed keys to the journal."""
+        by_namespace = {}
+        for key in keys:
+            value = self._data.get(key, _MISSING)
+            deleted = value is _MISSING
+            by_namespace.setdefault(namespace_of(key), []).append(
+                (key, None if deleted else value, deleted)
+            )
+        for namespace, changes in by_namespace.items():
+            if self._journal.append(namespace, changes, lambda: len(self._namespace_data(namespace))):
+                self._journal.compact(namespace, self._namespace_data(namespace))
+
+    def _namespace_data(self, namespace):
+        return {key: value for key, value in self._data.items() if namespace_of(key) == namespace}
+
+    # ---- mapping interface ----
+
+    def __getitem__(self, key):
+        if self._journal is not None:
+            self._restore(key)
+        return self._data[key]
+
+    def get(self, key, default=None):
+        if self._journal is not None:
+            self._restore(key)
+        return self._data.get(key, default)
+
+    def __contains__(self, key):
+        if self._journal is not None:
+            self._restore(key)
+        return key in self._data
+
+    def __iter__(self):
+        if self._journal is not None:
+            self._restore_all()
+        return iter(self._data)
+
+    def __len__(self):
+        if self._journal is not None:
+            self._restore_all()
+        return len(self._data)
+
+    def __setitem__(self, key, value):
+        if self._journal is not None:
+            self._restore(key)
+        old = self._data.get(key, _MISSING)
+        if old is value and isinstance(value, _IMMUTABLE):
+            return
+        self._writable()[key] = value
+        self._changed(key, old)
+
+    def __delitem__(self, key):
+        if self._journal is not None:
+            self._restore(key)
+        old = self._data[key]
+        del self._writable()[key]
+        self._changed(key, old)
+
+    def __repr__(self):
+        return f"StateStore({self._data!r})"
+
+    def _writable(self):
+        """Get the dict for writing, copying it first if a snapshot shares it."""
+        if self._shared:
+            self._data = dict(self._data)
+            self._shared = False
+        return self._data
+
+    # ---- snapshots ----
+
+    def snapshot(self):
+        """Take a read-only, copy-on-write snapshot of the current state.
+
+        Returns:
+            Read-only mapping that never changes after it is taken
+        """
+        self._shared = True
+        return _Snapshot(self._data)
+
+    # ---- subscriptions ----
+
+    def subscribe(self, key, callback):
+        """Subscribe to changes of a single key.
+
+        Args:
+            key: State key
+            callback: Callable(key, value, old_value); value/old_value are
+                None when the key is missing
+        """
+        self._key_subscribers.setdefault(key, []).append(callback)
+
+    def subscribe_prefix(self, prefix, callback):
+        """Subscribe to changes of every key starting with prefix.
+
+        Args:
+            prefix: Key prefix (e.g. "poly." or "poly.smooth_normals")
+            callback: Callable(key, value, old_value)
+        """
+        self._prefix_subscribers.append((prefix, callback))
+
+    def unsubscribe(self, callback):
+        """Remove a callback from all key and prefix subscriptions."""
+        for callbacks in self._key_subscribers.values():
+            while callback in callbacks:
+                callbacks.remove(callback)
+        self._prefix_subscribers = [
+            (prefix, cb) for prefix, cb in self._prefix_subscribers if cb != callback
+        ]
+
+    def _changed(self, key, old):
+        if self._txn_depth:
+            # Keep the value from before the transaction started
+            self._pending.setdefault(key, old)
+            return
+        if self._journal is not None:
+            self._persist((key,))
+        self._notify(key, old)
+
+    def _notify(self, key, old):
+        value = self._data.get(key)
+        old = None if old is _MISSING else old
+        for callback in self._key_subscribers.get(key, ()):
+            self._call(callback, key, value, old)
+        for prefix, callback in self._prefix_subscribers:
+            if key.startswith(prefix):
+                self._call(callback, key, value, old)
+
+    @staticmethod
+    def _call(callback, key, value, old):
+        try:
+            callback(key, value, old)
+        except Exception as e:
+            logger.error(f"Error in state subscriber for '{key}': {e}", exc_info=True)
+
+    # ---- transactions ----
+
+    @contextmanager
+    def transaction(self):
+        """Batch writes; subscribers are notified once per changed key on commit.
+
+        Nested transactions commit with the outermost one. Keys whose final
+        value equals their value before the transaction are not notified
+        (nor journaled).
+        """
+        self._txn_depth += 1
+        try:
+            yield self
+        finally:
+            self._txn_depth -= 1
+            if self._txn_depth == 0:
+                pending, self._pending = self._pending, {}
+                changed = [key for key, old in pending.items() if self._data.get(key, _MISSING) != old]
+                if changed and self._journal is not None:
+                    self._persist(changed)
+                for key in changed:
+                    self._notify(key, pending[key])
+
+    # ---- namespaces ----
+
+    def namespace(self, name):
+        """Get a view whose keys are relative to a namespace.
+
+        Args:
+            name: Namespace (e.g. "poly.smooth_normals")
+
+        Returns:
+            StateNamespace view
+        """
+        return StateNamespace(self, name)
+
+
+class _Snapshot(Mapping):
+    """Read-only mapping over a dict the store will no longer mutate."""
+
+    __slots__ = ("_hub_data",)
+
+    def __init__(self, data):
+        self._hub_data = data
+
+    def __getitem__(self, key):
+        return self._hub_data[key]
+
+    def __iter__(self):
+        return iter(self._hub_data)
+
+    def __len__(self):
+        return len(self._hub_data)
+
+    def __repr__(self):
+        return f"StateSnapshot({self._hub_data!r})"
+
+
+class StateNamespace(MutableMapping):
+    """Mapping view of the keys under one StateStore namespace."""
+
+    def __init__(self, store, name):
+        self._store = store
+        self._prefix = name.rstrip(".") + "."
+
+    def __getitem__(self, key):
+        return self._store[self._prefix + key]
+
+    def get(self, key, default=None):
+        return self._store.get(self._prefix + key, default)
+
+    def __setitem__(self, key, value):
+        self._store[self._prefix + key] = value
+
+    def __delitem__(self, key):
+        del self._store[self._prefix + key]
+
+    def __iter__(self):
+        n = len(self._prefix)
+        return (key[n:] for key in list(self._store) if key.startswith(self._prefix))
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def subscribe(self, callback):
+        """Subscribe to changes of any key in this namespace."""
+        self._store.subscribe_prefix(self._prefix, callback)
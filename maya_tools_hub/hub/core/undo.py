@@ -1,32 +1,183 @@
 """Undo - DCC undo chunk integration."""
+import time
+from collections import deque, namedtuple
 from contextlib import contextmanager
 
+from hub.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Timing record for a completed outermost transaction
+TransactionRecord = namedtuple("TransactionRecord", "label duration nested suspended")
+
+
+class UndoTransactionManager:
+    """Undo transaction manager shared by a DCC facade.
+
+    Nested transactions collapse into the outermost one, so only a single
+    undo chunk is opened/closed in the DCC no matter how deep tools nest.
+    Undo recording can be suspended for bulk operations, with an optional
+    single compensating undo record registered instead.
+
+    Transactions are main-thread only (DCC undo queues are not thread-safe).
+    """
+
+    def __init__(self, open_chunk, close_chunk, suspend=None, resume=None, record=None,
+                 history_size=100):
+        """Initialize transaction manager with backend hooks.
+
+        Args:
+            open_chunk: Callable(label) opening a DCC undo chunk
+            close_chunk: Callable() closing the current DCC undo chunk
+            suspend: Optional callable() turning undo recording off
+            resume: Optional callable() turning undo recording back on
+            record: Optional callable(label, undo_fn) pushing a custom undo record
+            history_size: Number of timing records to keep
+        """
+        self._open_chunk = open_chunk
+        self._close_chunk = close_chunk
+        self._suspend = suspend
+        self._resume = resume
+        self._record = record
+        self._depth = 0
+        self._label = None
+        self._start = 0.0
+        self._nested = 0
+        self._suspended = False
+        self._suspend_depth = 0
+        self._chunk_open = False
+        self.history = deque(maxlen=history_size)
+
+    @property
+    def depth(self):
+        """Current transaction nesting depth (0 = no open transaction)."""
+        return self._depth
+
+    @contextmanager
+    def transaction(self, label, suspend_undo=False, compensate=None):
+        """Context manager for an undo transaction.
+
+        Args:
+            label: Undo chunk label (only the outermost label is used)
+            suspend_undo: Turn undo recording off for the body (bulk operations)
+            compensate: Optional callable registered as one undo record
+                when suspend_undo is set (reverts the whole bulk operation)
+
+        Example:
+            with dcc.transaction("BatchSmooth"):
+                for key in keys:
+                    cmd_bus.dispatch("tool.execute", key=key)
+        """
+        can_suspend = suspend_undo and self._suspend is not None
+        outermost = self._depth == 0
+        if outermost:
+            self._label = label
+            self._start = time.perf_counter()
+            self._nested = 0
+            self._suspended = False
+            # Without a suspend hook a bulk operation still gets one chunk
+            self._chunk_open = not can_suspend
+            if self._chunk_open:
+                self._open_chunk(label)
+        else:
+            self._nested += 1
+        self._depth += 1
+
+        # Only the outermost suspending level turns recording off and back
+        # on, so nested bulk operations don't resume it early
+        suspending = can_suspend and self._suspend_depth == 0
+        if can_suspend:
+            self._suspend_depth += 1
+        if suspending:
+            self._suspend()
+            self._suspended = True
+        try:
+            yield
+        finally:
+            if can_suspend:
+                self._suspend_depth -= 1
+            if suspending:
+                self._resume()
+                if compensate is not None:
+                    if self._record is not None:
+                        self._record(label, compensate)
+                    else:
+                        logger.warning(f"Backend cannot register compensating undo for '{label}'")
+            elif compensate is not None and can_suspend:
+                logger.debug(f"Compensating undo for '{label}' covered by the enclosing suspended transaction")
+            self._depth -= 1
+            if outermost:
+                if self._chunk_open:
+                    self._chunk_open = False
+                    self._close_chunk()
+                record = TransactionRecord(
+                    self._label, time.perf_counter() - self._start, self._nested, self._suspended
+                )
+                self.history.append(record)
+                logger.debug(
+                    f"Undo transaction '{record.label}' took {record.duration * 1000:.2f} ms "
+                    f"({record.nested} nested, suspended={record.suspended})"
+                )
+
+    def stats(self):
+        """Summarize recorded transaction timings.
+
+        Returns:
+            Dict with count, total and max duration (seconds) per label
+        """
+        summary = {}
+        for record in self.history:
+            entry = summary.setdefault(record.label, {"count": 0, "total": 0.0, "max": 0.0})
+            entry["count"] += 1
+            entry["total"] += record.duration
+            entry["max"] = max(entry["max"], record.duration)
+        return summary
+
+
+_maya_manager = None
+
+
+def get_maya_transaction_manager():
+    """Get the shared Maya undo transaction manager.
+
+    Returns:
+        UndoTransactionManager, or None when not running in Maya
+    """
+    global _maya_manager
+    if _maya_manager is None:
+        try:
+            import maya.cmds as cmds
+        except ImportError:
+            return None
+        _maya_manager = UndoTransactionManager(
+            open_chunk=lambda label: cmds.undoInfo(openChunk=True, chunkName=label),
+            close_chunk=lambda: cmds.undoInfo(closeChunk=True),
+            suspend=lambda: cmds.undoInfo(stateWithoutFlush=False),
+            resume=lambda: cmds.undoInfo(stateWithoutFlush=True),
+        )
+    return _maya_manager
+
 
 @contextmanager
 def maya_undo_chunk(label):
     """Context manager for Maya undo chunk.
-    
+
     Opens an undo chunk when entering the context and closes it when exiting.
+    Nested calls collapse into the outermost chunk.
     Safe to import and use even when not running in Maya (will be a no-op).
-    
+
     Args:
         label: Name for the undo chunk
-        
+
     Example:
         with maya_undo_chunk("MyOperation"):
             cmds.polyCube()
             cmds.move(1, 0, 0)
     """
-    try:
-        import maya.cmds as cmds
-        # Open undo chunk
-        cmds.undoInfo(openChunk=True, chunkName=label)
-        try:
-            yield
-        finally:
-            # Close undo chunk
-            cmds.undoInfo(closeChunk=True)
-    except ImportError:
+    manager = get_maya_transaction_manager()
+    if manager is None:
         # Not in Maya environment - no-op
         yield
-
+        return
+    with manager.transaction(label):
+        yield
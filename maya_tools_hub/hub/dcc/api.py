@@ -29,6 +29,73 @@ class DCCFacade(ABC):
         """
         pass
 
+    @contextmanager
+    def transaction(self, label: str, suspend_undo: bool = False, compensate=None):
+        """Context manager grouping several operations into one undo step.
+        
+        Backends with a transaction manager collapse nested transactions into
+        the outermost one; the default simply opens an undo chunk.
+        
+        Args:
+            label: Label for the undo step.
+            suspend_undo: Turn undo recording off for bulk operations.
+            compensate: Optional callable registered as a single undo record
+                when undo is suspended.
+            
+        Yields:
+            None (used as context manager).
+        """
+        with self.undo_chunk(label):
+            yield
+
+    def scene_fingerprint(self):
+        """Get a cheap fingerprint of the scene and selection state.
+        
+        The value changes whenever the scene or selection may have changed,
+        and is used to key memoized tool results.
+        
+        Returns:
+            Hashable value, or None if the backend cannot track changes
+            (memoization is then disabled).
+        """
+        return None
+
+    def shutdown(self) -> None:
+        """Release backend resources (e.g. DCC event callbacks).
+        
+        Called when the facade is replaced (hub run()/reload) or the core
+        shuts down. The default does nothing.
+        """
+        pass
+
+    def open_scene(self, path: str) -> None:
+        """Open a scene file, discarding the current scene.
+        
+        Used by headless batch runs; interactive backends may leave it
+        unimplemented.
+        
+        Args:
+            path: Scene file path.
+            
+        Raises:
+            NotImplementedError: Backend cannot open scenes.
+        """
+        raise NotImplementedError(f"{type(self).__name__} cannot open scenes")
+
+    def save_scene(self, path: Optional[str] = None) -> str:
+        """Save the current scene.
+        
+        Args:
+            path: Save under this path (default: the opened file).
+            
+        Returns:
+            Path the scene was saved to.
+            
+        Raises:
+            NotImplementedError: Backend cannot save scenes.
+        """
+        raise NotImplementedError(f"{type(self).__name__} cannot save scenes")
+
     @abstractmethod
     def show_message(self, text: str, level: str = "info") -> None:
         """Display a message to the user in DCC.
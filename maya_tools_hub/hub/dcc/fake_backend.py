@@ -0,0 +1,664 @@
+"""Fake (headless) backend implementation of DCCFacade.
+
+Provides an in-memory scene graph so the hub pipeline and plugins can be run
+and timed outside a licensed Maya session (e.g. on a Linux CI box).
+"""
+import json
+import math
+import sys
+import types
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+from hub.core.logging import get_logger
+from hub.core.undo import UndoTransactionManager
+from hub.dcc.api import DCCFacade
+
+logger = get_logger(__name__)
+
+
+class FakeMesh:
+    """Polygon mesh data with real topology (points, faces, derived edges)."""
+
+    def __init__(self, points, faces):
+        """Initialize mesh.
+
+        Args:
+            points: List of (x, y, z) tuples
+            faces: List of vertex index tuples (counter-clockwise winding)
+        """
+        self.points = [tuple(p) for p in points]
+        self.faces = [tuple(f) for f in faces]
+        self.soft_edges = set()  # edge indices marked soft
+        self._edges = None
+        self._edge_faces = None
+
+    def edges(self):
+        """Get edge list as sorted vertex index pairs.
+
+        Returns:
+            List of (v0, v1) tuples, index in list is the edge id
+        """
+        if self._edges is None:
+            self._build_edges()
+        return self._edges
+
+    def _build_edges(self):
+        """Build edge list and edge -> adjacent faces map."""
+        edge_ids = {}
+        edges = []
+        edge_faces = []
+        for face_index, face in enumerate(self.faces):
+            for i, v0 in enumerate(face):
+                v1 = face[(i + 1) % len(face)]
+                edge = (v0, v1) if v0 < v1 else (v1, v0)
+                edge_id = edge_ids.get(edge)
+                if edge_id is None:
+                    edge_id = edge_ids[edge] = len(edges)
+                    edges.append(edge)
+                    edge_faces.append([])
+                edge_faces[edge_id].append(face_index)
+        self._edges = edges
+        self._edge_faces = edge_faces
+
+    def face_normal(self, face_index):
+        """Compute unit face normal using Newell's method.
+
+        Args:
+            face_index: Face index
+
+        Returns:
+            (x, y, z) tuple
+        """
+        face = self.faces[face_index]
+        nx = ny = nz = 0.0
+        for i, vi in enumerate(face):
+            x0, y0, z0 = self.points[vi]
+            x1, y1, z1 = self.points[face[(i + 1) % len(face)]]
+            nx += (y0 - y1) * (z0 + z1)
+            ny += (z0 - z1) * (x0 + x1)
+            nz += (x0 - x1) * (y0 + y1)
+        length = math.sqrt(nx * nx + ny * ny + nz * nz) or 1.0
+        return (nx / length, ny / length, nz / length)
+
+    def soften_edges(self, edge_ids, angle):
+        """Mark edges soft where adjacent faces meet below an angle.
+
+        Mirrors Maya's polySoftEdge: the angle is in degrees, border edges
+        are left unchanged.
+
+        Args:
+            edge_ids: Iterable of edge indices to process
+            angle: Threshold angle in degrees
+
+        Returns:
+            Previous soft edge set (for undo)
+        """
+        self.edges()
+        previous = set(self.soft_edges)
+        normals = {}
+        for edge_id in edge_ids:
+            faces = self._edge_faces[edge_id]
+            if len(faces) != 2:
+                continue
+            for f in faces:
+                if f not in normals:
+                    normals[f] = self.face_normal(f)
+            a, b = normals[faces[0]], normals[faces[1]]
+            dot = max(-1.0, min(1.0, a[0] * b[0] + a[1] * b[1] + a[2] * b[2]))
+            if math.degrees(math.acos(dot)) <= angle:
+                self.soft_edges.add(edge_id)
+            else:
+                self.soft_edges.discard(edge_id)
+        return previous
+
+
+class FakeNode:
+    """Scene node (transform or mesh shape)."""
+
+    def __init__(self, path, node_type, parent=None, mesh=None):
+        """Initialize node.
+
+        Args:
+            path: Full DAG path (e.g. "|pCube1|pCubeShape1")
+            node_type: "transform" or "mesh"
+            parent: Parent full path or None
+            mesh: FakeMesh for mesh shapes
+        """
+        self.path = path
+        self.type = node_type
+        self.parent = parent
+        self.mesh = mesh
+        self.children = []
+
+
+class FakeScene:
+    """In-memory scene graph with selection, undo stack and message log."""
+
+    def __init__(self):
+        """Initialize empty scene."""
+        self.nodes: Dict[str, FakeNode] = {}
+        self.selection: List[str] = []
+        self.messages = []  # list of (level, text)
+        self.undo_stack = []  # list of (label, [undo_fn, ...])
+        self.revision = 0  # incremented on every mutation
+        self.undo_enabled = True
+        self._open_chunks = []  # stack of (label, ops)
+
+    # ---- undo ----
+
+    def _record(self, label, undo_fn):
+        """Record an undoable operation.
+
+        Operations recorded while a chunk is open are grouped into it,
+        otherwise each operation becomes its own undo step (like Maya).
+        """
+        self.revision += 1
+        if not self.undo_enabled:
+            return
+        if self._open_chunks:
+            self._open_chunks[-1][1].append(undo_fn)
+        else:
+            self.undo_stack.append((label, [undo_fn]))
+
+    def record_undo(self, label, undo_fn):
+        """Push a custom undo step (e.g. a compensating record after bulk edits)."""
+        if self._open_chunks:
+            self._open_chunks[-1][1].append(undo_fn)
+        else:
+            self.undo_stack.append((label, [undo_fn]))
+
+    def open_chunk(self, label):
+        """Open an undo chunk (chunks may nest, inner ones merge into outer)."""
+        self._open_chunks.append((label, []))
+
+    def close_chunk(self):
+        """Close the innermost open undo chunk."""
+        if not self._open_chunks:
+            logger.warning("close_chunk() called without an open chunk")
+            return
+        label, ops = self._open_chunks.pop()
+        if not ops:
+            return
+        if self._open_chunks:
+            self._open_chunks[-1][1].extend(ops)
+        else:
+            self.undo_stack.append((label, ops))
+
+    @contextmanager
+    def undo_chunk(self, label):
+        """Context manager grouping operations into one undo step."""
+        self.open_chunk(label)
+        try:
+            yield
+        finally:
+            self.close_chunk()
+
+    def undo(self):
+        """Undo the last undo step.
+
+        Returns:
+            Label of the undone step, or None if the stack is empty
+        """
+        if not self.undo_stack:
+            return None
+        label, ops = self.undo_stack.pop()
+        for undo_fn in reversed(ops):
+            undo_fn()
+        self.revision += 1
+        return label
+
+    # ---- nodes ----
+
+    def _unique_path(self, name, parent=None):
+        """Build a unique full path for a new node."""
+        base = f"{parent or ''}|{name}"
+        path = base
+        index = 1
+        while path in self.nodes:
+            index += 1
+            path = f"{base}{index}"
+        return path
+
+    def _add_node(self, node):
+        self.nodes[node.path] = node
+        if node.parent:
+            self.nodes[node.parent].children.append(node.path)
+
+    def _remove_node(self, path):
+        node = self.nodes.pop(path)
+        if node.parent and node.parent in self.nodes:
+            self.nodes[node.parent].children.remove(path)
+        return node
+
+    def create_transform(self, name, parent=None):
+        """Create a transform node.
+
+        Returns:
+            Full path of the new node
+        """
+        path = self._unique_path(name, parent)
+        self._add_node(FakeNode(path, "transform", parent))
+        self._record("createNode", lambda: self._remove_node(path))
+        return path
+
+    def create_mesh(self, name, points, faces):
+        """Create a transform with a mesh shape child.
+
+        Returns:
+            Full path of the transform
+        """
+        with self.undo_chunk("createMesh"):
+            transform = self.create_transform(name)
+            short = transform.rsplit("|", 1)[-1]
+            shape = f"{transform}|{short}Shape"
+            self._add_node(FakeNode(shape, "mesh", transform, FakeMesh(points, faces)))
+            self._record("createNode", lambda: self._remove_node(shape))
+        return transform
+
+    def create_poly_cube(self, name="pCube", size=1.0):
+        """Create a cube mesh (8 points, 6 quads)."""
+        h = size / 2.0
+        points = [(x, y, z) for x in (-h, h) for y in (-h, h) for z in (-h, h)]
+        faces = [(0, 1, 3, 2), (4, 6, 7, 5), (0, 4, 5, 1),
+                 (2, 3, 7, 6), (0, 2, 6, 4), (1, 5, 7, 3)]
+        return self.create_mesh(name, points, faces)
+
+    def create_poly_grid(self, name="pPlane", subdivisions=10, size=1.0, wave=0.0):
+        """Create a subdivided grid mesh, optionally displaced by a sine wave.
+
+        Args:
+            name: Node name
+            subdivisions: Quads per side (face count is subdivisions ** 2)
+            size: Grid width
+            wave: Height displacement amplitude (gives varying edge angles)
+        """
+        n = subdivisions
+        step = size / n
+        points = []
+        for j in range(n + 1):
+            for i in range(n + 1):
+                x, z = i * step, j * step
+                points.append((x, wave * math.sin(x * 7.0) * math.cos(z * 5.0), z))
+        faces = []
+        for j in range(n):
+            for i in range(n):
+                a = j * (n + 1) + i
+                faces.append((a, a + n + 1, a + n + 2, a + 1))
+        return self.create_mesh(name, points, faces)
+
+    def delete(self, path):
+        """Delete a node and its descendants."""
+        removed = []
+
+        def _collect(p):
+            for child in list(self.nodes[p].children):
+                _collect(child)
+            removed.append(self._remove_node(p))
+
+        _collect(path)
+        self.selection = [p for p in self.selection if p in self.nodes]
+
+        def _restore():
+            for node in reversed(removed):
+                node.children = []
+                self._add_node(node)
+
+        self._record("delete", _restore)
+
+    def shapes(self, path):
+        """List mesh shape children of a node."""
+        node = self.nodes.get(path)
+        if node is None:
+            return []
+        return [c for c in node.children if self.nodes[c].type == "mesh"]
+
+    def select(self, items, replace=True):
+        """Set (or extend) the selection.
+
+        Args:
+            items: Node paths or component strings (e.g. "|pCube1|pCubeShape1.e[0:11]")
+            replace: Replace current selection if True, else add to it
+        """
+        previous = list(self.selection)
+        current = [] if replace else list(self.selection)
+        for item in items:
+            if item not in current:
+                current.append(item)
+        self.selection = current
+        self._record("select", lambda: setattr(self, "selection", previous))
+
+    def log_message(self, text, level="info"):
+        """Append a user-facing message to the message log."""
+        self.messages.append((level, text))
+
+    # ---- files ----
+
+    def clear(self):
+        """Empty the scene (new scene): nodes, selection, undo and messages."""
+        self.nodes.clear()
+        self.selection = []
+        self.messages = []
+        self.undo_stack = []
+        self._open_chunks = []
+        self.undo_enabled = True
+        self.revision += 1
+
+    def load(self, data):
+        """Replace the scene with a saved or generated description.
+
+        Args:
+            data: Dict with "meshes" - each {"name", "points", "faces"},
+                {"name", "type": "cube", "size"} or {"name", "type": "grid",
+                "subdivisions", "size", "wave"} - and optional "selection"
+                (node names or paths)
+        """
+        self.clear()
+        undo_enabled, self.undo_enabled = self.undo_enabled, False
+        try:
+            names = {}
+            for entry in data.get("meshes", ()):
+                kind = entry.get("type", "mesh")
+                name = entry.get("name", "pMesh")
+                options = {k: v for k, v in entry.items() if k not in ("type", "name", "soft_edges")}
+                if kind == "cube":
+                    path = self.create_poly_cube(name, **options)
+                elif kind == "grid":
+                    path = self.create_poly_grid(name, **options)
+                else:
+                    path = self.create_mesh(name, entry["points"], entry["faces"])
+                if entry.get("soft_edges"):
+                    self.nodes[self.shapes(path)[0]].mesh.soft_edges = set(entry["soft_edges"])
+                names[name] = path
+            self.selection = [names.get(item, item) for item in data.get("selection", ())]
+        finally:
+            self.undo_enabled = undo_enabled
+        self.undo_stack = []
+        self.revision += 1
+
+    def dump(self):
+        """Describe the scene's meshes and selection (inverse of load())."""
+        meshes = []
+        for path, node in self.nodes.items():
+            if node.type != "mesh" or node.mesh is None:
+                continue
+            mesh = node.mesh
+            meshes.append({
+                "name": node.parent.rsplit("|", 1)[-1],
+                "points": [list(p) for p in mesh.points],
+                "faces": [list(f) for f in mesh.faces],
+                "soft_edges": sorted(mesh.soft_edges),
+            })
+        return {"meshes": meshes, "selection": list(self.selection)}
+
+
+def _flatten(items):
+    """Flatten cmds-style arguments (strings or lists of strings)."""
+    flat = []
+    for item in items:
+        flat.extend(item if isinstance(item, (list, tuple)) else [item])
+    return flat
+
+
+def _parse_edge_component(item):
+    """Parse "<mesh>.e[a:b]" or "<mesh>.e[a]" into (mesh_path, range)."""
+    path, _, comp = item.partition(".e[")
+    if not comp:
+        return item, None
+    comp = comp.rstrip("]")
+    if ":" in comp:
+        start, end = comp.split(":", 1)
+        return path, range(int(start), int(end) + 1)
+    return path, range(int(comp), int(comp) + 1)
+
+
+class FakeCmds:
+    """Subset of maya.cmds implemented on top of a FakeScene.
+
+    Covers the calls made by hub core and built-in plugins, so they run
+    unchanged when installed as ``maya.cmds``.
+    """
+
+    def __init__(self, scene: FakeScene):
+        self._scene = scene
+
+    def _resolve(self, name):
+        """Resolve a short or long node name to a full path."""
+        if name in self._scene.nodes:
+            return name
+        suffix = "|" + name.lstrip("|")
+        for path in self._scene.nodes:
+            if path.endswith(suffix):
+                return path
+        raise ValueError(f"No object matches name: {name}")
+
+    def ls(self, *items, sl=False, selection=False, l=False, long=False, type=None):
+        if sl or selection:
+            result = list(self._scene.selection)
+        elif items:
+            result = [self._resolve(i) for i in items]
+        else:
+            result = list(self._scene.nodes)
+        if type is not None:
+            result = [p for p in result if p in self._scene.nodes and self._scene.nodes[p].type == type]
+        if not (l or long):
+            result = [p.rsplit("|", 1)[-1] for p in result]
+        return result
+
+    def listRelatives(self, obj, shapes=False, fullPath=False, children=False):
+        path, _ = _parse_edge_component(obj)
+        node = self._scene.nodes.get(self._resolve(path))
+        if node is None:
+            return None
+        result = self._scene.shapes(node.path) if shapes else list(node.children)
+        if not fullPath:
+            result = [p.rsplit("|", 1)[-1] for p in result]
+        return result or None
+
+    def objectType(self, obj, isType=None):
+        path, _ = _parse_edge_component(obj)
+        node_type = self._scene.nodes[self._resolve(path)].type
+        if isType is not None:
+            return node_type == isType
+        return node_type
+
+    def select(self, *items, r=False, replace=False, add=False, clear=False, cl=False):
+        if clear or cl:
+            self._scene.select([], replace=True)
+            return
+        self._scene.select(_flatten(items), replace=not add)
+
+    def polyListComponentConversion(self, *items, te=False, toEdge=False):
+        result = []
+        for item in _flatten(items):
+            path = self._resolve(_parse_edge_component(item)[0])
+            node = self._scene.nodes[path]
+            if node.type != "mesh":
+                shapes = self._scene.shapes(path)
+                if not shapes:
+                    continue
+                node = self._scene.nodes[shapes[0]]
+            count = len(node.mesh.edges())
+            if count:
+                result.append(f"{node.path}.e[0:{count - 1}]")
+        return result
+
+    def polySoftEdge(self, *items, angle=180.0, a=None, constructionHistory=True, ch=None):
+        threshold = angle if a is None else a
+        targets = _flatten(items) or list(self._scene.selection)
+        changed = []
+        for item in targets:
+            path, edge_range = _parse_edge_component(item)
+            node = self._scene.nodes[self._resolve(path)]
+            if node.type != "mesh":
+                node = self._scene.nodes[self._scene.shapes(node.path)[0]]
+            mesh = node.mesh
+            edge_ids = edge_range if edge_range is not None else range(len(mesh.edges()))
+            previous = mesh.soften_edges(edge_ids, threshold)
+            self._scene._record("polySoftEdge", lambda m=mesh, s=previous: setattr(m, "soft_edges", s))
+            changed.append(f"polySoftEdge{len(changed) + 1}")
+        return changed
+
+    def polyCube(self, name="pCube1", w=1.0, width=None):
+        path = self._scene.create_poly_cube(name, width or w)
+        return [path.rsplit("|", 1)[-1], f"polyCube{len(self._scene.nodes)}"]
+
+    def delete(self, *items):
+        for item in items:
+            self._scene.delete(self._resolve(item))
+
+    def undoInfo(self, openChunk=False, closeChunk=False, chunkName=None, q=False, query=False,
+                 undoName=False, state=None, stateWithoutFlush=None, swf=None):
+        flag = next((v for v in (state, stateWithoutFlush, swf) if v is not None), None)
+        if flag is not None and not (q or query):
+            self._scene.undo_enabled = bool(flag)
+            if state is False:
+                self._scene.undo_stack.clear()
+        elif openChunk:
+            self._scene.open_chunk(chunkName or "")
+        elif closeChunk:
+            self._scene.close_chunk()
+        elif q or query:
+            if undoName:
+                return self._scene.undo_stack[-1][0] if self._scene.undo_stack else ""
+            return self._scene.undo_enabled
+        return None
+
+    def undo(self):
+        self._scene.undo()
+
+    def inViewMessage(self, amg="", **kwargs):
+        self._scene.log_message(amg, level="info")
+
+
+def install_fake_cmds(cmds: FakeCmds):
+    """Register a FakeCmds instance as the ``maya.cmds`` module.
+
+    Does nothing when a real Maya installation is importable.
+
+    Args:
+        cmds: FakeCmds instance
+
+    Returns:
+        True if installed, False if real Maya is present
+    """
+    existing = sys.modules.get("maya")
+    if existing is None:
+        try:
+            import maya.cmds  # noqa: F401
+            return False
+        except ImportError:
+            pass
+    elif not getattr(existing, "__hub_fake__", False):
+        return False
+
+    maya_module = types.ModuleType("maya")
+    maya_module.__hub_fake__ = True
+    maya_module.__path__ = []
+    cmds_module = types.ModuleType("maya.cmds")
+    for attr in dir(cmds):
+        if not attr.startswith("_"):
+            setattr(cmds_module, attr, getattr(cmds, attr))
+    maya_module.cmds = cmds_module
+    sys.modules["maya"] = maya_module
+    sys.modules["maya.cmds"] = cmds_module
+    logger.info("Installed fake maya.cmds module")
+    return True
+
+
+class FakeFacade(DCCFacade):
+    """Headless DCC facade backed by an in-memory FakeScene."""
+
+    name = "Fake"
+
+    def __init__(self, scene: Optional[FakeScene] = None):
+        """Initialize fake facade.
+
+        Args:
+            scene: FakeScene instance (default: new empty scene)
+        """
+        self.scene = scene or FakeScene()
+        self.scene_path = None
+        self.cmds = FakeCmds(self.scene)
+        self.transactions = UndoTransactionManager(
+            open_chunk=self.scene.open_chunk,
+            close_chunk=self.scene.close_chunk,
+            suspend=lambda: setattr(self.scene, "undo_enabled", False),
+            resume=lambda: setattr(self.scene, "undo_enabled", True),
+            record=self.scene.record_undo,
+        )
+
+    def install_cmds(self):
+        """Install this facade's scene as ``maya.cmds`` so plugins run unchanged."""
+        return install_fake_cmds(self.cmds)
+
+    def get_selection(self) -> List[str]:
+        """Get currently selected objects in the fake scene.
+
+        Returns:
+            List of selected object full paths.
+        """
+        return list(self.scene.selection)
+
+    def undo_chunk(self, label: str):
+        """Context manager for fake scene undo chunk operations.
+
+        Args:
+            label: Label for the undo chunk.
+        """
+        return self.transactions.transaction(label)
+
+    def transaction(self, label: str, suspend_undo: bool = False, compensate=None):
+        """Context manager for a fake scene undo transaction (nested calls collapse).
+
+        Args:
+            label: Label for the undo step.
+            suspend_undo: Turn undo recording off for bulk operations.
+            compensate: Optional callable pushed as a single undo record.
+        """
+        return self.transactions.transaction(label, suspend_undo=suspend_undo, compensate=compensate)
+
+    def scene_fingerprint(self):
+        """Get the fake scene revision (bumped by every scene/selection change).
+
+        Returns:
+            int revision counter
+        """
+        return self.scene.revision
+
+    def open_scene(self, path: str) -> None:
+        """Load a JSON scene description (see FakeScene.load).
+
+        Args:
+            path: JSON file path.
+        """
+        with open(path, "r", encoding="utf-8") as f:
+            self.scene.load(json.load(f))
+        self.scene_path = path
+
+    def save_scene(self, path: Optional[str] = None) -> str:
+        """Write the scene as JSON (see FakeScene.dump).
+
+        Args:
+            path: Save under this path (default: the opened file).
+
+        Returns:
+            Path the scene was saved to.
+        """
+        path = path or self.scene_path
+        if not path:
+            raise ValueError("Scene has no file path")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.scene.dump(), f)
+        self.scene_path = path
+        return path
+
+    def show_message(self, text: str, level: str = "info") -> None:
+        """Record a user message in the fake scene message log.
+
+        Args:
+            text: Message text to display.
+            level: Message level ("info", "warning", "error").
+        """
+        self.scene.log_message(text, level)
+        logger.debug(f"[{level.upper()}] {text}")
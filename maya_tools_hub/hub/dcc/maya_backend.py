@@ -1,16 +1,68 @@
 """Maya backend implementation of DCCFacade."""
 from contextlib import contextmanager
-from typing import List
+from typing import List, Optional
 
-from hub.core.undo import maya_undo_chunk
+from hub.core.undo import get_maya_transaction_manager, maya_undo_chunk
 from hub.dcc.api import DCCFacade
 
 
+# Maya events that may change the scene or selection (bump scene revision)
+_REVISION_EVENTS = (
+    "SelectionChanged", "Undo", "Redo", "DagObjectCreated", "NameChanged",
+    "SceneOpened", "NewSceneOpened", "SceneImported",
+)
+
+
 class MayaFacade(DCCFacade):
     """Maya implementation of DCC facade."""
 
     name = "Maya"
 
+    def __init__(self):
+        """Initialize Maya facade."""
+        self._revision = 0
+        self._callback_ids = None
+
+    def _on_scene_event(self, *args):
+        self._revision += 1
+
+    def scene_fingerprint(self):
+        """Get a scene revision counter driven by Maya event callbacks.
+        
+        Callbacks are installed on first use. The undo queue head is included
+        so attribute edits (which fire no global event) still change it.
+        
+        Returns:
+            Tuple fingerprint, or None when not running in Maya.
+        """
+        try:
+            import maya.cmds as cmds
+            import maya.api.OpenMaya as om
+        except ImportError:
+            return None
+        if self._callback_ids is None:
+            self._callback_ids = []
+            for event in _REVISION_EVENTS:
+                try:
+                    self._callback_ids.append(
+                        om.MEventMessage.addEventCallback(event, self._on_scene_event)
+                    )
+                except RuntimeError:
+                    pass  # event not available in this Maya version
+        return (self._revision, cmds.undoInfo(q=True, undoName=True))
+
+    def shutdown(self) -> None:
+        """Remove the Maya event callbacks installed by scene_fingerprint()."""
+        if not self._callback_ids:
+            self._callback_ids = None
+            return
+        try:
+            import maya.api.OpenMaya as om
+            om.MMessage.removeCallbacks(self._callback_ids)
+        except (ImportError, RuntimeError):
+            pass
+        self._callback_ids = None
+
     def get_selection(self) -> List[str]:
         """Get currently selected objects in Maya.
         
@@ -34,6 +86,49 @@ class MayaFacade(DCCFacade):
         with maya_undo_chunk(label):
             yield
 
+    @contextmanager
+    def transaction(self, label: str, suspend_undo: bool = False, compensate=None):
+        """Context manager for a Maya undo transaction (nested calls collapse).
+        
+        Args:
+            label: Label for the undo chunk.
+            suspend_undo: Turn undo recording off for bulk operations.
+            compensate: Compensating undo callable (Maya cannot register
+                Python undo records without a plugin command; logged only).
+        """
+        manager = get_maya_transaction_manager()
+        if manager is None:
+            yield
+            return
+        with manager.transaction(label, suspend_undo=suspend_undo, compensate=compensate):
+            yield
+
+    def open_scene(self, path: str) -> None:
+        """Open a Maya scene, discarding unsaved changes.
+        
+        Args:
+            path: .ma / .mb file path.
+        """
+        import maya.cmds as cmds
+        cmds.file(path, open=True, force=True)
+        self._revision += 1
+
+    def save_scene(self, path: Optional[str] = None) -> str:
+        """Save the current Maya scene.
+        
+        Args:
+            path: Save under this path (file type from its extension).
+            
+        Returns:
+            Path the scene was saved to.
+        """
+        import maya.cmds as cmds
+        if path:
+            cmds.file(rename=path)
+            file_type = "mayaBinary" if path.lower().endswith(".mb") else "mayaAscii"
+            return cmds.file(save=True, force=True, type=file_type)
+        return cmds.file(save=True, force=True)
+
     def show_message(self, text: str, level: str = "info") -> None:
         """Display a message to the user in Maya.
         
@@ -3,7 +3,7 @@ import math
 
 from hub.core.logging import get_logger
 from hub.core.plugins import BaseToolPlugin
-from hub.core.qt_import import import_qt
+from hub.core.qt_import import import_qt, qt_core
 
 QtWidgets = import_qt()
 logger = get_logger(__name__)
@@ -38,7 +38,7 @@ class SmoothNormalsTool(BaseToolPlugin):
         
         # Get initial angle value with priority: state > settings > default
         state_angle = self.ctx.state.get("poly.smooth_normals.last_angle")
-        settings_angle = self.ctx.settings.get("poly.smooth_normals.angle", 60.0)
+        settings_angle = self.ctx.settings.get_float("poly.smooth_normals.angle", 60.0)
         
         if state_angle is not None:
             initial_angle = state_angle
@@ -65,8 +65,15 @@ class SmoothNormalsTool(BaseToolPlugin):
         self.execute_button.clicked.connect(lambda checked=False: self._on_execute())
         logger.debug("Button created and connected")
         
+        # Busy state shown while the command is running. polySoftEdge runs
+        # on the main thread, so a static label and wait cursor are used
+        # (an animated indicator would freeze for the whole operation)
+        self.busy_label = QtWidgets.QLabel("Smoothing normals...")
+        self.busy_label.setVisible(False)
+        
         layout.addLayout(angle_layout)
         layout.addWidget(self.execute_button)
+        layout.addWidget(self.busy_label)
         layout.addStretch()
         
         return widget
@@ -83,11 +90,43 @@ class SmoothNormalsTool(BaseToolPlugin):
             self.execute(angle=angle)
             return
         
-        # Dispatch command through CommandBus
+        # Dispatch command through CommandBus. The scene work itself runs on
+        # the main thread; dispatch_async defers it so the busy state is
+        # painted before it starts
+        self._set_busy(True)
         try:
-            self.ctx.cmd_bus.dispatch("tool.execute", key=plugin_key, angle=angle)
+            future = self.ctx.cmd_bus.dispatch_async("tool.execute", key=plugin_key, angle=angle)
         except Exception as e:
             logger.error(f"Error dispatching command: {e}", exc_info=True)
+            self._on_execute_done(None)
+            return
+        future.add_done_callback(self._on_execute_done)
+    
+    def _set_busy(self, busy):
+        """Show or hide the busy state (label, wait cursor, disabled button).
+        
+        Args:
+            busy: Whether the command is running
+        """
+        self.execute_button.setEnabled(not busy)
+        self.busy_label.setVisible(busy)
+        QtCore = qt_core()
+        if QtCore is None:
+            return
+        if busy:
+            QtWidgets.QApplication.setOverrideCursor(QtCore.Qt.WaitCursor)
+        else:
+            QtWidgets.QApplication.restoreOverrideCursor()
+    
+    def _on_execute_done(self, future):
+        """Restore the UI after an async dispatch completes (main thread).
+        
+        Args:
+            future: Completed command future (or None if dispatch failed)
+        """
+        self._set_busy(False)
+        if future is not None and future.exception() is not None:
+            logger.error(f"Error dispatching command: {future.exception()}")
     
     def execute(self, **kwargs):
         """Execute smooth normals operation.
@@ -144,21 +183,16 @@ class SmoothNormalsTool(BaseToolPlugin):
                 angle_rad = math.radians(angle)
                 logger.debug(f"Angle in radians: {angle_rad}")
                 
-                # Apply polySoftEdge to each mesh
-                for mesh in meshes:
-                    logger.debug(f"Processing mesh: {mesh}")
-                    # Select the mesh first
-                    cmds.select(mesh, r=True)
-                    # Convert to edges
-                    edges = cmds.polyListComponentConversion(mesh, te=True)
-                    if edges:
-                        cmds.select(edges, r=True)
-                        # Apply polySoftEdge to selected edges
-                        result = cmds.polySoftEdge(
-                            angle=angle_rad,
-                            constructionHistory=True
-                        )
-                        logger.debug(f"polySoftEdge result: {result}")
+                # Convert all meshes to edges and apply polySoftEdge in a single
+                # call (no per-mesh select, keeps the undo queue compact)
+                edges = cmds.polyListComponentConversion(meshes, te=True)
+                if edges:
+                    result = cmds.polySoftEdge(
+                        edges,
+                        angle=angle_rad,
+                        constructionHistory=True
+                    )
+                    logger.debug(f"polySoftEdge result: {result}")
             
             logger.info(f"Completed smoothing normals on {len(meshes)} mesh(es)")
             self.ctx.dcc.show_message(f"Smoothed normals on {len(meshes)} mesh(es)", level="info")
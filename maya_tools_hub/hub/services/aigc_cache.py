@@ -0,0 +1,248 @@
+"""AIGC result cache - content-addressed, size-bounded, optionally shared.
+
+Entries are keyed by a SHA-256 over the canonical job inputs and the model
+version, so resubmitting the same prompt/style/resolution is served from
+disk instead of the generation service. Layout::
+
+    <cache_dir>/<key[:2]>/<key>/entry.json    status + file list
+    <cache_dir>/<key[:2]>/<key>/<files>       result assets
+
+The local cache is evicted least-recently-used once it exceeds max_bytes.
+A shared studio directory, if configured, is read through on local misses
+and written through on put().
+"""
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from hub.core.logging import get_logger
+from hub.core.memo import normalize_kwargs
+
+logger = get_logger(__name__)
+
+ENTRY_FILE = "entry.json"
+DEFAULT_MAX_BYTES = 5 * 1024 ** 3
+
+
+def cache_key(inputs, model_version=None):
+    """Canonical content hash of AIGC job inputs.
+
+    Args:
+        inputs: Job inputs dict (key order does not matter)
+        model_version: Generation model version (results differ per model)
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    canonical = normalize_kwargs({"inputs": inputs, "model_version": model_version})
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _link_or_copy(source, target):
+    """Hard-link a file into the cache (no copy on the same volume), else copy it."""
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copy2(source, target)
+
+
+def _dir_size(path):
+    return sum(p.stat().st_size for p in path.iterdir() if p.is_file())
+
+
+class AigcResultCache:
+    """Content-addressed local cache of AIGC results. Thread-safe."""
+
+    def __init__(self, directory=None, max_bytes=DEFAULT_MAX_BYTES, shared_dir=None):
+        """Initialize cache.
+
+        Args:
+            directory: Local cache directory (default:
+                ~/.studio_name/maya_tools_hub/aigc_cache)
+            max_bytes: Local size bound; least recently used entries are
+                evicted beyond it
+            shared_dir: Optional shared studio cache directory
+        """
+        self.directory = Path(directory or Path.home() / ".studio_name" / "maya_tools_hub" / "aigc_cache")
+        self.max_bytes = max_bytes
+        self.shared_dir = Path(shared_dir) if shared_dir else None
+        self._lock = threading.RLock()
+        self._index = None  # key -> [size, last_access], built on first use
+        self.hits = 0
+        self.misses = 0
+
+    def _entry_dir(self, root, key):
+        return root / key[:2] / key
+
+    def _load_index(self):
+        if self._index is not None:
+            return self._index
+        index = {}
+        if self.directory.is_dir():
+            for entry_file in self.directory.glob(f"*/*/{ENTRY_FILE}"):
+                entry_dir = entry_file.parent
+                index[entry_dir.name] = [_dir_size(entry_dir), entry_file.stat().st_mtime]
+        self._index = index
+        logger.debug(f"AIGC cache index loaded: {len(index)} entries")
+        return index
+
+    @property
+    def size(self):
+        """Total bytes in the local cache."""
+        with self._lock:
+            return sum(size for size, _ in self._load_index().values())
+
+    def get(self, inputs, model_version=None):
+        """Look up a cached result.
+
+        Args:
+            inputs: Job inputs dict
+            model_version: Generation model version
+
+        Returns:
+            Dict with "status" and "files" (local paths), or None on a miss
+        """
+        key = cache_key(inputs, model_version)
+        with self._lock:
+            entry = self._read(self._entry_dir(self.directory, key))
+            if entry is None and self.shared_dir is not None:
+                shared = self._entry_dir(self.shared_dir, key)
+                if self._read(shared) is not None:
+                    logger.debug(f"AIGC cache: shared hit {key[:12]}, copying locally")
+                    self._install(key, shared, copy=True)
+                    self._evict(keep=key)
+                    entry = self._read(self._entry_dir(self.directory, key))
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._touch(key)
+            return entry
+
+    def put(self, inputs, model_version, status, files=()):
+        """Store a completed result.
+
+        Args:
+            inputs: Job inputs dict
+            model_version: Generation model version
+            status: Completed status dict from the service
+            files: Downloaded result file paths; they are moved into the cache
+                (removed only once the entry is installed)
+
+        Returns:
+            Dict with "status" and "files" (paths inside the cache)
+        """
+        key = cache_key(inputs, model_version)
+        staging = Path(tempfile.mkdtemp(prefix=f".{key[:12]}.", dir=self._ensure_dir()))
+        try:
+            for path in files:
+                _link_or_copy(path, staging / os.path.basename(path))
+            self._write_entry(staging, status)
+            with self._lock:
+                self._install(key, staging, copy=False)
+                self._evict(keep=key)
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+        for path in files:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        if self.shared_dir is not None:
+            self._publish(key)
+        return self._read(self._entry_dir(self.directory, key))
+
+    def _ensure_dir(self):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        return str(self.directory)
+
+    @staticmethod
+    def _write_entry(entry_dir, status):
+        names = sorted(p.name for p in entry_dir.iterdir() if p.name != ENTRY_FILE)
+        entry = {"status": status, "files": names, "created": time.time()}
+        with open(entry_dir / ENTRY_FILE, "w", encoding="utf-8") as f:
+            json.dump(entry, f, ensure_ascii=False)
+
+    @staticmethod
+    def _read(entry_dir):
+        try:
+            with open(entry_dir / ENTRY_FILE, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        files = [str(entry_dir / name) for name in entry.get("files", ())]
+        if not all(os.path.exists(path) for path in files):
+            return None
+        return {"status": entry.get("status"), "files": files}
+
+    def _install(self, key, source, copy):
+        """Move (or copy) a complete entry directory into place atomically."""
+        target = self._entry_dir(self.directory, key)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        if copy:
+            staging = Path(tempfile.mkdtemp(prefix=f".{key[:12]}.", dir=self._ensure_dir()))
+            shutil.copytree(source, staging, dirs_exist_ok=True)
+            source = staging
+        if target.exists():
+            shutil.rmtree(target, ignore_errors=True)
+        os.replace(source, target)
+        self._load_index()[key] = [_dir_size(target), time.time()]
+
+    def _touch(self, key):
+        index = self._load_index()
+        now = time.time()
+        if key in index:
+            index[key][1] = now
+        else:
+            index[key] = [_dir_size(self._entry_dir(self.directory, key)), now]
+        try:
+            os.utime(self._entry_dir(self.directory, key) / ENTRY_FILE, (now, now))
+        except OSError:
+            pass
+
+    def _evict(self, keep=None):
+        """Evict least recently used entries beyond max_bytes (never keep)."""
+        index = self._load_index()
+        total = sum(size for size, _ in index.values())
+        if total <= self.max_bytes:
+            return
+        for key, (size, _) in sorted(index.items(), key=lambda item: item[1][1]):
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            shutil.rmtree(self._entry_dir(self.directory, key), ignore_errors=True)
+            del index[key]
+            total -= size
+            logger.debug(f"AIGC cache: evicted {key[:12]} ({size} bytes)")
+        if total > self.max_bytes and keep is not None:
+            logger.warning(f"AIGC cache: entry {keep[:12]} alone exceeds the {self.max_bytes} byte limit")
+
+    def _publish(self, key):
+        """Copy an entry to the shared cache (first writer wins)."""
+        target = self._entry_dir(self.shared_dir, key)
+        if target.exists():
+            return
+        try:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            staging = Path(tempfile.mkdtemp(prefix=f".{key[:12]}.", dir=str(target.parent)))
+            shutil.copytree(self._entry_dir(self.directory, key), staging, dirs_exist_ok=True)
+            try:
+                os.rename(staging, target)
+            except OSError:
+                # Another workstation published it first
+                shutil.rmtree(staging, ignore_errors=True)
+        except OSError as e:
+            logger.warning(f"Could not publish AIGC result to shared cache: {e}")
+
+    def clear(self):
+        """Remove all local entries."""
+        with self._lock:
+            for key in list(self._load_index()):
+                shutil.rmtree(self._entry_dir(self.directory, key), ignore_errors=True)
+            self._index = {}
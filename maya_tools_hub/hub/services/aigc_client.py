@@ -1,8 +1,16 @@
-"""AIGC service client stub implementation."""
+"""AIGC service clients: stub and HTTP implementation."""
+import os
+import time
+
 from hub.core.logging import get_logger
+from hub.services.download import download_many
+from hub.services.http_transport import HttpError, HttpTransport
 
 logger = get_logger(__name__)
 
+# Job states after which poll() results no longer change
+TERMINAL_STATES = frozenset(("completed", "failed", "cancelled"))
+
 
 class AigcClientStub:
     """Stub implementation of AIGC service client.
@@ -11,6 +19,9 @@ class AigcClientStub:
     Replace with actual HTTP/gRPC client when integrating with real AIGC service.
     """
     
+    # Fake results are never cached (the result cache needs a model version)
+    model_version = None
+    
     def __init__(self):
         """Initialize AIGC client stub."""
         logger.info("AigcClientStub initialized")
@@ -69,3 +80,177 @@ class AigcClientStub:
         logger.info(f"AigcClientStub.cancel() called with job_id: {job_id}")
         return True
 
+
+class AigcClient:
+    """HTTP client for the AIGC generation service.
+
+    Same submit/poll/cancel interface as AigcClientStub, backed by a pooled
+    keep-alive HttpTransport. Safe to call from JobCenter worker threads.
+
+    Service API:
+        POST   /v1/jobs            {"inputs": {...}} -> {"job_id": "..."}
+        GET    /v1/jobs/<id>       -> {"state": ..., "progress": ..., "result": ...}
+        POST   /v1/jobs/status     {"ids": [...]} -> {"jobs": {id: status}}
+        DELETE /v1/jobs/<id>       -> {"cancelled": true}
+    """
+
+    def __init__(self, base_url, transport=None, model_version=None, **transport_options):
+        """Initialize AIGC client.
+
+        Args:
+            base_url: Service base URL (e.g. "http://aigc.studio:8080")
+            transport: Optional HttpTransport to share
+            model_version: Generation model version, part of the result
+                cache key (results differ between models)
+            **transport_options: HttpTransport options (pool_size, retries, ...)
+        """
+        self.base_url = base_url
+        self.model_version = model_version
+        self.transport = transport or HttpTransport(base_url, **transport_options)
+        logger.info(f"AigcClient initialized for {base_url}")
+
+    def submit(self, inputs):
+        """Submit a job to AIGC service.
+
+        The request carries an Idempotency-Key, so it is safe to retry.
+
+        Args:
+            inputs: Input parameters for AIGC job (dict)
+
+        Returns:
+            job_id: Job ID (string)
+        """
+        import uuid
+
+        response = self.transport.request(
+            "POST", "/v1/jobs", {"inputs": inputs},
+            headers={"Idempotency-Key": uuid.uuid4().hex}, idempotent=True,
+        )
+        job_id = response["job_id"]
+        logger.debug(f"Submitted AIGC job {job_id}")
+        return job_id
+
+    def poll(self, job_id):
+        """Poll job status from AIGC service.
+
+        Args:
+            job_id: Job ID to poll (string)
+
+        Returns:
+            status: Job status dict with 'state' and optional 'result'
+        """
+        return self.transport.request("GET", f"/v1/jobs/{job_id}")
+
+    def poll_many(self, job_ids):
+        """Poll many jobs in one round-trip.
+
+        Args:
+            job_ids: Iterable of job IDs
+
+        Returns:
+            Dict of job_id -> status dict
+        """
+        job_ids = list(job_ids)
+        if not job_ids:
+            return {}
+        response = self.transport.request("POST", "/v1/jobs/status", {"ids": job_ids}, idempotent=True)
+        return response["jobs"]
+
+    def cancel(self, job_id):
+        """Cancel a running job.
+
+        Args:
+            job_id: Job ID to cancel (string)
+
+        Returns:
+            success: Whether cancellation was successful (bool)
+        """
+        try:
+            response = self.transport.request("DELETE", f"/v1/jobs/{job_id}")
+        except HttpError as e:
+            if e.status in (404, 409):
+                return False
+            raise
+        return bool(response and response.get("cancelled"))
+
+    def download_results(self, status, dest_dir, progress=None, max_workers=4):
+        """Stream a completed job's result files to disk.
+
+        Files are written chunk by chunk, resumed with Range requests after
+        an interruption and verified against their SHA-256.
+
+        Args:
+            status: Completed status dict from poll()
+            dest_dir: Directory to write the files to (use one per job;
+                results of different jobs may share file names)
+            progress: Optional callable(done_bytes, total_bytes or None),
+                called from download threads
+            max_workers: Parallel downloads
+
+        Returns:
+            List of result dicts (path, size, sha256 or error), one per file
+        """
+        files = (status.get("result") or {}).get("files") or []
+        items = []
+        names = set()
+        for f in files:
+            # Same basename twice in one job: keep both files
+            name = os.path.basename(f["name"])
+            stem, ext = os.path.splitext(name)
+            count = 1
+            while name in names:
+                count += 1
+                name = f"{stem}_{count}{ext}"
+            names.add(name)
+            items.append({
+                "url": f["url"],
+                "path": os.path.join(dest_dir, name),
+                "sha256": f.get("sha256"),
+                "size": f.get("size"),
+            })
+        return download_many(items, max_workers=max_workers, progress=progress)
+
+    @property
+    def busy(self):
+        """Whether a request is in flight."""
+        return self.transport.pool.in_use > 0
+
+    def close(self):
+        """Close pooled connections."""
+        self.transport.close()
+
+
+def wait_for_job(client, job_id, timeout=600.0, interval=1.0, on_status=None):
+    """Poll a job until it reaches a terminal state.
+
+    Blocks the calling thread; call it from a JobCenter job.
+
+    Args:
+        client: AigcClient or AigcClientStub
+        job_id: Job ID returned by submit()
+        timeout: Seconds to wait before cancelling the job
+        interval: Seconds between polls
+        on_status: Optional callable(status) called after every poll
+
+    Returns:
+        Final status dict (state completed, failed or cancelled)
+
+    Raises:
+        TimeoutError: Job did not finish within timeout (it is cancelled)
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        status = client.poll(job_id)
+        if on_status is not None:
+            on_status(status)
+        if status.get("state") in TERMINAL_STATES:
+            return status
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            try:
+                client.cancel(job_id)
+            except Exception as e:
+                logger.warning(f"Could not cancel timed out AIGC job {job_id}: {e}")
+            raise TimeoutError(f"AIGC job {job_id} did not finish within {timeout:g}s "
+                               f"(last state: {status.get('state')})")
+        time.sleep(min(interval, remaining))
@@ -0,0 +1,271 @@
+"""Local stand-in for the AIGC generation service.
+
+Implements the API used by AigcClient with in-memory jobs, so the client
+and transport can be tested and benchmarked without the real service.
+Latency, job duration and a transient failure rate are configurable.
+With result_size set, completed jobs expose a generated result file that
+supports Range requests (with an ETag for If-Range); truncate_rate cuts a
+fraction of file transfers short to exercise resumable downloads.
+
+Usage:
+    python -m hub.services.aigc_standin_server [--port 8765] [--latency 0.005]
+"""
+import argparse
+import gzip
+import hashlib
+import json
+import random
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from hub.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class _Job:
+    __slots__ = ("job_id", "inputs", "created", "cancelled", "content")
+
+    def __init__(self, job_id, inputs):
+        self.job_id = job_id
+        self.inputs = inputs
+        self.created = time.monotonic()
+        self.cancelled = False
+        self.content = None  # generated result file, created on first access
+
+
+class StandinAigcServer(ThreadingHTTPServer):
+    """Threaded HTTP/1.1 server holding fake AIGC jobs."""
+
+    daemon_threads = True
+
+    def __init__(self, host="127.0.0.1", port=0, latency=0.0, job_duration=0.5, failure_rate=0.0,
+                 result_size=0, truncate_rate=0.0):
+        """Initialize server.
+
+        Args:
+            host: Bind address
+            port: Bind port (0 picks a free one)
+            latency: Added per-request service time in seconds
+            job_duration: Seconds until a job reports completed
+            failure_rate: Fraction of requests answered with 503
+            result_size: Size in bytes of each job's result file (0: none)
+            truncate_rate: Fraction of file transfers cut off half-way
+        """
+        super().__init__((host, port), _Handler)
+        self.latency = latency
+        self.job_duration = job_duration
+        self.failure_rate = failure_rate
+        self.result_size = result_size
+        self.truncate_rate = truncate_rate
+        self.jobs = {}
+        self.idempotency = {}  # Idempotency-Key -> job_id
+        self.lock = threading.Lock()
+        self.request_count = 0
+        self.connection_count = 0
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def status(self, job):
+        if job.cancelled:
+            return {"state": "cancelled", "progress": 0}
+        progress = min(1.0, (time.monotonic() - job.created) / self.job_duration) if self.job_duration else 1.0
+        if progress < 1.0:
+            return {"state": "running", "progress": int(progress * 100)}
+        result = {
+            "output_path": f"/standin/results/{job.job_id}.obj",
+            "message": "Stand-in AIGC job completed",
+        }
+        if self.result_size:
+            content, digest = self.content(job)
+            name = f"{job.job_id}.obj"
+            result["files"] = [{
+                "name": name,
+                "url": f"{self.url}/v1/jobs/{job.job_id}/files/{name}",
+                "size": len(content),
+                "sha256": digest,
+            }]
+        return {"state": "completed", "progress": 100, "result": result}
+
+    def content(self, job):
+        """Deterministic result file (bytes, sha256 hex digest) for a job."""
+        if job.content is None:
+            seed = hashlib.sha256(job.job_id.encode("ascii")).digest()
+            data = (seed * (self.result_size // len(seed) + 1))[:self.result_size]
+            job.content = (data, hashlib.sha256(data).hexdigest())
+        return job.content
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connection_count += 1
+
+    def log_message(self, format, *args):
+        logger.debug("standin: " + format % args)
+
+    def _body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        data = self.rfile.read(length) if length else b""
+        if self.headers.get("Content-Encoding") == "gzip":
+            data = gzip.decompress(data)
+        return json.loads(data) if data else None
+
+    def _reply(self, status, body=None, headers=None):
+        data = json.dumps(body).encode("utf-8") if body is not None else b""
+        self.send_response(status)
+        if data and len(data) >= 1024 and "gzip" in (self.headers.get("Accept-Encoding") or ""):
+            data = gzip.compress(data)
+            self.send_header("Content-Encoding", "gzip")
+        if data:
+            self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _handle(self, method):
+        server = self.server
+        body = self._body()
+        with server.lock:
+            server.request_count += 1
+        if server.latency:
+            time.sleep(server.latency)
+        if server.failure_rate and random.random() < server.failure_rate:
+            return self._reply(503, {"error": "unavailable"}, {"Retry-After": "0"})
+
+        parts = self.path.strip("/").split("/")
+        if parts[:2] != ["v1", "jobs"]:
+            return self._reply(404, {"error": "not found"})
+        if method == "POST" and len(parts) == 2:
+            return self._submit(body or {})
+        if method == "POST" and parts[2:] == ["status"]:
+            with server.lock:
+                jobs = {i: server.status(server.jobs[i]) for i in body.get("ids", ()) if i in server.jobs}
+            return self._reply(200, {"jobs": jobs})
+        if method == "GET" and len(parts) == 5 and parts[3] == "files":
+            return self._file(parts[2])
+        if len(parts) != 3:
+            return self._reply(404, {"error": "not found"})
+        with server.lock:
+            job = server.jobs.get(parts[2])
+            if job is None:
+                status, reply = 404, {"error": "unknown job"}
+            elif method == "GET":
+                status, reply = 200, server.status(job)
+            elif method != "DELETE":
+                status, reply = 405, {"error": "method not allowed"}
+            elif server.status(job)["state"] != "running":
+                status, reply = 409, {"error": "job is not running"}
+            else:
+                job.cancelled = True
+                status, reply = 200, {"cancelled": True}
+        return self._reply(status, reply)
+
+    def _file(self, job_id):
+        server = self.server
+        with server.lock:
+            job = server.jobs.get(job_id)
+            if job is None or not server.result_size or server.status(job)["state"] != "completed":
+                return self._reply(404, {"error": "no result file"})
+            content, digest = server.content(job)
+        etag = f'"{digest}"'
+        start = 0
+        range_header = self.headers.get("Range")
+        if_range = self.headers.get("If-Range")
+        if range_header and range_header.startswith("bytes=") and if_range in (None, etag):
+            start = int(range_header[6:].split("-")[0] or 0)
+            if start >= len(content):
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{len(content)}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+        body = memoryview(content)[start:]
+        self.send_response(206 if start else 200)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("ETag", etag)
+        if start:
+            self.send_header("Content-Range", f"bytes {start}-{len(content) - 1}/{len(content)}")
+        self.end_headers()
+        if server.truncate_rate and random.random() < server.truncate_rate:
+            self.wfile.write(body[:len(body) // 2])
+            self.close_connection = True
+            return
+        for offset in range(0, len(body), 1 << 16):
+            self.wfile.write(body[offset:offset + (1 << 16)])
+
+    def _submit(self, body):
+        server = self.server
+        key = self.headers.get("Idempotency-Key")
+        with server.lock:
+            job_id = server.idempotency.get(key) if key else None
+            if job_id is None:
+                job_id = f"job_{uuid.uuid4().hex[:8]}"
+                server.jobs[job_id] = _Job(job_id, body.get("inputs"))
+                if key:
+                    server.idempotency[key] = job_id
+        return self._reply(200, {"job_id": job_id})
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_POST(self):
+        self._handle("POST")
+
+    def do_DELETE(self):
+        self._handle("DELETE")
+
+
+def start_standin_server(**options):
+    """Start a stand-in server on a daemon thread.
+
+    Args:
+        **options: StandinAigcServer options (port, latency, ...)
+
+    Returns:
+        Running StandinAigcServer; call shutdown() and server_close() to stop
+    """
+    server = StandinAigcServer(**options)
+    thread = threading.Thread(target=server.serve_forever, name="aigc-standin", daemon=True)
+    thread.start()
+    logger.info(f"AIGC stand-in server listening on {server.url}")
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in AIGC service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="Per-request service time (s)")
+    parser.add_argument("--job-duration", type=float, default=0.5, help="Seconds until jobs complete")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Fraction of 503 responses")
+    parser.add_argument("--result-size", type=int, default=0, help="Result file size in bytes")
+    parser.add_argument("--truncate-rate", type=float, default=0.0, help="Fraction of cut-off file transfers")
+    args = parser.parse_args()
+
+    server = StandinAigcServer(args.host, args.port, args.latency, args.job_duration, args.failure_rate,
+                               args.result_size, args.truncate_rate)
+    print(f"AIGC stand-in server listening on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,275 @@
+"""Download - chunked, resumable streaming downloads.
+
+Large result assets are streamed straight to a ``.part`` file next to the
+destination, never held in memory. An interrupted download resumes with an
+HTTP Range request, the SHA-256 is computed incrementally as chunks arrive,
+and the file is moved into place only once the checksum matches.
+
+A ``.part.json`` sidecar records the URL and validator (ETag or
+Last-Modified) the partial file came from. A partial is resumed only for
+the same URL, with If-Range so a changed resource is sent in full, and
+only when the server's Content-Range starts where the partial ends;
+anything else restarts the download.
+"""
+import hashlib
+import json
+import os
+import re
+import random
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from hub.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+CHUNK_SIZE = 1 << 20  # 1 MB
+CHECKSUM_HEADER = "X-Content-SHA256"
+
+
+class DownloadError(Exception):
+    """Download failed."""
+
+
+class ChecksumError(DownloadError):
+    """Downloaded content does not match the expected SHA-256."""
+
+
+def _hash_existing(path, hasher, chunk_size):
+    """Feed an existing partial file into the hasher; return its size."""
+    size = 0
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                return size
+            hasher.update(chunk)
+            size += len(chunk)
+
+
+def _read_meta(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_meta(path, url, resp):
+    """Record where a new partial file comes from (see module docstring)."""
+    validator = resp.headers.get("ETag")
+    if not validator or validator.startswith("W/"):
+        validator = resp.headers.get("Last-Modified")  # weak ETags are not valid in If-Range
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"url": url, "validator": validator}, f)
+
+
+def _discard(*paths):
+    for path in paths:
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def _content_range(value):
+    """Parse a Content-Range header into (start or None, total or None)."""
+    match = re.match(r"bytes\s+(?:(\d+)-\d+|\*)/(\d+|\*)", value or "")
+    if not match:
+        return None, None
+    start, total = match.groups()
+    return (int(start) if start else None), (int(total) if total != "*" else None)
+
+
+def download_file(url, dest_path, sha256=None, chunk_size=CHUNK_SIZE, progress=None,
+                  timeout=30.0, retries=3, backoff=0.5, headers=None, size=None):
+    """Stream a URL to disk, resuming partial downloads.
+
+    Args:
+        url: Source URL
+        dest_path: Destination file path
+        sha256: Optional expected hex digest (otherwise taken from the
+            X-Content-SHA256 response header, if present)
+        chunk_size: Bytes read and written per chunk
+        progress: Optional callable(done_bytes, total_bytes or None), called
+            from the downloading thread
+        timeout: Socket timeout in seconds
+        retries: Reconnect attempts after an interrupted transfer
+        backoff: Base retry delay in seconds (full jitter)
+        headers: Optional extra request headers
+        size: Optional expected size in bytes
+
+    Returns:
+        Dict with path, size and sha256
+
+    Raises:
+        DownloadError: Transfer failed after all retries, or the size does
+            not match
+        ChecksumError: Content does not match the expected digest
+    """
+    part_path = dest_path + ".part"
+    meta_path = part_path + ".json"
+    os.makedirs(os.path.dirname(os.path.abspath(dest_path)), exist_ok=True)
+    attempt = 0
+    while True:
+        hasher = hashlib.sha256()
+        offset = 0
+        meta = None
+        if os.path.exists(part_path):
+            meta = _read_meta(meta_path)
+            if meta is None or meta.get("url") != url:
+                # Left over from another download: never append to it
+                logger.debug(f"Discarding unrelated partial file {part_path}")
+                _discard(part_path, meta_path)
+            else:
+                offset = _hash_existing(part_path, hasher, chunk_size)
+        request = urllib.request.Request(url, headers=dict(headers or {}))
+        if offset:
+            request.add_header("Range", f"bytes={offset}-")
+            if meta.get("validator"):
+                request.add_header("If-Range", meta["validator"])
+        try:
+            with urllib.request.urlopen(request, timeout=timeout) as resp:
+                if offset and resp.status != 206:
+                    # Range ignored, or the resource changed (If-Range): start over
+                    logger.debug(f"Cannot resume {url}, restarting download")
+                    offset = 0
+                    hasher = hashlib.sha256()
+                elif offset:
+                    start, full = _content_range(resp.headers.get("Content-Range"))
+                    if start != offset or (size is not None and full is not None and full != size):
+                        logger.debug(f"Unexpected Content-Range for {url}, restarting download")
+                        _discard(part_path, meta_path)
+                        continue
+                if not offset:
+                    _write_meta(meta_path, url, resp)
+                expected = sha256 or resp.headers.get(CHECKSUM_HEADER)
+                length = resp.headers.get("Content-Length")
+                total = offset + int(length) if length is not None else None
+                done = offset
+                with open(part_path, "ab" if offset else "wb") as f:
+                    while True:
+                        chunk = resp.read(chunk_size)
+                        if not chunk:
+                            break
+                        f.write(chunk)
+                        hasher.update(chunk)
+                        done += len(chunk)
+                        if progress is not None:
+                            progress(done, total)
+            if total is not None and done < total:
+                raise DownloadError(f"Connection closed at {done}/{total} bytes")
+        except urllib.error.HTTPError as e:
+            if e.code == 416 and offset and _content_range(e.headers.get("Content-Range"))[1] == offset:
+                # Partial file already complete
+                expected = sha256 or e.headers.get(CHECKSUM_HEADER)
+                done = offset
+            elif e.code == 416 and offset:
+                logger.debug(f"Partial file does not match {url}, restarting download")
+                _discard(part_path, meta_path)
+                continue
+            elif e.code < 500 or attempt >= retries:
+                raise DownloadError(f"Download failed for {url}: HTTP {e.code}") from e
+            else:
+                attempt = _wait(attempt, backoff, url, e)
+                continue
+        except (OSError, DownloadError) as e:
+            if attempt >= retries:
+                raise DownloadError(f"Download failed for {url}: {e}") from e
+            attempt = _wait(attempt, backoff, url, e)
+            continue
+        break
+
+    digest = hasher.hexdigest()
+    if size is not None and done != size:
+        _discard(part_path, meta_path)
+        raise DownloadError(f"Size mismatch for {url}: expected {size} bytes, got {done}")
+    if expected and digest != expected.lower():
+        _discard(part_path, meta_path)
+        raise ChecksumError(f"SHA-256 mismatch for {url}: expected {expected}, got {digest}")
+    os.replace(part_path, dest_path)
+    _discard(meta_path)
+    logger.info(f"Downloaded {url} -> {dest_path} ({done} bytes)")
+    return {"path": dest_path, "size": done, "sha256": digest}
+
+
+def _wait(attempt, backoff, url, error):
+    attempt += 1
+    delay = random.uniform(0, backoff * (2 ** (attempt - 1)))
+    logger.warning(f"Download of {url} interrupted ({error}), resuming in {delay:.2f}s")
+    time.sleep(delay)
+    return attempt
+
+
+class _Progress:
+    """Aggregate byte progress over several downloads, throttled."""
+
+    def __init__(self, callback, totals, interval=0.1):
+        self._callback = callback
+        self._totals = totals  # index -> expected size (or None)
+        self._done = {}
+        self._interval = interval
+        self._last = 0.0
+        self._lock = threading.Lock()
+
+    def update(self, index, done, total):
+        with self._lock:
+            self._done[index] = done
+            if total is not None:
+                self._totals[index] = total
+            now = time.monotonic()
+            if now - self._last < self._interval:
+                return
+            self._last = now
+            self._emit()
+
+    def finish(self):
+        with self._lock:
+            self._emit()
+
+    def _emit(self):
+        done = sum(self._done.values())
+        totals = self._totals.values()
+        total = sum(totals) if all(t is not None for t in totals) else None
+        try:
+            self._callback(done, total)
+        except Exception as e:
+            logger.error(f"Error in download progress callback: {e}", exc_info=True)
+
+
+def download_many(items, max_workers=4, progress=None, **options):
+    """Download several files in parallel.
+
+    Args:
+        items: Iterable of dicts with "url", "path" and optional "sha256"
+            and "size"
+        max_workers: Parallel downloads
+        progress: Optional callable(done_bytes, total_bytes or None) with
+            the combined progress, throttled to about 10 calls per second
+        **options: Passed to download_file()
+
+    Returns:
+        List of result dicts from download_file(), in item order; failed
+        items have an "error" key instead
+    """
+    items = list(items)
+    tracker = _Progress(progress, {i: item.get("size") for i, item in enumerate(items)}) if progress else None
+
+    def fetch(index):
+        item = items[index]
+        callback = None
+        if tracker is not None:
+            callback = lambda done, total: tracker.update(index, done, total)  # noqa: E731
+        try:
+            return download_file(item["url"], item["path"], sha256=item.get("sha256"),
+                                 size=item.get("size"), progress=callback, **options)
+        except DownloadError as e:
+            logger.error(str(e))
+            return {"path": item["path"], "url": item["url"], "error": str(e)}
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(items) or 1))) as pool:
+        results = list(pool.map(fetch, range(len(items))))
+    if tracker is not None:
+        tracker.finish()
+    return results
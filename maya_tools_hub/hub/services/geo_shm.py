@@ -0,0 +1,230 @@
+"""Shared-memory geometry exchange between the hub and HDA workers.
+
+A mesh travels as one named shared-memory segment with a small header
+followed by flat buffers, so neither side serializes it:
+
+    offset 0   header (32 bytes, little-endian)
+                   magic "HGEO", version u16, flags u16,
+                   point_count u32, index_count u32, face_count u32,
+                   reserved (12 bytes)
+    offset 32  points       float32[point_count * 3]
+               normals      float32[point_count * 3]   (if FLAG_NORMALS)
+               indices      int32[index_count]         (face-vertex point ids)
+               face_counts  int32[face_count]          (vertices per face)
+
+Only the segment name and counts go through the worker protocol. Both
+sides map the segment and use memoryviews on it directly (numpy arrays via
+to_numpy() when numpy is available). Standard library only, so hython
+workers can import it.
+"""
+import struct
+import sys
+from array import array
+from itertools import chain
+from multiprocessing import shared_memory
+
+MAGIC = b"HGEO"
+VERSION = 1
+FLAG_NORMALS = 1
+HEADER_SIZE = 32
+_HEADER = struct.Struct("<4sHHIII")
+
+# Python 3.13+ can skip resource tracking; earlier versions track (and
+# unlink at exit) every segment a process touches, including attached ones
+_TRACK_PARAM = sys.version_info >= (3, 13)
+
+
+def _layout(point_count, index_count, face_count, normals):
+    """Byte offsets of (points, normals, indices, face_counts, end)."""
+    points = HEADER_SIZE
+    normals_at = points + point_count * 12
+    indices = normals_at + (point_count * 12 if normals else 0)
+    faces = indices + index_count * 4
+    return points, normals_at, indices, faces, faces + face_count * 4
+
+
+def _untrack(shm):
+    """Stop this process's resource tracker from unlinking a segment it
+    does not own when the process exits (Python < 3.13)."""
+    if _TRACK_PARAM:
+        return
+    try:
+        from multiprocessing import resource_tracker
+        resource_tracker.unregister(shm._name, "shared_memory")
+    except Exception:
+        pass
+
+
+def _as_flat(data, typecode):
+    """Get a flat buffer of typecode items for data, without copying when
+    data already exposes a matching contiguous buffer."""
+    try:
+        view = memoryview(data)
+    except TypeError:
+        view = None
+    if view is not None and view.c_contiguous and view.format in (typecode, "<" + typecode, "=" + typecode):
+        return view.cast("B")
+    if view is not None:
+        view.release()
+    data = list(data) if not isinstance(data, (list, tuple)) else data
+    if data and isinstance(data[0], (list, tuple)):
+        data = chain.from_iterable(data)
+    return memoryview(array(typecode, data)).cast("B")
+
+
+class GeometryBuffer:
+    """Mesh buffers in a named shared-memory segment.
+
+    Attributes points, normals, indices and face_counts are memoryviews
+    (float32 / int32) straight onto the segment. Call release() (or use as
+    a context manager) when done: owners unlink the segment, other holders
+    just unmap it.
+    """
+
+    def __init__(self, shm, owner):
+        self._shm = shm
+        self.owner = owner
+        magic, version, flags, points, indices, faces = _HEADER.unpack_from(shm.buf, 0)
+        if magic != MAGIC or version != VERSION:
+            shm.close()
+            raise ValueError(f"Segment {shm.name} is not a v{VERSION} geometry buffer")
+        self.point_count = points
+        self.index_count = indices
+        self.face_count = faces
+        self.has_normals = bool(flags & FLAG_NORMALS)
+        p, n, i, f, end = _layout(points, indices, faces, self.has_normals)
+        buf = shm.buf
+        self.points = buf[p:n].cast("f") if points else memoryview(array("f"))
+        self.normals = buf[n:i].cast("f") if self.has_normals and points else None
+        self.indices = buf[i:f].cast("i") if indices else memoryview(array("i"))
+        self.face_counts = buf[f:end].cast("i") if faces else memoryview(array("i"))
+
+    @classmethod
+    def allocate(cls, point_count, index_count=0, face_count=0, normals=False, name=None):
+        """Create an empty segment to be filled in place.
+
+        Args:
+            point_count: Number of points
+            index_count: Number of face-vertex indices
+            face_count: Number of faces
+            normals: Whether to reserve per-point normals
+            name: Optional segment name (default: generated)
+
+        Returns:
+            Owning GeometryBuffer
+        """
+        size = _layout(point_count, index_count, face_count, normals)[-1]
+        kwargs = {"track": True} if _TRACK_PARAM else {}
+        shm = shared_memory.SharedMemory(name=name, create=True, size=max(size, HEADER_SIZE), **kwargs)
+        _HEADER.pack_into(shm.buf, 0, MAGIC, VERSION, FLAG_NORMALS if normals else 0,
+                          point_count, index_count, face_count)
+        return cls(shm, owner=True)
+
+    @classmethod
+    def create(cls, points, indices=(), face_counts=(), normals=None, name=None):
+        """Create a segment holding a mesh (one copy into shared memory).
+
+        Args:
+            points: Flat xyz floats, (x, y, z) tuples, or any float32 buffer
+            indices: Face-vertex point indices (ints or int32 buffer)
+            face_counts: Vertices per face (ints or int32 buffer)
+            normals: Optional per-point normals, same forms as points
+            name: Optional segment name
+
+        Returns:
+            Owning GeometryBuffer
+        """
+        point_bytes = _as_flat(points, "f")
+        index_bytes = _as_flat(indices, "i")
+        face_bytes = _as_flat(face_counts, "i")
+        normal_bytes = _as_flat(normals, "f") if normals is not None else None
+        geo = cls.allocate(len(point_bytes) // 12, len(index_bytes) // 4, len(face_bytes) // 4,
+                           normals=normal_bytes is not None, name=name)
+        for target, source in ((geo.points, point_bytes), (geo.indices, index_bytes),
+                               (geo.face_counts, face_bytes), (geo.normals, normal_bytes)):
+            if source is not None and len(source):
+                target.cast("B")[:] = source
+        return geo
+
+    @classmethod
+    def attach(cls, name, owner=False):
+        """Map an existing segment.
+
+        Args:
+            name: Segment name (from a descriptor)
+            owner: Take ownership (release() will unlink the segment)
+
+        Returns:
+            GeometryBuffer
+        """
+        kwargs = {"track": owner} if _TRACK_PARAM else {}
+        shm = shared_memory.SharedMemory(name=name, **kwargs)
+        if not owner:
+            _untrack(shm)
+        return cls(shm, owner)
+
+    @classmethod
+    def from_descriptor(cls, descriptor, owner=False):
+        """Map the segment described by descriptor() output."""
+        return cls.attach(descriptor["shm"], owner=owner)
+
+    @property
+    def name(self):
+        return self._shm.name
+
+    @property
+    def nbytes(self):
+        return _layout(self.point_count, self.index_count, self.face_count, self.has_normals)[-1]
+
+    def descriptor(self):
+        """JSON-serializable reference to this segment for the worker protocol."""
+        return {
+            "shm": self._shm.name,
+            "points": self.point_count,
+            "indices": self.index_count,
+            "faces": self.face_count,
+            "normals": self.has_normals,
+        }
+
+    def disown(self):
+        """Hand ownership to another process (it will unlink the segment)."""
+        self.owner = False
+        _untrack(self._shm)
+
+    def to_numpy(self):
+        """Zero-copy numpy views (points Nx3, normals Nx3, indices, face_counts).
+
+        Raises:
+            ImportError: numpy is not available
+        """
+        import numpy as np
+        points = np.frombuffer(self.points, dtype=np.float32).reshape(-1, 3)
+        normals = np.frombuffer(self.normals, dtype=np.float32).reshape(-1, 3) if self.normals is not None else None
+        return (points, normals, np.frombuffer(self.indices, dtype=np.int32),
+                np.frombuffer(self.face_counts, dtype=np.int32))
+
+    def release(self):
+        """Unmap the segment, and unlink it if this buffer owns it."""
+        if self._shm is None:
+            return
+        for view in (self.points, self.normals, self.indices, self.face_counts):
+            if view is not None:
+                view.release()
+        self.points = self.normals = self.indices = self.face_counts = None
+        shm, self._shm = self._shm, None
+        shm.close()
+        if self.owner:
+            try:
+                shm.unlink()
+            except FileNotFoundError:
+                pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+
+    def __repr__(self):
+        return (f"GeometryBuffer({self.name!r}, points={self.point_count}, "
+                f"faces={self.face_count}, owner={self.owner})")
@@ -1,9 +1,46 @@
-"""Houdini HDA bridge stub implementation."""
+"""Houdini HDA bridge: stub and worker-pool implementation."""
+import hashlib
+import os
+import queue
+import threading
+from collections import namedtuple
+from concurrent.futures import Future
+
 from hub.core.logging import get_logger
+from hub.core.memo import ResultCache, normalize_kwargs
+from hub.services.geo_shm import GeometryBuffer
+from hub.services.hda_catalog import HDA_EXTENSIONS
+from hub.services.hda_pool import HdaWorkerError
 
 logger = get_logger(__name__)
 
 
+def list_hda_files(directory, catalog=None):
+    """List the HDA files directly inside a directory.
+
+    Answered from the catalog's index when it covers the directory and has
+    been populated; otherwise the directory is scanned.
+
+    Args:
+        directory: Directory path (string)
+        catalog: Optional HdaCatalog
+
+    Returns:
+        Sorted list of HDA file paths
+    """
+    if catalog is not None and len(catalog) and catalog.covers(directory):
+        return catalog.list(directory, recursive=False)
+    try:
+        names = os.listdir(directory)
+    except OSError as e:
+        logger.error(f"Cannot list HDAs in {directory}: {e}")
+        return []
+    return sorted(
+        os.path.join(directory, name) for name in names
+        if name.lower().endswith(HDA_EXTENSIONS)
+    )
+
+
 class HdaBridgeStub:
     """Stub implementation of Houdini HDA bridge.
     
@@ -11,8 +48,14 @@ class HdaBridgeStub:
     Replace with actual HDA execution when integrating with Houdini.
     """
     
-    def __init__(self):
-        """Initialize HDA bridge stub."""
+    def __init__(self, catalog=None):
+        """Initialize HDA bridge stub.
+        
+        Args:
+            catalog: Optional HdaCatalog answering list_hdas() for real
+                library directories
+        """
+        self.catalog = catalog
         logger.info("HdaBridgeStub initialized")
     
     def run_hda(self, hda_path, parms):
@@ -40,6 +83,25 @@ class HdaBridgeStub:
         logger.debug(f"Returning fake outputs: {outputs}")
         return outputs
     
+    def run_hda_batch(self, hda_path, parm_sets):
+        """Execute an HDA once per parameter set.
+
+        Same interface as HdaBridge.run_hda_batch(); results are produced
+        one at a time, in input order.
+
+        Args:
+            hda_path: Path to HDA file (string)
+            parm_sets: Iterable of HDA parameter dicts
+
+        Returns:
+            Iterator of BatchResult(index, parms, outputs, error, cached)
+        """
+        for index, parms in enumerate(parm_sets):
+            try:
+                yield BatchResult(index, parms, self.run_hda(hda_path, parms), None, False)
+            except Exception as e:
+                yield BatchResult(index, parms, None, e, False)
+
     def list_hdas(self, directory):
         """List available HDAs in a directory.
         
@@ -50,6 +112,8 @@ class HdaBridgeStub:
             hdas: List of HDA file paths
         """
         logger.info(f"HdaBridgeStub.list_hdas() called with directory: {directory}")
+        if self.catalog is not None:
+            return list_hda_files(directory, self.catalog)
         
         # Return fake HDA list
         hdas = [
@@ -61,3 +125,220 @@ class HdaBridgeStub:
         logger.debug(f"Returning fake HDA list: {hdas}")
         return hdas
 
+
+BatchResult = namedtuple("BatchResult", "index parms outputs error cached")
+
+
+class HdaBridge:
+    """HDA bridge backed by a pool of persistent worker processes.
+
+    Same run_hda/list_hdas interface as HdaBridgeStub. run_hda() blocks, so
+    call it from a JobCenter job; run_hda_async() returns a Future and
+    run_hda_batch() streams the results of a parameter sweep.
+
+    Cook results are memoized by the HDA file's SHA-256 plus the canonical
+    parms, so a repeated cook is answered without a worker. Cooks with
+    input geometry, and HDAs that cannot be read (so their content cannot
+    be hashed), are never memoized.
+    """
+
+    def __init__(self, pool, memo_entries=1024, catalog=None):
+        """Initialize HDA bridge.
+
+        Args:
+            pool: HdaWorkerPool
+            memo_entries: Maximum memoized cook results (0 disables)
+            catalog: Optional HdaCatalog answering list_hdas() from its index
+        """
+        self.pool = pool
+        self.catalog = catalog
+        self._memo = ResultCache(memo_entries) if memo_entries else None
+        self._digests = {}  # path -> ((mtime, size), sha256)
+        self._lock = threading.Lock()
+        self.memo_hits = 0
+        logger.info(f"HdaBridge initialized with {pool.size} worker(s)")
+
+    # ---- memoization ----
+
+    def _hda_digest(self, hda_path):
+        """SHA-256 of an HDA file, re-hashed only when mtime/size change."""
+        try:
+            stat = os.stat(hda_path)
+        except OSError:
+            return None
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = self._digests.get(hda_path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        hasher = hashlib.sha256()
+        try:
+            with open(hda_path, "rb") as f:
+                for block in iter(lambda: f.read(1 << 20), b""):
+                    hasher.update(block)
+        except OSError:
+            return None
+        digest = hasher.hexdigest()
+        self._digests[hda_path] = (stamp, digest)
+        return digest
+
+    def _memo_key(self, hda_path):
+        """Return a function parms -> memo key, or None if not memoizable."""
+        if self._memo is None:
+            return None
+        digest = self._hda_digest(hda_path)
+        if digest is None:
+            return None
+        return lambda parms: (digest, normalize_kwargs(parms or {}))
+
+    def _memo_get(self, key):
+        with self._lock:
+            result = self._memo.get(key)
+            if result is not None:
+                self.memo_hits += 1
+            return result
+
+    def _memo_store(self, key, future):
+        if future.cancelled() or future.exception() is not None:
+            return
+        with self._lock:
+            self._memo.put(key, future.result())
+
+    def clear_memo(self):
+        """Drop memoized cook results."""
+        if self._memo is not None:
+            with self._lock:
+                self._memo.clear()
+
+    def run_hda_async(self, hda_path, parms, geometry=None):
+        """Queue an HDA cook.
+
+        Args:
+            hda_path: Path to HDA file (string)
+            parms: HDA parameters (dict)
+            geometry: Optional input mesh, a GeometryBuffer or a dict with
+                points, indices, face_counts and optional normals (copied
+                once into shared memory, freed when the cook is done)
+
+        Returns:
+            concurrent.futures.Future resolving to the outputs dict;
+            outputs["geometry"] is a GeometryBuffer if the HDA returned a
+            mesh (call release() when done)
+        """
+        if geometry is None:
+            make_key = self._memo_key(hda_path)
+            if make_key is not None:
+                key = make_key(parms)
+                cached = self._memo_get(key)
+                if cached is not None:
+                    future = Future()
+                    future.set_result(dict(cached))
+                    return future
+                future = self.pool.submit(hda_path, parms)
+                future.add_done_callback(lambda f: self._memo_store(key, f))
+                return future
+        if isinstance(geometry, dict):
+            geometry = GeometryBuffer.create(**geometry)
+            future = self.pool.submit(hda_path, parms, geometry)
+            future.add_done_callback(lambda _: geometry.release())
+            return future
+        return self.pool.submit(hda_path, parms, geometry)
+
+    def run_hda(self, hda_path, parms, geometry=None):
+        """Execute a Houdini HDA with given parameters.
+
+        Args:
+            hda_path: Path to HDA file (string)
+            parms: HDA parameters (dict)
+            geometry: Optional input mesh (see run_hda_async)
+
+        Returns:
+            outputs: Execution results (dict)
+        """
+        return self.run_hda_async(hda_path, parms, geometry).result()
+
+    def run_hda_batch(self, hda_path, parm_sets):
+        """Cook an HDA over many parameter sets.
+
+        All cooks are queued immediately: memoized sets are answered at
+        once, duplicate sets are cooked once, and the rest are split into
+        one batch request per worker. Iterate the return value to receive
+        results as each cook finishes (completion order, not input order).
+
+        Args:
+            hda_path: Path to HDA file (string)
+            parm_sets: Iterable of HDA parameter dicts
+
+        Returns:
+            Iterator of BatchResult(index, parms, outputs, error, cached)
+        """
+        parm_sets = list(parm_sets)
+        done = queue.Queue()
+        make_key = self._memo_key(hda_path)
+        to_cook = {}  # memo key (or index) -> [indices]
+        for index, parms in enumerate(parm_sets):
+            key = make_key(parms) if make_key is not None else index
+            cached = self._memo_get(key) if make_key is not None else None
+            if cached is not None:
+                done.put(BatchResult(index, parms, dict(cached), None, True))
+            else:
+                to_cook.setdefault(key, []).append(index)
+
+        keys = list(to_cook)
+        futures = self.pool.submit_batch(hda_path, [parm_sets[to_cook[key][0]] for key in keys])
+        for key, future in zip(keys, futures):
+            if make_key is not None:
+                future.add_done_callback(lambda f, k=key: self._memo_store(k, f))
+            future.add_done_callback(lambda f, k=key: self._fan_out(f, to_cook[k], parm_sets, done))
+        logger.info(f"HDA batch: {len(parm_sets)} set(s), {len(keys)} to cook, "
+                    f"{len(parm_sets) - sum(len(v) for v in to_cook.values())} memoized")
+        return self._stream(done, len(parm_sets))
+
+    @staticmethod
+    def _fan_out(future, indices, parm_sets, done):
+        if future.cancelled():
+            outputs, error = None, HdaWorkerError("Cook cancelled")
+        elif future.exception() is not None:
+            outputs, error = None, future.exception()
+        else:
+            outputs, error = future.result(), None
+        for index in indices:
+            done.put(BatchResult(index, parm_sets[index],
+                                 dict(outputs) if outputs is not None else None, error, False))
+
+    @staticmethod
+    def _stream(done, count):
+        for _ in range(count):
+            yield done.get()
+
+    def list_hdas(self, directory):
+        """List available HDAs in a directory.
+
+        Args:
+            directory: Directory path to search for HDAs (string)
+
+        Returns:
+            hdas: Sorted list of HDA file paths
+        """
+        return list_hda_files(directory, self.catalog)
+
+    @property
+    def queue_depth(self):
+        """Number of cooks waiting for a worker."""
+        return self.pool.queue_depth
+
+    @property
+    def busy(self):
+        """Whether any cook is queued or running."""
+        return self.pool.queue_depth > 0 or self.pool.busy_count > 0
+
+    def warm_up(self):
+        """Start the worker processes now instead of on the first cook."""
+        self.pool.warm_up()
+
+    def healthy(self):
+        """Check that the worker pool is usable."""
+        return self.pool.healthy()
+
+    def shutdown(self):
+        """Stop the worker processes."""
+        self.pool.shutdown()
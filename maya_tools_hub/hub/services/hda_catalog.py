@@ -0,0 +1,366 @@
+"""HDA catalog - persistent, incrementally refreshed index of HDA libraries.
+
+Listing and search queries are answered from memory; the file system is
+only touched by refresh(), which stats every file under the library roots
+but re-inspects only files whose mtime or size changed. The index is saved
+as JSON, so a new session can answer queries before its first refresh.
+"""
+import bisect
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from hub.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+HDA_EXTENSIONS = (".hda", ".hdanc", ".hdalc", ".otl", ".otlnc", ".otllc")
+INDEX_VERSION = 1
+
+# Best-effort parsing of uncompressed HDA sections (INDEX__SECTION and
+# DialogScript). Compressed/encrypted libraries yield no definitions; pass
+# an inspector backed by hython for those.
+_OPERATOR_RE = re.compile(rb"Operator:\s*(\S+)\s*\n\s*Label:\s*([^\n]*)\n(?:[^\n]*\n){0,3}?\s*Table:\s*(\S+)")
+_PARM_RE = re.compile(rb'parm\s*\{\s*name\s+"([^"]+)"\s*(?:baseparm\s*)?label\s+"([^"]*)"\s*type\s+(\w+)')
+
+
+def _version_of(type_name):
+    """Version from a namespaced type name (e.g. "studio::rock::2.1" -> "2.1")."""
+    parts = type_name.split("::")
+    if len(parts) > 1 and re.match(r"^\d+(\.\d+)*$", parts[-1]):
+        return parts[-1]
+    return None
+
+
+def inspect_hda_file(path):
+    """Read HDA definitions from a library file without Houdini.
+
+    Args:
+        path: HDA file path
+
+    Returns:
+        List of dicts with type_name, label, category, version and parms
+        ([{"name", "label", "type"}]); empty if nothing could be parsed
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    definitions = []
+    matches = list(_OPERATOR_RE.finditer(data))
+    for i, match in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(data)
+        name = match.group(1).decode("utf-8", "replace")
+        parms = [
+            {"name": m.group(1).decode("utf-8", "replace"),
+             "label": m.group(2).decode("utf-8", "replace"),
+             "type": m.group(3).decode("utf-8", "replace")}
+            for m in _PARM_RE.finditer(data, match.end(), end)
+        ]
+        definitions.append({
+            "type_name": name,
+            "label": match.group(2).decode("utf-8", "replace").strip(),
+            "category": match.group(3).decode("utf-8", "replace"),
+            "version": _version_of(name),
+            "parms": parms,
+        })
+    return definitions
+
+
+def _fuzzy_score(query, text):
+    """Subsequence match score (higher is better), or None if no match."""
+    score = 0
+    position = 0
+    previous = -2
+    for char in query:
+        found = text.find(char, position)
+        if found < 0:
+            return None
+        score += 3 if found == previous + 1 else 1
+        if found == 0 or text[found - 1] in "_:/ .-":
+            score += 2
+        previous = found
+        position = found + 1
+    return score - len(text) * 0.01
+
+
+class HdaCatalog:
+    """Persistent index of HDA libraries with prefix and fuzzy search. Thread-safe."""
+
+    def __init__(self, roots, index_path=None, inspector=inspect_hda_file):
+        """Initialize catalog and load the saved index (no file system scan).
+
+        Args:
+            roots: Library directories to index (searched recursively)
+            index_path: Saved index file (default:
+                ~/.studio_name/maya_tools_hub/hda_catalog.json)
+            inspector: Callable(path) -> list of definition dicts
+        """
+        self.roots = [os.path.normpath(str(root)) for root in roots]
+        self.index_path = Path(index_path or Path.home() / ".studio_name" / "maya_tools_hub" / "hda_catalog.json")
+        self._inspector = inspector
+        self._lock = threading.RLock()
+        self._files = {}  # path -> {"mtime", "size", "definitions"}
+        self._names = []  # sorted [(lowercase name, path, type_name)] for prefix lookup
+        self._subscribers = []
+        self._thread = None
+        self._stop = threading.Event()
+        self.last_refresh = None
+        self._load()
+
+    # ---- persistence ----
+
+    def _load(self):
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable HDA catalog {self.index_path}: {e}")
+            return
+        if data.get("version") != INDEX_VERSION:
+            return
+        files = {path: entry for path, entry in data.get("files", {}).items() if self._under_roots(path)}
+        with self._lock:
+            self._files = files
+            self._rebuild()
+        logger.debug(f"HDA catalog loaded: {len(files)} file(s)")
+
+    def save(self):
+        """Write the index atomically."""
+        with self._lock:
+            data = {"version": INDEX_VERSION, "roots": self.roots, "files": self._files}
+            text = json.dumps(data, separators=(",", ":"))
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix=self.index_path.name + ".", suffix=".tmp",
+                                        dir=str(self.index_path.parent))
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            logger.error(f"Error saving HDA catalog: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _under_roots(self, path):
+        return any(path == root or path.startswith(root + os.sep) for root in self.roots)
+
+    # ---- refresh ----
+
+    def _walk(self, unreachable):
+        """Yield (path, mtime_ns, size) for every HDA file under the roots.
+
+        Args:
+            unreachable: List that collects directories that could not be read
+        """
+        stack = list(self.roots)
+        while stack:
+            directory = stack.pop()
+            try:
+                entries = list(os.scandir(directory))
+            except OSError as e:
+                logger.warning(f"Cannot scan HDA library {directory}: {e}")
+                unreachable.append(directory)
+                continue
+            for entry in entries:
+                try:
+                    if entry.is_dir():
+                        stack.append(entry.path)
+                    elif entry.name.lower().endswith(HDA_EXTENSIONS):
+                        stat = entry.stat()
+                        yield os.path.normpath(entry.path), stat.st_mtime_ns, stat.st_size
+                except OSError:
+                    continue
+
+    def refresh(self):
+        """Incrementally update the index from the library roots.
+
+        Only new or modified files (by mtime/size) are inspected.
+
+        Returns:
+            Dict with added, updated and removed path lists
+        """
+        start = time.perf_counter()
+        with self._lock:
+            known = dict(self._files)
+        files = {}
+        added, updated = [], []
+        unreachable = []
+        for path, mtime, size in self._walk(unreachable):
+            old = known.get(path)
+            if old is not None and old["mtime"] == mtime and old["size"] == size:
+                files[path] = old
+                continue
+            try:
+                definitions = self._inspector(path)
+            except Exception as e:
+                logger.warning(f"Cannot inspect HDA {path}: {e}")
+                definitions = []
+            files[path] = {"mtime": mtime, "size": size, "definitions": definitions}
+            (updated if old is not None else added).append(path)
+        # Keep entries of directories that are unreachable right now (e.g.
+        # network storage hiccups) instead of dropping them
+        for directory in unreachable:
+            prefix = directory + os.sep
+            for path, entry in known.items():
+                if path.startswith(prefix) and path not in files:
+                    files[path] = entry
+        removed = [path for path in known if path not in files]
+
+        changes = {"added": added, "updated": updated, "removed": removed}
+        with self._lock:
+            self._files = files
+            if added or updated or removed:
+                self._rebuild()
+            self.last_refresh = time.time()
+        if added or updated or removed:
+            self.save()
+            self._notify(changes)
+        logger.info(f"HDA catalog refreshed in {time.perf_counter() - start:.2f}s: {len(files)} file(s), "
+                     f"{len(added)} added, {len(updated)} updated, {len(removed)} removed")
+        return changes
+
+    def _rebuild(self):
+        """Rebuild the sorted name list (caller holds the lock)."""
+        names = []
+        for path, entry in self._files.items():
+            names.append((os.path.splitext(os.path.basename(path))[0].lower(), path, ""))
+            for definition in entry.get("definitions", ()):
+                type_name = definition.get("type_name")
+                if not type_name:
+                    continue
+                names.append((type_name.lower(), path, type_name))
+                short = type_name.split("::")
+                if len(short) > 1:
+                    # "studio::rock::2.0" is also found as "rock"
+                    names.append((short[1 if len(short) > 2 else -1].lower(), path, type_name))
+                if definition.get("label"):
+                    names.append((definition["label"].lower(), path, type_name))
+        names.sort()
+        self._names = names
+
+    def start(self, interval=300.0):
+        """Refresh now and then every interval seconds on a daemon thread."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+
+        def loop():
+            while True:
+                try:
+                    self.refresh()
+                except Exception as e:
+                    logger.error(f"HDA catalog refresh failed: {e}", exc_info=True)
+                if self._stop.wait(interval):
+                    return
+
+        self._thread = threading.Thread(target=loop, name="hda-catalog", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop background refreshing."""
+        self._stop.set()
+        self._thread = None
+
+    def subscribe(self, callback):
+        """Register callback(changes) for index updates (called on the refresh thread)."""
+        self._subscribers.append(callback)
+
+    def _notify(self, changes):
+        for callback in list(self._subscribers):
+            try:
+                callback(changes)
+            except Exception as e:
+                logger.error(f"Error in HDA catalog subscriber: {e}", exc_info=True)
+
+    # ---- queries ----
+
+    def list(self, directory=None, recursive=True):
+        """List indexed HDA files.
+
+        Args:
+            directory: Optional directory to restrict to
+            recursive: Include files in sub-directories of directory
+
+        Returns:
+            Sorted list of paths
+        """
+        with self._lock:
+            paths = list(self._files)
+        if directory:
+            directory = os.path.normpath(directory)
+            prefix = directory + os.sep
+            paths = [p for p in paths if p.startswith(prefix)]
+            if not recursive:
+                paths = [p for p in paths if os.path.dirname(p) == directory]
+        return sorted(paths)
+
+    def covers(self, directory):
+        """Check whether a directory lies inside the indexed roots."""
+        return self._under_roots(os.path.normpath(directory))
+
+    def get(self, path):
+        """Get the indexed definitions of an HDA file (or None)."""
+        with self._lock:
+            entry = self._files.get(os.path.normpath(path))
+        return list(entry["definitions"]) if entry else None
+
+    def definitions(self):
+        """Get all indexed definitions, each with its "path"."""
+        with self._lock:
+            return [dict(d, path=path) for path, entry in self._files.items() for d in entry["definitions"]]
+
+    def search(self, query, limit=20, fuzzy=True):
+        """Find HDAs by file name, type name or label.
+
+        Prefix matches come first, then substring matches, then (with fuzzy)
+        subsequence matches ranked by score.
+
+        Args:
+            query: Search text (case-insensitive)
+            limit: Maximum number of results
+            fuzzy: Include subsequence matches
+
+        Returns:
+            List of dicts with path and type_name (None for file-name hits)
+        """
+        query = query.strip().lower()
+        with self._lock:
+            names = self._names
+        results, seen = [], set()
+
+        def add(path, type_name):
+            if (path, type_name) not in seen:
+                seen.add((path, type_name))
+                results.append({"path": path, "type_name": type_name or None})
+            return len(results) >= limit
+
+        start = bisect.bisect_left(names, (query,))
+        for name, path, type_name in names[start:]:
+            if not name.startswith(query) or add(path, type_name):
+                break
+        if len(results) >= limit or not query:
+            return results[:limit]
+        for name, path, type_name in names:
+            if query in name and add(path, type_name):
+                return results
+        if fuzzy:
+            scored = []
+            for name, path, type_name in names:
+                if (path, type_name) in seen:
+                    continue
+                score = _fuzzy_score(query, name)
+                if score is not None:
+                    scored.append((-score, name, path, type_name))
+            scored.sort()
+            for _, _, path, type_name in scored:
+                if add(path, type_name):
+                    break
+        return results[:limit]
+
+    def __len__(self):
+        return len(self._files)
@@ -0,0 +1,86 @@
+"""Houdini HDA worker - run with hython, started by HdaWorkerPool.
+
+Installs each HDA definition once, keeps one node per HDA under /obj and
+re-cooks it with new parameters for every request. Input meshes are read
+from shared memory into the HDA's "input_geo" geometry parm (if it has
+one); the display SOP's geometry is returned through shared memory.
+
+Usage:
+    hython hub/services/hda_hython_worker.py
+"""
+import os
+import sys
+import time
+from array import array
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import hou  # noqa: E402
+
+from hub.services.geo_shm import GeometryBuffer  # noqa: E402
+from hub.services.hda_protocol import serve  # noqa: E402
+
+
+class HouCooker:
+    """Cook handler backed by the hou module."""
+
+    def __init__(self):
+        self.loaded = set()
+        self._nodes = {}  # hda_path -> node instance
+
+    def _node(self, hda_path):
+        node = self._nodes.get(hda_path)
+        if node is None:
+            hou.hda.installFile(hda_path)
+            definition = hou.hda.definitionsInFile(hda_path)[0]
+            node = hou.node("/obj").createNode(definition.nodeTypeName())
+            self._nodes[hda_path] = node
+            self.loaded.add(hda_path)
+        return node
+
+    def cook(self, hda_path, parms, geometry=None):
+        node = self._node(hda_path)
+        start = time.perf_counter()
+        node.setParms(parms)
+        if geometry is not None and node.parm("input_geo") is not None:
+            node.parm("input_geo").set(self._to_hou(geometry))
+        node.cook(force=True)
+        result = {
+            "success": True,
+            "node": node.path(),
+            "log": "\n".join(node.errors() + node.warnings()),
+            "execution_time": time.perf_counter() - start,
+            "worker_pid": os.getpid(),
+        }
+        display = node.displayNode() if hasattr(node, "displayNode") else None
+        if geometry is not None and display is not None:
+            result["geometry"] = self._from_hou(display.geometry())
+        return result
+
+    @staticmethod
+    def _to_hou(geometry):
+        geo = hou.Geometry()
+        geo.createPoints([(0.0, 0.0, 0.0)] * geometry.point_count)
+        geo.setPointFloatAttribValuesFromString("P", geometry.points.tobytes())
+        indices = geometry.indices.tolist()
+        faces, start = [], 0
+        for count in geometry.face_counts.tolist():
+            faces.append(indices[start:start + count])
+            start += count
+        geo.createPolygons(faces)
+        return geo
+
+    @staticmethod
+    def _from_hou(geo):
+        prims = [prim for prim in geo.prims() if prim.type() == hou.primType.Polygon]
+        face_counts = [prim.numVertices() for prim in prims]
+        indices = [vertex.point().number() for prim in prims for vertex in prim.vertices()]
+        output = GeometryBuffer.allocate(len(geo.points()), len(indices), len(face_counts))
+        output.points.cast("B")[:] = geo.pointFloatAttribValuesAsString("P")
+        output.indices[:] = array("i", indices)
+        output.face_counts[:] = array("i", face_counts)
+        return output
+
+
+if __name__ == "__main__":
+    serve(HouCooker())
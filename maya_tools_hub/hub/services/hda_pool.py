@@ -0,0 +1,413 @@
+"""HDA worker pool - long-lived hython processes behind the HDA bridge.
+
+Starting hython costs a license checkout and several seconds of startup, so
+the pool keeps ``size`` worker processes alive and talks to them over the
+frame protocol in hda_protocol. Requests are routed by affinity: a worker
+that already installed an HDA definition gets the requests for it, and an
+idle worker only takes another worker's HDA once the request has waited
+``affinity_wait`` seconds. Workers are recycled after ``max_cooks`` cooks to
+bound leaks inside Houdini, and killed when a cook exceeds ``cook_timeout``.
+Meshes are exchanged through shared memory (see geo_shm); only segment
+descriptors travel through the pipes.
+"""
+import os
+import subprocess
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+
+from hub.core.logging import get_logger
+from hub.services.geo_shm import GeometryBuffer
+from hub.services.hda_protocol import ProtocolError, read_frame, write_frame
+
+logger = get_logger(__name__)
+
+# Package root, so workers can import hub.services.hda_protocol
+_HUB_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class HdaWorkerError(Exception):
+    """Cook failed or the worker process died."""
+
+
+def standin_command(startup=0.0, load=0.1, cook=0.02, python=None):
+    """Worker command for the Python stand-in worker (no Houdini needed).
+
+    Args:
+        startup: Simulated startup time in seconds
+        load: Simulated HDA load time in seconds
+        cook: Simulated cook time in seconds
+        python: Python executable (default: sys.executable)
+    """
+    return [python or sys.executable, "-m", "hub.services.hda_standin_worker",
+            "--startup", str(startup), "--load", str(load), "--cook", str(cook)]
+
+
+def hython_command(hython="hython"):
+    """Worker command for a real Houdini worker.
+
+    Args:
+        hython: Path to the hython executable
+    """
+    return [hython, os.path.join(_HUB_ROOT, "hub", "services", "hda_hython_worker.py")]
+
+
+class _Request:
+    """Queued cook: one parameter set, or a batch sent as one message."""
+
+    __slots__ = ("hda_path", "items", "geometry", "batch", "submitted")
+
+    def __init__(self, hda_path, parm_sets, geometry=None, batch=False):
+        self.hda_path = hda_path
+        self.items = [(parms, Future()) for parms in parm_sets]  # [(parms, future)]
+        self.geometry = geometry
+        self.batch = batch
+        self.submitted = time.monotonic()
+
+
+class _WorkerProcess:
+    """One worker process and its pipes."""
+
+    def __init__(self, command, env):
+        self.proc = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                     env=env, cwd=_HUB_ROOT)
+        self.cooks = 0
+        self.timed_out = False
+        self._next_id = 0
+        self._waiting = False  # a receive() is blocked on the pipe
+        self._lock = threading.Lock()
+
+    def send(self, message):
+        self._next_id += 1
+        message["id"] = self._next_id
+        write_frame(self.proc.stdin, message)
+        return self._next_id
+
+    def receive(self, request_id, timeout=None):
+        """Read the next response; kill the process if it takes longer than timeout.
+
+        A watchdog is used rather than select() because pipes cannot be
+        polled on Windows; the kill makes the blocked read fail. A watchdog
+        that fires just as the response arrives may still kill the process
+        (timed_out is set): the response is returned, but the worker must
+        not be reused.
+        """
+        watchdog = None
+        if timeout:
+            with self._lock:
+                self._waiting = True
+            watchdog = threading.Timer(timeout, self._expire)
+            watchdog.daemon = True
+            watchdog.start()
+        try:
+            response = read_frame(self.proc.stdout)
+        finally:
+            if watchdog is not None:
+                with self._lock:
+                    self._waiting = False
+                watchdog.cancel()
+        if response.get("id") != request_id:
+            raise ProtocolError(f"Response id {response.get('id')} != request id {request_id}")
+        return response
+
+    def _expire(self):
+        with self._lock:
+            if not self._waiting:
+                return  # the read finished first
+            self.timed_out = True
+            self.proc.kill()
+
+    def stop(self, timeout=5.0):
+        try:
+            if self.proc.poll() is None:
+                write_frame(self.proc.stdin, {"id": 0, "op": "shutdown"})
+            self.proc.stdin.close()
+            self.proc.wait(timeout)
+        except (OSError, ValueError, subprocess.TimeoutExpired):
+            self.proc.kill()
+            self.proc.wait()
+        finally:
+            self.proc.stdout.close()
+
+
+class HdaWorkerPool:
+    """Pool of persistent HDA worker processes. Thread-safe."""
+
+    def __init__(self, command, size=2, max_cooks=200, affinity_wait=0.25, env=None, cook_timeout=None):
+        """Initialize pool. Workers start on the first submit() or warm_up().
+
+        Args:
+            command: Worker command line (see standin_command / hython_command)
+            size: Number of worker processes
+            max_cooks: Recycle a worker after this many cooks
+            affinity_wait: Seconds a request waits for a worker that has its
+                HDA loaded before any idle worker takes it
+            env: Optional environment overrides for the workers
+            cook_timeout: Seconds a cook may take before its worker is killed
+                and the cook fails with HdaWorkerError (None: no limit)
+        """
+        self.command = list(command)
+        self.size = size
+        self.max_cooks = max_cooks
+        self.affinity_wait = affinity_wait
+        self.cook_timeout = cook_timeout
+        self._env = dict(os.environ, **(env or {}))
+        self._env["PYTHONPATH"] = os.pathsep.join(
+            p for p in (_HUB_ROOT, self._env.get("PYTHONPATH")) if p
+        )
+        self._cond = threading.Condition()
+        self._pending = deque()
+        self._loaded = [set() for _ in range(size)]  # slot -> HDA paths loaded
+        self._threads = []
+        self._closed = False
+        self._busy = 0
+        self._stats = {"cooks": 0, "spawned": 0, "recycled": 0, "crashed": 0, "timeouts": 0,
+                       "affinity_hits": 0}
+
+    # ---- public API ----
+
+    def warm_up(self):
+        """Start all worker processes now instead of on first use."""
+        with self._cond:
+            self._start_threads()
+
+    def submit(self, hda_path, parms=None, geometry=None):
+        """Queue a cook.
+
+        Args:
+            hda_path: Path to the HDA file
+            parms: Parameter dict
+            geometry: Optional input GeometryBuffer; it must stay alive until
+                the future is done
+
+        Returns:
+            concurrent.futures.Future resolving to the worker's result dict
+            (or raising HdaWorkerError). If the cook returned a mesh,
+            result["geometry"] is a GeometryBuffer owned by the caller
+            (call release() when done).
+        """
+        descriptor = geometry.descriptor() if geometry is not None else None
+        request = _Request(os.path.normpath(hda_path), [dict(parms or {})], descriptor)
+        self._enqueue([request])
+        return request.items[0][1]
+
+    def submit_batch(self, hda_path, parm_sets):
+        """Queue many cooks of one HDA.
+
+        The parameter sets are split into one chunk per worker; each chunk
+        travels as a single request and the worker streams a response per
+        set, so each future resolves as soon as its cook finishes.
+
+        Args:
+            hda_path: Path to the HDA file
+            parm_sets: Iterable of parameter dicts
+
+        Returns:
+            List of Futures, one per parameter set, in input order
+        """
+        parm_sets = [dict(parms or {}) for parms in parm_sets]
+        if not parm_sets:
+            return []
+        hda_path = os.path.normpath(hda_path)
+        chunk = -(-len(parm_sets) // self.size)
+        requests = [
+            _Request(hda_path, parm_sets[i:i + chunk], batch=True)
+            for i in range(0, len(parm_sets), chunk)
+        ]
+        self._enqueue(requests)
+        return [future for request in requests for _, future in request.items]
+
+    def _enqueue(self, requests):
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("HdaWorkerPool is shut down")
+            self._start_threads()
+            self._pending.extend(requests)
+            self._cond.notify_all()
+
+    @property
+    def queue_depth(self):
+        """Number of cooks waiting for a worker."""
+        return sum(len(request.items) for request in list(self._pending))
+
+    @property
+    def busy_count(self):
+        """Number of workers currently cooking."""
+        return self._busy
+
+    def healthy(self):
+        """Check that the pool is open and its worker threads are running."""
+        return not self._closed and all(thread.is_alive() for thread in self._threads)
+
+    def stats(self):
+        """Get pool counters (cooks, spawned, recycled, crashed, timeouts, affinity_hits)."""
+        with self._cond:
+            return dict(self._stats, queue_depth=sum(len(r.items) for r in self._pending), busy=self._busy,
+                        loaded=[sorted(s) for s in self._loaded])
+
+    def shutdown(self, wait=True):
+        """Stop all workers; pending requests are cancelled."""
+        with self._cond:
+            self._closed = True
+            pending, self._pending = self._pending, deque()
+            self._cond.notify_all()
+        for request in pending:
+            for _, future in request.items:
+                future.cancel()
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+    # ---- worker threads ----
+
+    def _start_threads(self):
+        if self._threads:
+            return
+        for slot in range(self.size):
+            thread = threading.Thread(target=self._run, args=(slot,), name=f"hda-worker-{slot}", daemon=True)
+            self._threads.append(thread)
+            thread.start()
+
+    def _spawn(self, slot):
+        worker = _WorkerProcess(self.command, self._env)
+        with self._cond:
+            self._loaded[slot] = set()
+            self._stats["spawned"] += 1
+        logger.debug(f"HDA worker {slot} started (pid {worker.proc.pid})")
+        return worker
+
+    def _take(self, slot):
+        """Block until a request suits this worker; None on shutdown."""
+        with self._cond:
+            while True:
+                if self._closed:
+                    return None
+                request = self._pick(slot) if self._pending else None
+                if request is not None:
+                    self._pending.remove(request)
+                    self._busy += 1
+                    return request
+                self._cond.wait(self.affinity_wait if self._pending else None)
+
+    def _pick(self, slot):
+        """Affinity routing (caller holds the lock)."""
+        mine = self._loaded[slot]
+        for request in self._pending:
+            if request.hda_path in mine:
+                self._stats["affinity_hits"] += 1
+                return request
+        others = set().union(*(s for i, s in enumerate(self._loaded) if i != slot))
+        now = time.monotonic()
+        for request in self._pending:
+            if request.hda_path not in others or now - request.submitted >= self.affinity_wait:
+                return request
+        return None
+
+    def _run(self, slot):
+        worker = self._try_spawn(slot)
+        try:
+            while True:
+                request = self._take(slot)
+                if request is None:
+                    return
+                try:
+                    live = [(parms, future) for parms, future in request.items
+                            if future.set_running_or_notify_cancel()]
+                    if not live:
+                        continue
+                    if worker is None:
+                        worker = self._try_spawn(slot)
+                    if worker is None:
+                        for _, future in live:
+                            future.set_exception(HdaWorkerError(f"Cannot start worker: {self.command}"))
+                        continue
+                    worker = self._cook(slot, worker, request, live)
+                finally:
+                    with self._cond:
+                        self._busy -= 1
+        finally:
+            if worker is not None:
+                worker.stop()
+
+    @staticmethod
+    def _resolve(future, response):
+        if response.get("ok"):
+            result = response.get("result")
+            if isinstance(result, dict) and isinstance(result.get("geometry"), dict):
+                # Map the worker's output segment before it sees another
+                # request (it unmaps it then); the caller owns it from here
+                result["geometry"] = GeometryBuffer.from_descriptor(result["geometry"], owner=True)
+            future.set_result(result)
+        else:
+            future.set_exception(HdaWorkerError(response.get("error", "Cook failed")))
+
+    def _try_spawn(self, slot):
+        try:
+            return self._spawn(slot)
+        except OSError as e:
+            logger.error(f"Could not start HDA worker {slot}: {e}")
+            return None
+
+    def _cook(self, slot, worker, request, live):
+        """Run one request on a worker; return the worker to use next.
+
+        Args:
+            live: The request's (parms, future) items that were not cancelled
+        """
+        if request.batch:
+            message = {"op": "cook_batch", "hda_path": request.hda_path, "items": [p for p, _ in live]}
+        else:
+            message = {"op": "cook", "hda_path": request.hda_path, "parms": live[0][0]}
+            if request.geometry is not None:
+                message["geometry"] = request.geometry
+        try:
+            request_id = worker.send(message)
+            if request.batch:
+                # One frame per parameter set as it finishes, then a final one
+                while True:
+                    response = worker.receive(request_id, self.cook_timeout)
+                    if response.get("done"):
+                        break
+                    self._resolve(live[response["index"]][1], response)
+                for _, future in live:
+                    if not future.done():
+                        future.set_exception(HdaWorkerError(response.get("error", "No result from worker")))
+            else:
+                response = worker.receive(request_id, self.cook_timeout)
+                self._resolve(live[0][1], response)
+        except (ProtocolError, OSError, IndexError, KeyError) as e:
+            if worker.timed_out:
+                error = f"Cook timed out after {self.cook_timeout:g}s"
+                logger.error(f"HDA worker {slot} killed: cooking {request.hda_path} took over "
+                             f"{self.cook_timeout:g}s")
+            else:
+                error = f"Worker died: {e}"
+                logger.error(f"HDA worker {slot} died while cooking {request.hda_path}: {e}")
+            for _, future in live:
+                if not future.done():
+                    future.set_exception(HdaWorkerError(error))
+            with self._cond:
+                self._stats["timeouts" if worker.timed_out else "crashed"] += 1
+            worker.stop()
+            return self._try_spawn(slot)
+
+        worker.cooks += len(live)
+        with self._cond:
+            self._loaded[slot] = set(response.get("loaded", ()))
+            self._stats["cooks"] += len(live)
+
+        if worker.timed_out or worker.proc.poll() is not None:
+            # Killed by a late watchdog (or exited) after answering
+            logger.debug(f"Replacing HDA worker {slot}: process gone after its cook")
+            worker.stop()
+            return self._try_spawn(slot)
+
+        if worker.cooks >= self.max_cooks:
+            logger.debug(f"Recycling HDA worker {slot} after {worker.cooks} cooks")
+            worker.stop()
+            with self._cond:
+                self._stats["recycled"] += 1
+            return self._try_spawn(slot)
+        return worker
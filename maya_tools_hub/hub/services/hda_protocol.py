@@ -0,0 +1,159 @@
+"""HDA worker protocol - length-prefixed JSON frames over pipes.
+
+Each frame is a 4-byte big-endian length followed by a UTF-8 JSON object.
+The pool writes requests to a worker's stdin and reads responses from its
+stdout:
+
+    request:  {"id": 1, "op": "cook", "hda_path": "...", "parms": {...},
+               "geometry": {"shm": "...", ...}}           (geometry optional)
+              {"id": 2, "op": "cook_batch", "hda_path": "...", "items": [{...}, ...]}
+              {"id": 3, "op": "ping"}
+              {"id": 4, "op": "shutdown"}
+    response: {"id": 1, "ok": true, "result": {...}, "loaded": [...]}
+              (result["geometry"] is a descriptor when the cook returns a mesh)
+              {"id": 1, "ok": false, "error": "...", "loaded": [...]}
+
+A cook_batch gets one response per item as soon as it is cooked, tagged
+with its "index" (results may stream in any order), followed by a final
+{"id": 2, "ok": true, "done": true, "loaded": [...]}.
+
+"loaded" lists the HDA files the worker has installed, which the pool uses
+for affinity routing. Meshes never go through the frames: they travel as
+shared-memory segments (see geo_shm) and only descriptors are sent. A
+worker keeps its output segment mapped until the next request, so the hub
+can map it first. Standard library only, so both hython workers and the
+hub can import it.
+"""
+import json
+import os
+import struct
+import sys
+
+from hub.services.geo_shm import GeometryBuffer
+
+_HEADER = struct.Struct(">I")
+MAX_FRAME = 64 * 1024 * 1024
+
+
+class ProtocolError(Exception):
+    """Malformed frame or closed stream."""
+
+
+def write_frame(stream, message):
+    """Write one message as a frame and flush.
+
+    Args:
+        stream: Binary writable stream
+        message: JSON-serializable dict
+    """
+    data = json.dumps(message, separators=(",", ":")).encode("utf-8")
+    stream.write(_HEADER.pack(len(data)) + data)
+    stream.flush()
+
+
+def _read_exact(stream, size):
+    data = stream.read(size)
+    while data is not None and len(data) < size:
+        more = stream.read(size - len(data))
+        if not more:
+            break
+        data += more
+    if not data or len(data) < size:
+        raise ProtocolError("Stream closed")
+    return data
+
+
+def read_frame(stream):
+    """Read one frame.
+
+    Args:
+        stream: Binary readable stream
+
+    Returns:
+        Decoded message dict
+
+    Raises:
+        ProtocolError: Stream closed or frame malformed
+    """
+    (size,) = _HEADER.unpack(_read_exact(stream, _HEADER.size))
+    if size > MAX_FRAME:
+        raise ProtocolError(f"Frame too large: {size} bytes")
+    try:
+        return json.loads(_read_exact(stream, size))
+    except ValueError as e:
+        raise ProtocolError(f"Malformed frame: {e}")
+
+
+def claim_stdio():
+    """Reserve stdin/stdout for frames (worker side).
+
+    Anything else the process prints (including Houdini's own output) is
+    redirected to stderr so it cannot corrupt the frame stream.
+
+    Returns:
+        (input_stream, output_stream) binary streams
+    """
+    sys.stdout.flush()
+    output = os.fdopen(os.dup(1), "wb")
+    os.dup2(2, 1)
+    sys.stdout = sys.stderr
+    return sys.stdin.buffer, output
+
+
+def serve(handler):
+    """Run a worker loop until shutdown or EOF (worker side).
+
+    Args:
+        handler: Object with cook(hda_path, parms, geometry=None) -> dict and
+            a ``loaded`` collection of installed HDA paths. geometry is a
+            mapped GeometryBuffer; a GeometryBuffer in the result's
+            "geometry" key is handed to the hub.
+    """
+    stream_in, stream_out = claim_stdio()
+    held = None  # output segment kept mapped until the hub has mapped it
+    while True:
+        try:
+            request = read_frame(stream_in)
+        except ProtocolError:
+            return
+        if held is not None:
+            held.release()
+            held = None
+        op = request.get("op")
+        response = {"id": request.get("id"), "ok": True}
+        if op == "shutdown":
+            write_frame(stream_out, response)
+            return
+        try:
+            if op == "cook":
+                geometry = request.get("geometry")
+                geometry = GeometryBuffer.from_descriptor(geometry) if geometry else None
+                try:
+                    result = handler.cook(request["hda_path"], request.get("parms") or {}, geometry=geometry)
+                finally:
+                    if geometry is not None:
+                        geometry.release()
+                output = result.get("geometry") if isinstance(result, dict) else None
+                if isinstance(output, GeometryBuffer):
+                    output.disown()
+                    held = output
+                    result = dict(result, geometry=output.descriptor())
+                response["result"] = result
+            elif op == "cook_batch":
+                for index, parms in enumerate(request.get("items") or ()):
+                    item = {"id": request.get("id"), "index": index, "ok": True}
+                    try:
+                        item["result"] = handler.cook(request["hda_path"], parms or {})
+                    except Exception as e:
+                        item = {"id": request.get("id"), "index": index, "ok": False,
+                                "error": f"{type(e).__name__}: {e}"}
+                    write_frame(stream_out, item)
+                response["done"] = True
+            elif op != "ping":
+                raise ValueError(f"Unknown op: {op}")
+        except Exception as e:
+            response = {"id": request.get("id"), "ok": False, "error": f"{type(e).__name__}: {e}"}
+            if op == "cook_batch":
+                response["done"] = True
+        response["loaded"] = sorted(handler.loaded)
+        write_frame(stream_out, response)
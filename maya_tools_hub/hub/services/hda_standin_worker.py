@@ -0,0 +1,72 @@
+"""Stand-in HDA worker - speaks the worker protocol without Houdini.
+
+Simulates hython startup, a one-time HDA definition load per worker and a
+cook, so HdaWorkerPool can be tested and benchmarked anywhere.
+
+Usage (normally started by HdaWorkerPool):
+    python -m hub.services.hda_standin_worker [--startup 0.5] [--load 0.2] [--cook 0.05]
+"""
+import argparse
+import os
+import time
+
+from hub.services.geo_shm import GeometryBuffer
+from hub.services.hda_protocol import serve
+
+
+class StandinCooker:
+    """Fake cook handler with simulated load and cook times."""
+
+    def __init__(self, load_time, cook_time):
+        self.load_time = load_time
+        self.cook_time = cook_time
+        self.loaded = set()
+        self.cook_count = 0
+
+    def cook(self, hda_path, parms, geometry=None):
+        if parms.get("fail"):
+            raise RuntimeError(f"Cook failed for {os.path.basename(hda_path)}")
+        if hda_path not in self.loaded:
+            time.sleep(self.load_time)  # hou.hda.installFile()
+            self.loaded.add(hda_path)
+        start = time.perf_counter()
+        time.sleep(float(parms.get("cook_time", self.cook_time)))
+        self.cook_count += 1
+        name = os.path.splitext(os.path.basename(hda_path))[0]
+        result = {
+            "success": True,
+            "output_geo": f"/standin/cooks/{name}_{os.getpid()}_{self.cook_count}.bgeo",
+            "log": "HDA execution completed (stand-in)",
+            "execution_time": time.perf_counter() - start,
+            "worker_pid": os.getpid(),
+            "cook_count": self.cook_count,
+        }
+        if geometry is not None:
+            # Pass-through "cook": copy the input mesh into an output segment
+            output = GeometryBuffer.allocate(geometry.point_count, geometry.index_count,
+                                             geometry.face_count, normals=geometry.has_normals)
+            for target, source in ((output.points, geometry.points), (output.normals, geometry.normals),
+                                   (output.indices, geometry.indices),
+                                   (output.face_counts, geometry.face_counts)):
+                if source is not None and len(source):
+                    target[:] = source
+            result["geometry"] = output
+        elif "mesh" in parms:
+            # Pass-through of a mesh serialized into the parms (benchmarks)
+            result["mesh"] = parms["mesh"]
+        return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stand-in HDA worker")
+    parser.add_argument("--startup", type=float, default=0.0, help="Simulated startup time (s)")
+    parser.add_argument("--load", type=float, default=0.1, help="Simulated HDA load time (s)")
+    parser.add_argument("--cook", type=float, default=0.02, help="Simulated cook time (s)")
+    args = parser.parse_args()
+
+    time.sleep(args.startup)
+    serve(StandinCooker(args.load, args.cook))
+
+
+if __name__ == "__main__":
+    main()
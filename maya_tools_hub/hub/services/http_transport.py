@@ -0,0 +1,347 @@
+"""HTTP transport - pooled keep-alive JSON client for hub services.
+
+Standard library only (http.client), so it runs inside any Maya Python.
+Provides:
+- a per-host connection pool with HTTP/1.1 keep-alive
+- gzip request/response bodies
+- retry with full-jitter exponential backoff (honors Retry-After)
+- a circuit breaker that fails fast while the service is down
+"""
+import gzip
+import http.client
+import json
+import random
+import socket
+import threading
+import time
+from collections import deque
+from urllib.parse import urlsplit
+
+from hub.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+RETRY_STATUSES = frozenset((429, 502, 503, 504))
+IDEMPOTENT_METHODS = frozenset(("GET", "HEAD", "PUT", "DELETE", "OPTIONS"))
+
+
+class TransportError(Exception):
+    """Request could not be completed."""
+
+
+class HttpError(TransportError):
+    """Service answered with an error status."""
+
+    def __init__(self, status, reason="", body=None):
+        super().__init__(f"HTTP {status} {reason}".strip())
+        self.status = status
+        self.body = body
+
+
+class CircuitOpenError(TransportError):
+    """Circuit breaker is open; the request was not sent."""
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker.
+
+    closed -> open after failure_threshold consecutive failures; open ->
+    half-open after reset_timeout, letting one trial request through; the
+    trial closes the circuit on success or re-opens it on failure.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold=5, reset_timeout=30.0, clock=time.monotonic):
+        """Initialize breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds to stay open before a trial request
+            clock: Monotonic time source
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_running = False
+
+    @property
+    def state(self):
+        """Current state (closed, open or half_open)."""
+        with self._lock:
+            if self._state == self.OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+                return self.HALF_OPEN
+            return self._state
+
+    def allow(self):
+        """Check whether a request may be sent now."""
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.OPEN:
+                if self._clock() - self._opened_at < self.reset_timeout:
+                    return False
+                self._state = self.HALF_OPEN
+            if self._trial_running:
+                return False
+            self._trial_running = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._trial_running = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != self.OPEN:
+                    logger.warning(f"Circuit opened after {self._failures} failure(s)")
+                self._state = self.OPEN
+                self._opened_at = self._clock()
+            self._trial_running = False
+
+
+def _nodelay(cls):
+    """Connection class that disables Nagle, so small requests on kept-alive
+    connections are not held back waiting for delayed ACKs."""
+
+    class Connection(cls):
+        def connect(self):
+            super().connect()
+            self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    Connection.__name__ = cls.__name__
+    return Connection
+
+
+_HTTPConnection = _nodelay(http.client.HTTPConnection)
+_HTTPSConnection = _nodelay(http.client.HTTPSConnection)
+
+
+class ConnectionPool:
+    """Bounded pool of keep-alive connections to one host."""
+
+    def __init__(self, base_url, max_size=4, timeout=10.0):
+        """Initialize pool.
+
+        Args:
+            base_url: Service base URL (http:// or https://)
+            max_size: Maximum number of connections (idle + in use)
+            timeout: Socket timeout in seconds
+        """
+        parts = urlsplit(base_url)
+        if parts.scheme not in ("http", "https"):
+            raise ValueError(f"Unsupported URL scheme: {base_url}")
+        self.scheme = parts.scheme
+        self.host = parts.hostname
+        self.port = parts.port
+        self.base_path = parts.path.rstrip("/")
+        self.max_size = max_size
+        self.timeout = timeout
+        self._idle = deque()
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._lock = threading.Lock()
+        self.created = 0
+        self.in_use = 0
+
+    def acquire(self):
+        """Get a connection, blocking while max_size connections are in use.
+
+        Returns:
+            (connection, reused) tuple
+        """
+        self._slots.acquire()
+        with self._lock:
+            self.in_use += 1
+            if self._idle:
+                return self._idle.pop(), True
+            self.created += 1
+        cls = _HTTPSConnection if self.scheme == "https" else _HTTPConnection
+        return cls(self.host, self.port, timeout=self.timeout), False
+
+    def release(self, conn, reuse=True):
+        """Return a connection to the pool (or close it if not reusable)."""
+        with self._lock:
+            self.in_use -= 1
+            if reuse:
+                self._idle.append(conn)
+        if not reuse:
+            conn.close()
+        self._slots.release()
+
+    def close(self):
+        """Close all idle connections."""
+        with self._lock:
+            while self._idle:
+                self._idle.pop().close()
+
+
+class HttpTransport:
+    """JSON-over-HTTP transport with pooling, gzip, retry and circuit breaking.
+
+    Thread-safe: any number of threads may call request(); at most pool_size
+    requests are in flight at once, each on a reused keep-alive connection.
+    """
+
+    def __init__(self, base_url, pool_size=4, timeout=10.0, retries=3, backoff=0.2,
+                 max_backoff=5.0, breaker=None, gzip_min_size=1024, headers=None):
+        """Initialize transport.
+
+        Args:
+            base_url: Service base URL
+            pool_size: Maximum concurrent connections
+            timeout: Socket timeout in seconds
+            retries: Retry attempts after the first try
+            backoff: Base delay for exponential backoff in seconds
+            max_backoff: Backoff delay cap in seconds
+            breaker: Optional CircuitBreaker (default: a new one)
+            gzip_min_size: Compress request bodies at least this large
+            headers: Optional extra headers for every request
+        """
+        self.pool = ConnectionPool(base_url, pool_size, timeout)
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.breaker = breaker or CircuitBreaker()
+        self.gzip_min_size = gzip_min_size
+        self.headers = {"Accept": "application/json", "Accept-Encoding": "gzip"}
+        self.headers.update(headers or {})
+        self.stats = {"requests": 0, "retries": 0, "reconnects": 0}
+        self._stats_lock = threading.Lock()
+
+    def _count(self, name):
+        """Increment a stats counter (request() runs on many threads)."""
+        with self._stats_lock:
+            self.stats[name] += 1
+
+    def request(self, method, path, body=None, headers=None, idempotent=None):
+        """Send a request and decode the JSON response.
+
+        Args:
+            method: HTTP method
+            path: Path relative to the base URL
+            body: Optional JSON-serializable body
+            headers: Optional extra headers
+            idempotent: Whether the request may be retried after it was sent
+                (default: by method; pass True for POSTs carrying an
+                Idempotency-Key)
+
+        Returns:
+            Decoded JSON response, or None for an empty body
+
+        Raises:
+            HttpError: Non-retryable error status, or retries exhausted
+            CircuitOpenError: Circuit breaker is open
+            TransportError: Connection failed and retries exhausted
+        """
+        if idempotent is None:
+            idempotent = method in IDEMPOTENT_METHODS
+        payload, req_headers = self._encode(body, headers)
+        url = self.pool.base_path + path
+        self._count("requests")
+
+        attempt = 0
+        while True:
+            if not self.breaker.allow():
+                raise CircuitOpenError(f"Circuit open for {self.pool.host}")
+            try:
+                status, reason, resp_headers, data = self._send(method, url, payload, req_headers, idempotent)
+            except (OSError, http.client.HTTPException) as e:
+                self.breaker.record_failure()
+                error, retry_after = TransportError(f"{method} {path} failed: {e}"), None
+                retryable = idempotent
+            else:
+                if status < 500:
+                    self.breaker.record_success()
+                else:
+                    self.breaker.record_failure()
+                if status < 400:
+                    return self._decode(resp_headers, data)
+                error = HttpError(status, reason, self._decode(resp_headers, data, strict=False))
+                retry_after = resp_headers.get("retry-after")
+                retryable = status in RETRY_STATUSES and (idempotent or status in (429, 503))
+            if not retryable or attempt >= self.retries:
+                raise error
+            attempt += 1
+            self._count("retries")
+            delay = self._delay(attempt, retry_after)
+            logger.debug(f"{method} {path}: {error}; retry {attempt}/{self.retries} in {delay:.2f}s")
+            time.sleep(delay)
+
+    def _send(self, method, url, payload, headers, idempotent):
+        """Send once on a pooled connection, reconnecting if a kept-alive one went stale.
+
+        A stale connection is only resent automatically when the request
+        is idempotent, or when it failed while being written. A failure
+        while waiting for the response may come after the server already
+        processed the request, so it is raised instead.
+        """
+        while True:
+            conn, reused = self.pool.acquire()
+            written = False
+            try:
+                conn.request(method, url, body=payload, headers=headers)
+                written = True
+                resp = conn.getresponse()
+                data = resp.read()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                self.pool.release(conn, reuse=False)
+                if not reused or (written and not idempotent):
+                    raise
+                # Server closed an idle keep-alive connection; resend on a
+                # fresh connection
+                self._count("reconnects")
+                continue
+            except BaseException:
+                self.pool.release(conn, reuse=False)
+                raise
+            self.pool.release(conn, reuse=not resp.will_close)
+            resp_headers = {k.lower(): v for k, v in resp.getheaders()}
+            return resp.status, resp.reason, resp_headers, data
+
+    def _encode(self, body, headers):
+        req_headers = dict(self.headers)
+        req_headers.update(headers or {})
+        if body is None:
+            return None, req_headers
+        payload = json.dumps(body, separators=(",", ":")).encode("utf-8")
+        req_headers["Content-Type"] = "application/json"
+        if len(payload) >= self.gzip_min_size:
+            payload = gzip.compress(payload, compresslevel=5)
+            req_headers["Content-Encoding"] = "gzip"
+        return payload, req_headers
+
+    @staticmethod
+    def _decode(headers, data, strict=True):
+        if headers.get("content-encoding") == "gzip":
+            data = gzip.decompress(data)
+        if not data:
+            return None
+        try:
+            return json.loads(data)
+        except ValueError:
+            if strict:
+                raise TransportError("Response is not valid JSON")
+            return data.decode("utf-8", "replace")
+
+    def _delay(self, attempt, retry_after=None):
+        """Full-jitter exponential backoff, or the server's Retry-After."""
+        if retry_after:
+            try:
+                return min(float(retry_after), self.max_backoff)
+            except ValueError:
+                pass
+        return random.uniform(0, min(self.max_backoff, self.backoff * (2 ** (attempt - 1))))
+
+    def close(self):
+        """Close pooled connections."""
+        self.pool.close()
@@ -0,0 +1,338 @@
+"""Service registry - lazily built, health-checked, idle-released services.
+
+ToolContext.services is a ServiceRegistry: a read-only mapping whose values
+are built by their factory on first access, so a session that never uses
+AIGC or HDA never opens a connection or spawns a worker. Services can be
+warmed up in the background, are health-checked periodically by start(),
+and are torn down after ``idle_timeout`` seconds without access (the next
+access builds a fresh instance). Code that keeps using an instance across
+a long operation holds a lease (``with services.lease("aigc") as client``),
+so the instance is never torn down for being idle under it.
+
+Teardown calls the instance's shutdown(), close() or stop() method (first
+found) unless a teardown callable is declared. Instances with a healthy()
+method are checked with it unless a health_check callable is declared.
+Lifecycle changes are published as service/started, service/stopped and
+service/unhealthy events.
+"""
+import atexit
+import threading
+import time
+import weakref
+from collections.abc import Mapping
+from contextlib import contextmanager, nullcontext
+
+from hub.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+_live_registries = weakref.WeakSet()
+
+
+class ServiceError(Exception):
+    """A service factory failed."""
+
+
+class _Entry:
+    """Declared service and its current instance."""
+
+    def __init__(self, name, factory, warm, health_check, idle_timeout, in_use, teardown):
+        self.name = name
+        self.factory = factory
+        self.warm = warm
+        self.health_check = health_check
+        self.idle_timeout = idle_timeout
+        self.in_use = in_use
+        self.teardown = teardown
+        self.lock = threading.Lock()  # serializes build/teardown
+        self.built = False
+        self.instance = None
+        self.last_used = 0.0
+        self.leases = 0
+        self.builds = 0
+
+
+class ServiceRegistry(Mapping):
+    """Mapping of service name -> lazily built instance. Thread-safe."""
+
+    def __init__(self, event_bus=None):
+        """Initialize registry.
+
+        Args:
+            event_bus: Optional EventBus for service/* lifecycle events
+        """
+        self._event_bus = event_bus
+        self._entries = {}
+        self._thread = None
+        self._stop = threading.Event()
+        _live_registries.add(self)
+
+    def declare(self, name, factory, warm=False, health_check=None, idle_timeout=None,
+                in_use=None, teardown=None):
+        """Declare a service (nothing is built yet).
+
+        Args:
+            name: Service name (e.g. "aigc")
+            factory: Callable() -> instance (None is a valid instance)
+            warm: Build in the background when warm_up() is called
+            health_check: Callable(instance) -> bool; default: the
+                instance's healthy() method, if any
+            idle_timeout: Tear down after this many seconds without access
+                (None keeps the instance for the session)
+            in_use: Callable(instance) -> bool; an instance that is in use
+                is never torn down for being idle
+            teardown: Callable(instance); default: its shutdown(), close()
+                or stop() method
+        """
+        if name in self._entries:
+            self.teardown(name)
+        self._entries[name] = _Entry(name, factory, warm, health_check, idle_timeout, in_use, teardown)
+
+    # ---- mapping ----
+
+    def __getitem__(self, name):
+        entry = self._entries[name]
+        entry.last_used = time.monotonic()
+        if entry.built:
+            return entry.instance
+        return self._build(entry)
+
+    def __contains__(self, name):
+        return name in self._entries
+
+    def __iter__(self):
+        return iter(list(self._entries))
+
+    def __len__(self):
+        return len(self._entries)
+
+    @contextmanager
+    def lease(self, name):
+        """Use a service for the duration of a block.
+
+        While leased, the instance is not torn down for being idle, and the
+        idle clock restarts when the lease is released.
+
+        Args:
+            name: Service name
+
+        Yields:
+            The service instance
+        """
+        entry = self._entries[name]
+        with entry.lock:
+            entry.leases += 1
+        try:
+            yield self[name]
+        finally:
+            with entry.lock:
+                entry.leases -= 1
+                entry.last_used = time.monotonic()
+
+    # Registries compare by identity (Mapping would compare instances)
+    __eq__ = object.__eq__
+    __hash__ = object.__hash__
+
+    # ---- lifecycle ----
+
+    def _build(self, entry):
+        with entry.lock:
+            if entry.built:
+                return entry.instance
+            start = time.perf_counter()
+            try:
+                instance = entry.factory()
+            except Exception as e:
+                logger.error(f"Service '{entry.name}' failed to start: {e}", exc_info=True)
+                raise ServiceError(f"Service '{entry.name}' failed to start: {e}") from e
+            entry.instance = instance
+            entry.built = True
+            entry.builds += 1
+            entry.last_used = time.monotonic()
+        elapsed = (time.perf_counter() - start) * 1000
+        logger.info(f"Service '{entry.name}' started in {elapsed:.1f}ms")
+        self._publish("service/started", {"name": entry.name, "ms": elapsed, "builds": entry.builds})
+        return instance
+
+    def is_built(self, name):
+        """Check whether a service currently has an instance."""
+        return self._entries[name].built
+
+    def warm_up(self, names=None):
+        """Build services on a background thread (and call their warm_up()).
+
+        Args:
+            names: Services to warm (default: those declared with warm=True)
+
+        Returns:
+            The started thread
+        """
+        names = list(names) if names is not None else [n for n, e in self._entries.items() if e.warm]
+
+        def warm():
+            for name in names:
+                try:
+                    instance = self[name]
+                    if hasattr(instance, "warm_up"):
+                        instance.warm_up()
+                except Exception as e:
+                    logger.warning(f"Warm-up of service '{name}' failed: {e}")
+
+        thread = threading.Thread(target=warm, name="service-warm-up", daemon=True)
+        thread.start()
+        return thread
+
+    def teardown(self, name):
+        """Tear down a service's instance; the next access builds a new one.
+
+        Returns:
+            True if an instance was torn down
+        """
+        entry = self._entries[name]
+        with entry.lock:
+            if not entry.built:
+                return False
+            instance, entry.instance, entry.built = entry.instance, None, False
+        self._dispose(entry, instance)
+        return True
+
+    def _dispose(self, entry, instance):
+        """Release a detached instance and publish service/stopped."""
+        try:
+            if entry.teardown is not None:
+                entry.teardown(instance)
+            elif instance is not None:
+                for method in ("shutdown", "close", "stop"):
+                    if callable(getattr(instance, method, None)):
+                        getattr(instance, method)()
+                        break
+        except Exception as e:
+            logger.error(f"Error tearing down service '{entry.name}': {e}", exc_info=True)
+        logger.info(f"Service '{entry.name}' stopped")
+        self._publish("service/stopped", {"name": entry.name})
+
+    def _teardown_idle(self, entry):
+        """Tear down an instance if it is still idle and not leased.
+
+        The check and the detach happen under the entry lock, so a lease
+        taken meanwhile keeps the instance.
+
+        Returns:
+            True if the instance was torn down
+        """
+        with entry.lock:
+            idle = time.monotonic() - entry.last_used
+            if not entry.built or entry.leases or idle < entry.idle_timeout:
+                return False
+            instance, entry.instance, entry.built = entry.instance, None, False
+        logger.debug(f"Service '{entry.name}' idle for {idle:.0f}s")
+        self._dispose(entry, instance)
+        return True
+
+    def check(self):
+        """Run health checks and idle teardown once.
+
+        Unhealthy instances are torn down (and rebuilt on next access).
+
+        Returns:
+            Dict name -> "healthy", "unhealthy", "idle" (torn down) or
+            "stopped" (no instance)
+        """
+        report = {}
+        now = time.monotonic()
+        for name, entry in list(self._entries.items()):
+            if not entry.built:
+                report[name] = "stopped"
+                continue
+            instance = entry.instance
+            try:
+                busy = bool(entry.in_use(instance)) if entry.in_use is not None else False
+            except Exception:
+                busy = False
+            if (entry.idle_timeout is not None and not busy and not entry.leases
+                    and now - entry.last_used >= entry.idle_timeout and self._teardown_idle(entry)):
+                report[name] = "idle"
+                continue
+            report[name] = "healthy" if self._healthy(entry, instance) else "unhealthy"
+            if report[name] == "unhealthy":
+                logger.warning(f"Service '{name}' failed its health check, restarting on next use")
+                self._publish("service/unhealthy", {"name": name})
+                self.teardown(name)
+        return report
+
+    @staticmethod
+    def _healthy(entry, instance):
+        check = entry.health_check
+        if check is None:
+            method = getattr(instance, "healthy", None)
+            if not callable(method):
+                return True
+            check = lambda _: method()
+        try:
+            return bool(check(instance))
+        except Exception as e:
+            logger.debug(f"Health check of service '{entry.name}' raised: {e}")
+            return False
+
+    def start(self, interval=30.0):
+        """Run check() every interval seconds on a daemon thread."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+
+        def loop():
+            while not self._stop.wait(interval):
+                try:
+                    self.check()
+                except Exception as e:
+                    logger.error(f"Service check failed: {e}", exc_info=True)
+
+        self._thread = threading.Thread(target=loop, name="service-monitor", daemon=True)
+        self._thread.start()
+
+    def shutdown(self):
+        """Stop monitoring and tear down every built service."""
+        self._stop.set()
+        self._thread = None
+        for name in list(self._entries):
+            self.teardown(name)
+
+    def status(self):
+        """Get per-service state (built, builds, leases, idle seconds)."""
+        now = time.monotonic()
+        return {
+            name: {"built": e.built, "builds": e.builds, "leases": e.leases,
+                   "idle": round(now - e.last_used, 1) if e.built else None}
+            for name, e in self._entries.items()
+        }
+
+    def _publish(self, topic, payload):
+        if self._event_bus is not None:
+            try:
+                self._event_bus.publish(topic, payload)
+            except Exception as e:
+                logger.error(f"Error publishing {topic}: {e}")
+
+
+def lease_service(services, name):
+    """Lease a service for a block (see ServiceRegistry.lease).
+
+    Plain mappings (e.g. a test ToolContext) just look the service up.
+
+    Args:
+        services: ServiceRegistry or mapping
+        name: Service name
+
+    Returns:
+        Context manager yielding the service instance (None if missing)
+    """
+    if isinstance(services, ServiceRegistry):
+        return services.lease(name)
+    return nullcontext(services.get(name))
+
+
+@atexit.register
+def _shutdown_all():
+    """Stop worker processes and close connections before the interpreter exits."""
+    for registry in list(_live_registries):
+        registry.shutdown()
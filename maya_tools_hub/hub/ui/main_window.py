@@ -1,23 +1,13 @@
 """Main window implementation."""
 from hub.core.logging import get_logger
-from hub.core.qt_import import import_qt
+from hub.core.qt_import import import_qt, qt_core
+from hub.ui.panels.panel_diagnostics import DiagnosticsPanel
 from hub.ui.panels.panel_home import HomePanel
 from hub.ui.panels.panel_poly import PolyPanel
 from hub.ui.widgets.console import ConsoleWidget
 
 QtWidgets = import_qt()
-
-# Try to import QtCore for window flags
-try:
-    from Qt import QtCore
-except ImportError:
-    try:
-        from PySide2 import QtCore
-    except ImportError:
-        try:
-            from PySide6 import QtCore
-        except ImportError:
-            QtCore = None
+QtCore = qt_core()  # For window flags; None without Qt
 
 logger = get_logger(__name__)
 
@@ -96,6 +86,9 @@ class MainWindow(QtWidgets.QWidget):
         # Console panel
         self.tab_widget.addTab(self.console_widget, "Console")
 
+        # Diagnostics panel (memory tracing / leak report)
+        self.tab_widget.addTab(DiagnosticsPanel(context=self.context, parent=self), "Diagnostics")
+
         main_layout.addWidget(self.tab_widget)
 
         logger.debug("MainWindow initialized with modular panels")
@@ -0,0 +1,79 @@
+"""Diagnostics panel - memory tracing, checkpoints and leak report."""
+from hub.core import diagnostics
+from hub.core.logging import get_logger
+from hub.core.qt_import import import_qt
+QtWidgets = import_qt()
+
+logger = get_logger(__name__)
+
+
+class DiagnosticsPanel(QtWidgets.QWidget):
+    """Panel showing the memory diagnostics report (see hub.core.diagnostics)."""
+
+    def __init__(self, context=None, parent=None):
+        """Initialize Diagnostics panel.
+
+        Args:
+            context: ToolContext instance
+            parent: Parent widget
+        """
+        super().__init__(parent)
+        self.context = context
+        self.tracker = diagnostics.get_tracker()
+
+        # Create layout
+        layout = QtWidgets.QVBoxLayout(self)
+
+        buttons = QtWidgets.QHBoxLayout()
+        self.trace_button = QtWidgets.QPushButton()
+        self.trace_button.clicked.connect(self._on_toggle_tracing)
+        checkpoint_button = QtWidgets.QPushButton("Checkpoint")
+        checkpoint_button.clicked.connect(self._on_checkpoint)
+        refresh_button = QtWidgets.QPushButton("Refresh Report")
+        refresh_button.clicked.connect(self.refresh)
+        buttons.addWidget(self.trace_button)
+        buttons.addWidget(checkpoint_button)
+        buttons.addWidget(refresh_button)
+        buttons.addStretch()
+        layout.addLayout(buttons)
+
+        # Report text
+        self.report_text = QtWidgets.QTextEdit()
+        self.report_text.setReadOnly(True)
+        self.report_text.setPlaceholderText("Press Refresh Report (collects garbage and scans live objects)")
+        layout.addWidget(self.report_text)
+
+        self._update_trace_button()
+
+    def _update_trace_button(self):
+        self.trace_button.setText("Stop Tracing" if self.tracker.tracing else "Start Tracing")
+
+    def _on_toggle_tracing(self):
+        """Start or stop tracemalloc tracing."""
+        if self.tracker.tracing:
+            self.tracker.stop()
+        else:
+            settings = getattr(self.context, "settings", None)
+            frames = settings.get_int("diagnostics.frames", diagnostics.DEFAULT_FRAMES) if settings else \
+                diagnostics.DEFAULT_FRAMES
+            self.tracker.start(frames)
+        self._update_trace_button()
+
+    def _on_checkpoint(self):
+        """Take a manual checkpoint and show growth since the previous one."""
+        count = sum(1 for c in self.tracker.checkpoints if c.label.startswith("manual"))
+        if self.tracker.checkpoint(f"manual {count + 1}") is None:
+            self.report_text.setPlainText("Memory tracing is off - press Start Tracing first")
+            return
+        self.refresh()
+
+    def refresh(self):
+        """Collect and display the report."""
+        evt_bus = getattr(self.context, "evt_bus", None)
+        try:
+            text = diagnostics.format_report(diagnostics.report(evt_bus))
+        except Exception as e:
+            logger.error(f"Diagnostics report failed: {e}", exc_info=True)
+            text = f"Diagnostics report failed: {e}"
+        self.report_text.setPlainText(text)
+        self._update_trace_button()
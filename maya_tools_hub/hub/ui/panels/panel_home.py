@@ -1,6 +1,10 @@
 """Home panel - environment info and AIGC controls."""
+import os
+
 from hub.core.logging import get_logger
 from hub.core.qt_import import import_qt
+from hub.services.aigc_client import wait_for_job
+from hub.services.registry import lease_service
 QtWidgets = import_qt()
 
 logger = get_logger(__name__)
@@ -37,6 +41,12 @@ class HomePanel(QtWidgets.QWidget):
 
         layout.addStretch()
 
+    def _download_dir(self):
+        """Get the directory AIGC result files are downloaded to."""
+        default = os.path.join(os.path.expanduser("~"), ".studio_name", "maya_tools_hub", "aigc_results")
+        settings = getattr(self.context, "settings", None)
+        return settings.get_str("aigc.download_dir", default) if settings else default
+
     def _on_submit_aigc_job(self):
         """Handle AIGC job submission button click.
 
@@ -63,41 +73,102 @@ class HomePanel(QtWidgets.QWidget):
             return
 
         evt_bus = self.context.evt_bus
+        job_center = self.context.job_center
+        download_dir = self._download_dir()
+        settings = getattr(self.context, "settings", None)
+        poll_interval = settings.get_float("aigc.poll_interval", 2.0) if settings else 2.0
+        timeout = settings.get_float("aigc.timeout", 600.0) if settings else 600.0
+        model_version = getattr(aigc_client, "model_version", None)
+        # Results are only cached when the client declares its model version
+        # (a model upgrade must not serve stale results)
+        result_cache = self.context.services.get("aigc_cache") if model_version else None
+
+        inputs = {
+            "prompt": "Generate a sci-fi spaceship model",
+            "style": "realistic",
+            "resolution": "2048x2048"
+        }
+
+        services = self.context.services
 
         # Define AIGC job function - capture only the aigc_client, no self or Qt objects
-        def aigc_job():
-            """Fake AIGC job that simulates submission and polling.
+        def run_aigc_job(aigc_client):
+            """AIGC job: submit, poll until finished, download results.
 
-            THREAD SAFE: Only accesses aigc_client (thread-safe stub),
+            THREAD SAFE: Only accesses aigc_client (thread-safe),
             no Qt widgets, no Maya scene access.
             """
-            import time
-
             logger.info("AIGC job started in background thread")
-
-            # Submit job (aigc_client methods are thread-safe stubs)
-            inputs = {
-                "prompt": "Generate a sci-fi spaceship model",
-                "style": "realistic",
-                "resolution": "2048x2048"
-            }
+            center_job_id = job_center.current_job_id()
+
+            # Same inputs and model already generated: answer from the cache
+            # (may scan the index and copy from the shared cache, so it runs
+            # here rather than on the UI thread)
+            cached = result_cache.get(inputs, model_version) if result_cache is not None else None
+            if cached is not None:
+                logger.info("AIGC result served from cache")
+                return {
+                    "job_id": cached["status"].get("job_id"),
+                    "status": cached["status"],
+                    "inputs": inputs,
+                    "downloads": [{"path": path} for path in cached["files"]],
+                    "cached": True
+                }
+
+            # Submit job (aigc_client methods are thread-safe)
             job_id = aigc_client.submit(inputs)
             logger.info(f"AIGC job submitted: {job_id}")
 
-            # Simulate waiting for job completion
-            time.sleep(2)
-
-            # Poll job status
-            status = aigc_client.poll(job_id)
-            logger.info(f"AIGC job polling completed: {job_id}")
+            # Poll until the job reaches a terminal state (cancelled and
+            # raised as TimeoutError after aigc.timeout seconds)
+            def on_status(status):
+                progress = status.get("progress")
+                fraction = progress / 100.0 if isinstance(progress, (int, float)) else None
+                job_center.report_progress(fraction, f"AIGC job {status.get('state')}",
+                                           job_id=center_job_id)
+
+            status = wait_for_job(aigc_client, job_id, timeout=timeout, interval=poll_interval,
+                                  on_status=on_status)
+            logger.info(f"AIGC job {job_id} finished: {status.get('state')}")
+
+            # Stream result files to disk (real client only); progress is
+            # reported from download threads as job/progress events
+            downloads = []
+            if hasattr(aigc_client, "download_results") and status.get("state") == "completed":
+                def on_progress(done, total):
+                    fraction = done / total if total else None
+                    job_center.report_progress(fraction, f"Downloading results: {done >> 20} MB",
+                                               job_id=center_job_id)
+
+                # One directory per job: results of different jobs often
+                # share file names (result.png)
+                job_dir = os.path.join(download_dir, os.path.basename(str(job_id)))
+                downloads = aigc_client.download_results(status, job_dir, progress=on_progress)
+
+            # Move finished results into the content-addressed cache
+            if result_cache is not None and status.get("state") == "completed" and \
+                    not any("error" in d for d in downloads):
+                entry = result_cache.put(inputs, model_version, dict(status, job_id=job_id),
+                                         [d["path"] for d in downloads])
+                if entry is not None:
+                    downloads = [{"path": path} for path in entry["files"]]
 
             # Return simple data (no objects, no Qt, no Maya)
             return {
                 "job_id": job_id,
                 "status": status,
-                "inputs": inputs
+                "inputs": inputs,
+                "downloads": downloads,
+                "cached": False
             }
 
+        def aigc_job():
+            """Run the job under a service lease, so the client (and its
+            pooled connections) is not released for being idle while the
+            job polls."""
+            with lease_service(services, "aigc") as client:
+                return run_aigc_job(client)
+
         # Define completion callback - executes in MAIN thread
         def on_complete(result):
             """Callback executed in main thread after job completes.
@@ -110,7 +181,9 @@ class HomePanel(QtWidgets.QWidget):
             aigc_payload = {
                 "job_id": result.get("job_id"),
                 "status": result.get("status"),
-                "inputs": result.get("inputs")
+                "inputs": result.get("inputs"),
+                "downloads": result.get("downloads"),
+                "cached": result.get("cached", False)
             }
             evt_bus.publish("aigc/done", aigc_payload)
 
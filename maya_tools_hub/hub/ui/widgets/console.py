@@ -6,6 +6,13 @@ QtWidgets = import_qt()
 logger = get_logger(__name__)
 
 
+def _unsubscribe(evt_bus, subscriptions):
+    """Remove (topic, callback) subscriptions from an EventBus, once."""
+    while subscriptions:
+        topic, callback = subscriptions.pop()
+        evt_bus.unsubscribe(topic, callback)
+
+
 class ConsoleWidget(QtWidgets.QWidget):
     """Console widget that subscribes to EventBus and displays event log."""
 
@@ -29,12 +36,28 @@ class ConsoleWidget(QtWidgets.QWidget):
         layout.addWidget(self.console_text)
 
         # Subscribe to events if context is available
+        self._subscriptions = []  # (topic, callback) pairs, released on destroy
         if self.context and hasattr(self.context, 'evt_bus'):
-            self.context.evt_bus.subscribe("tool/done", self._on_tool_done)
-            self.context.evt_bus.subscribe("tool/failed", self._on_tool_failed)
-            self.context.evt_bus.subscribe("job/done", self._on_job_done)
-            self.context.evt_bus.subscribe("aigc/done", self._on_aigc_done)
+            self._subscriptions = [
+                ("tool/done", self._on_tool_done),
+                ("tool/failed", self._on_tool_failed),
+                ("job/done", self._on_job_done),
+                ("aigc/done", self._on_aigc_done),
+            ]
+            for topic, callback in self._subscriptions:
+                self.context.evt_bus.subscribe(topic, callback)
             logger.debug("Console subscribed to tool/done, tool/failed, job/done, and aigc/done events")
+            # The bus outlives the widget (hub reloads, window rebuilds):
+            # without this the bound callbacks would keep every old console
+            # alive. The slot must not reference self's C++ side.
+            evt_bus, subscriptions = self.context.evt_bus, self._subscriptions
+            if hasattr(self, 'destroyed'):
+                self.destroyed.connect(lambda *args: _unsubscribe(evt_bus, subscriptions))
+
+    def unsubscribe(self):
+        """Release the EventBus subscriptions (also done when destroyed)."""
+        if self._subscriptions and self.context is not None:
+            _unsubscribe(self.context.evt_bus, self._subscriptions)
 
     def append(self, text):
         """Append text to console.
@@ -123,6 +146,8 @@ class ConsoleWidget(QtWidgets.QWidget):
         import json
         message = f"[aigc/done] AIGC Job Completed\n"
         message += f"  job_id: {job_id}\n"
+        if payload.get("cached"):
+            message += "  (served from result cache)\n"
         if inputs:
             message += f"  inputs: {json.dumps(inputs, indent=4)}\n"
         if status:
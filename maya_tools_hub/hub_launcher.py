@@ -45,16 +45,33 @@ if _maya_tools_hub_dir not in sys.path:
     sys.path.insert(0, _maya_tools_hub_dir)
 
 
+# 重载时保留的模块：内存诊断需跨重载比较检查点
+# （只保留不依赖其他 hub 模块的 memtrack，否则会钉住旧一代模块）
+_RELOAD_KEEP = {'hub.core.memtrack'}
+
+
 def reload_hub():
     """热重载 hub 模块 - 从 sys.modules 中清除所有 hub 相关模块缓存。
     
     这允许在开发时修改代码后无需重启 Maya 即可看到更改。
     只清除 hub 包及其子模块，保留外部依赖（如 Qt、maya 等）。
+    会话状态（StateStore）以写时复制快照的形式保留到新模块中。
     """
+    # 保存会话状态快照（写时复制，无需深拷贝）
+    old_app = sys.modules.get('hub.app')
+    state_snapshot = old_app.get_state_snapshot() if hasattr(old_app, 'get_state_snapshot') else None
+    # 内存诊断：重载前打检查点（memtrack 模块本身不重载，检查点得以保留）
+    memtrack = sys.modules.get('hub.core.memtrack')
+    if memtrack is not None:
+        memtrack.get_tracker().checkpoint("before reload")
+    # 关闭旧模块的服务（HDA 工作进程、连接池），避免泄漏
+    if hasattr(old_app, 'shutdown_services'):
+        old_app.shutdown_services()
+    
     # 找到所有 hub 相关的模块
     modules_to_remove = [
         key for key in list(sys.modules.keys())
-        if key.startswith('hub.')
+        if key.startswith('hub.') and key not in _RELOAD_KEEP
     ]
     
     # 也删除 hub 本身
@@ -65,6 +82,14 @@ def reload_hub():
     for module_name in modules_to_remove:
         del sys.modules[module_name]
     
+    # 将状态交给重新导入的 hub.app
+    if state_snapshot is not None:
+        from hub.app import restore_state
+        restore_state(state_snapshot)
+    
+    if memtrack is not None:
+        memtrack.get_tracker().checkpoint("after reload")
+    
     print(f"[Reload] Reloaded {len(modules_to_remove)} hub modules")
     if modules_to_remove:
         print(f"  Removed: {', '.join(modules_to_remove[:5])}{'...' if len(modules_to_remove) > 5 else ''}")
@@ -0,0 +1,94 @@
+"""AIGC transport throughput and tail-latency benchmark.
+
+Starts the local stand-in service and runs submit + poll cycles from
+several threads, comparing the pooled keep-alive AigcClient against a
+connection-per-request urllib client.
+
+Usage:
+    python tools/bench_aigc_transport.py [--jobs 500] [--threads 8] [--latency 0.002]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from hub.services.aigc_client import AigcClient  # noqa: E402
+from hub.services.aigc_standin_server import start_standin_server  # noqa: E402
+
+
+class UrllibClient:
+    """Baseline: one new connection per request, no keep-alive."""
+
+    def __init__(self, base_url):
+        self.base_url = base_url
+
+    def _request(self, method, path, body=None):
+        data = json.dumps(body).encode("utf-8") if body is not None else None
+        req = urllib.request.Request(self.base_url + path, data=data, method=method,
+                                     headers={"Content-Type": "application/json"})
+        with urllib.request.urlopen(req, timeout=10) as resp:
+            return json.loads(resp.read())
+
+    def submit(self, inputs):
+        return self._request("POST", "/v1/jobs", {"inputs": inputs})["job_id"]
+
+    def poll(self, job_id):
+        return self._request("GET", f"/v1/jobs/{job_id}")
+
+
+def percentile(sorted_values, pct):
+    index = min(len(sorted_values) - 1, int(round(pct / 100.0 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def run_case(client, jobs, threads):
+    """Run submit+poll cycles; return (requests/s, sorted latencies in ms)."""
+    latencies = []
+
+    def cycle(i):
+        start = time.perf_counter()
+        job_id = client.submit({"prompt": f"asset {i}"})
+        latencies.append((time.perf_counter() - start) * 1000)
+        start = time.perf_counter()
+        client.poll(job_id)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(threads) as pool:
+        list(pool.map(cycle, range(jobs)))
+    elapsed = time.perf_counter() - start
+    return len(latencies) / elapsed, sorted(latencies)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=500, help="Submit+poll cycles per case")
+    parser.add_argument("--threads", type=int, default=8, help="Concurrent client threads")
+    parser.add_argument("--latency", type=float, default=0.002, help="Stand-in service time (s)")
+    args = parser.parse_args()
+
+    server = start_standin_server(latency=args.latency, job_duration=0.0)
+    try:
+        cases = {
+            "urllib, connection per request": UrllibClient(server.url),
+            "AigcClient, keep-alive pool": AigcClient(server.url, pool_size=args.threads),
+        }
+        print(f"{'case':<34} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'conns':>6}")
+        for name, client in cases.items():
+            before = server.connection_count
+            rate, lat = run_case(client, args.jobs, args.threads)
+            conns = server.connection_count - before
+            print(f"{name:<34} {rate:8.0f} {percentile(lat, 50):8.2f} "
+                  f"{percentile(lat, 95):8.2f} {percentile(lat, 99):8.2f} {conns:6d}")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""CommandBus dispatch overhead microbenchmark.
+
+Compares the bare dispatch path (no middleware, equivalent to the original
+dict lookup + call) with the full tool.execute middleware pipeline, and
+per-command dispatch with dispatch_many() batching.
+
+Usage:
+    python tools/bench_command_bus.py [--number 20000]
+"""
+import argparse
+import logging
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from hub.core.command_bus import CommandBus  # noqa: E402
+from hub.core.event_bus import EventBus  # noqa: E402
+from hub.core.middleware import (  # noqa: E402
+    ErrorMessageMiddleware,
+    EventMiddleware,
+    TimingMiddleware,
+    UndoMiddleware,
+    ValidationMiddleware,
+)
+from hub.dcc.fake_backend import FakeFacade  # noqa: E402
+
+
+def _noop(**kwargs):
+    return None
+
+
+def build_bus(with_middleware):
+    """Build a CommandBus with a no-op command, optionally with the app pipeline."""
+    bus = CommandBus()
+    bus.register("noop", _noop)
+    if with_middleware:
+        dcc = FakeFacade()
+        commands = ["noop"]
+        bus.use(TimingMiddleware())
+        bus.use(EventMiddleware(EventBus(), "tool/done", "tool/failed", commands=commands))
+        bus.use(ErrorMessageMiddleware(dcc, commands=commands))
+        bus.use(ValidationMiddleware({"noop": lambda kwargs: None}))
+        bus.use(UndoMiddleware(dcc, commands=commands))
+    return bus
+
+
+def bench(number):
+    """Run all cases and return {case: microseconds per command}."""
+    results = {}
+    bare = build_bus(False)
+    piped = build_bus(True)
+    batch = [("noop", {"value": 1})] * 100
+
+    results["dispatch (bare)"] = timeit.timeit(
+        lambda: bare.dispatch("noop", value=1), number=number) / number
+    results["dispatch (pipeline)"] = timeit.timeit(
+        lambda: piped.dispatch("noop", value=1), number=number) / number
+    loops = max(1, number // len(batch))
+    results["dispatch_many x100 (pipeline)"] = timeit.timeit(
+        lambda: piped.dispatch_many(batch), number=loops) / (loops * len(batch))
+    return {name: seconds * 1e6 for name, seconds in results.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20000, help="Dispatches per case")
+    args = parser.parse_args()
+
+    # Keep log handler output out of the measurement
+    logging.getLogger().setLevel(logging.WARNING)
+    for name, usec in bench(args.number).items():
+        print(f"{name:<34} {usec:8.2f} us/command")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Geometry exchange benchmark: shared memory vs serialized meshes.
+
+Round-trips a quad grid through a stand-in HDA worker (pass-through cook,
+no simulated cook time), once through shared-memory segments and once with
+the mesh serialized as JSON into the request and back in the response (the
+cost of any serialize-and-parse path such as writing .bgeo/.obj files,
+minus disk I/O).
+
+Usage:
+    python tools/bench_geo_exchange.py [--points 250000] [--repeat 5]
+"""
+import argparse
+import os
+import sys
+import time
+from array import array
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from hub.services.hda_bridge import HdaBridge  # noqa: E402
+from hub.services.hda_pool import HdaWorkerPool, standin_command  # noqa: E402
+
+
+def make_mesh(point_count):
+    """Flat quad-strip mesh with point_count points."""
+    points = array("f", (float(i % 7) for i in range(point_count * 3)))
+    indices = array("i", range(point_count - point_count % 4))
+    face_counts = array("i", [4]) * (len(indices) // 4)
+    return {"points": points, "indices": indices, "face_counts": face_counts}
+
+
+def bench_shm(bridge, mesh, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        outputs = bridge.run_hda("/bench/passthrough.hda", {}, geometry=mesh)
+        times.append(time.perf_counter() - start)
+        outputs["geometry"].release()
+    return min(times)
+
+
+def bench_serialized(bridge, mesh, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parms = {key: value.tolist() for key, value in mesh.items()}
+        outputs = bridge.run_hda("/bench/passthrough.hda", {"mesh": parms})
+        # The stand-in echoes the mesh back, so both directions are measured
+        array("f", outputs["mesh"]["points"])
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--points", type=int, default=250000, help="Mesh point count")
+    parser.add_argument("--repeat", type=int, default=5, help="Round-trips per case (best is reported)")
+    args = parser.parse_args()
+
+    mesh = make_mesh(args.points)
+    bridge = HdaBridge(HdaWorkerPool(standin_command(load=0.0, cook=0.0), size=1))
+    try:
+        bridge.run_hda("/bench/passthrough.hda", {})  # start the worker, load the HDA
+        mb = sum(len(v) * v.itemsize for v in mesh.values()) / (1 << 20)
+        print(f"{args.points} points, {mb:.1f} MB of buffers")
+        for name, fn in (("shared memory", bench_shm), ("serialized (JSON)", bench_serialized)):
+            print(f"{name:<20} {fn(bridge, mesh, args.repeat) * 1000:9.1f} ms/round-trip")
+    finally:
+        bridge.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Local IPC throughput benchmark.
+
+Starts an IpcServer over a CommandBus with the full tool middleware stack
+on the fake backend, with a main-thread pump standing in for the Qt event
+loop, and drives it from a client in three ways: one call at a time,
+pipelined call_async() (many requests in flight), and batch().
+
+Usage:
+    python tools/bench_ipc.py [--number 20000] [--tcp]
+"""
+import argparse
+import logging
+import os
+import queue
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from hub.core.command_bus import CommandBus  # noqa: E402
+from hub.core.event_bus import EventBus  # noqa: E402
+from hub.core.ipc import IpcClient, IpcServer  # noqa: E402
+from hub.core.middleware import (  # noqa: E402
+    ErrorMessageMiddleware,
+    EventMiddleware,
+    TimingMiddleware,
+    UndoMiddleware,
+    ValidationMiddleware,
+)
+from hub.dcc.fake_backend import FakeFacade  # noqa: E402
+
+
+def make_bus():
+    dcc = FakeFacade()
+    evt_bus = EventBus()
+    bus = CommandBus()
+    commands = ["echo"]
+    bus.use(TimingMiddleware())
+    bus.use(EventMiddleware(evt_bus, "tool/done", "tool/failed", commands=commands))
+    bus.use(ErrorMessageMiddleware(dcc, commands=commands))
+    bus.use(ValidationMiddleware({}))
+    bus.use(UndoMiddleware(dcc, commands=commands))
+    bus.register("echo", lambda msg=None: msg)
+    return bus, evt_bus
+
+
+def rate(label, count, fn):
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {count / elapsed:10.0f} commands/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20000, help="Commands per case")
+    parser.add_argument("--tcp", action="store_true", help="Use localhost TCP instead of a Unix socket")
+    args = parser.parse_args()
+    logging.getLogger().setLevel(logging.WARNING)
+
+    # Stand-in for the Qt main thread: runs whatever the server schedules
+    main_calls = queue.Queue()
+    bus, evt_bus = make_bus()
+    server = IpcServer(bus, evt_bus, schedule=main_calls.put, directory=tempfile.mkdtemp(),
+                       use_tcp=args.tcp or None)
+    server.start()
+    stop = threading.Event()
+
+    def client_side():
+        n = args.number
+        try:
+            with IpcClient(server.address, server.token) as hub:
+                rate("sequential call()", n // 10, lambda: [hub.call("echo", msg=i) for i in range(n // 10)])
+                rate("pipelined call_async()", n,
+                     lambda: [f.result() for f in [hub.call_async("echo", msg=i) for i in range(n)]])
+                rate("batch() of 1000", n, lambda: [
+                    hub.batch([("echo", {"msg": i}) for i in range(1000)]) for _ in range(n // 1000)])
+        finally:
+            stop.set()
+
+    thread = threading.Thread(target=client_side)
+    thread.start()
+    while not stop.is_set():
+        try:
+            main_calls.get(timeout=0.05)()
+        except queue.Empty:
+            pass
+    thread.join()
+    print(f"main-thread drains: {server.stats['drains']} for {server.stats['requests']} requests")
+    server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Settings lookup microbenchmark.
+
+Compares Settings.get() against a plain dict lookup and against the
+original split-and-walk lookup (which also created missing parent dicts).
+
+Usage:
+    python tools/bench_settings.py [--number 200000] [--keys 500]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from hub.core.settings import Settings  # noqa: E402
+
+
+def _walk_get(data, key_path, default=None):
+    """Original lookup: split on every call, create missing parents."""
+    keys = key_path.split('.')
+    current = data
+    for key in keys[:-1]:
+        if key not in current or not isinstance(current[key], dict):
+            current[key] = {}
+        current = current[key]
+    return current.get(keys[-1], default)
+
+
+def build_settings(key_count, directory):
+    """Build a Settings instance with key_count nested keys and a schema."""
+    settings = Settings(os.path.join(directory, "bench_settings.json"))
+    for i in range(key_count):
+        settings.set(f"poly.tool_{i % 50}.param_{i}", float(i))
+    settings.register_schema("poly.smooth_normals", {"angle": {"type": "float", "default": 60.0}})
+    return settings
+
+
+def bench(number, key_count):
+    """Run all cases and return {case: nanoseconds per lookup}."""
+    with tempfile.TemporaryDirectory() as directory:
+        settings = build_settings(key_count, directory)
+        flat = dict(settings._resolve())
+        nested = settings._data
+        hit = f"poly.tool_7.param_{key_count - 43}"
+        miss = "poly.tool_7.missing"
+
+        cases = {
+            "dict.get (flat, reference)": lambda: flat.get(hit),
+            "Settings.get hit": lambda: settings.get(hit),
+            "Settings.get miss": lambda: settings.get(miss, 1.0),
+            "Settings.get schema default": lambda: settings.get("poly.smooth_normals.angle"),
+            "Settings.get_float": lambda: settings.get_float("poly.smooth_normals.angle"),
+            "original split+walk get": lambda: _walk_get(nested, hit),
+        }
+        return {
+            name: min(timeit.repeat(fn, number=number, repeat=3)) / number * 1e9
+            for name, fn in cases.items()
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=200000, help="Lookups per case")
+    parser.add_argument("--keys", type=int, default=500, help="Number of stored settings")
+    args = parser.parse_args()
+
+    for name, nsec in bench(args.number, args.keys).items():
+        print(f"{name:<30} {nsec:8.1f} ns/lookup")
+
+
+if __name__ == "__main__":
+    main()
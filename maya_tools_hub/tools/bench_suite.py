@@ -0,0 +1,443 @@
+"""Microbenchmark suite for the hub core with baseline regression tracking.
+
+Runs headless (no Qt, no Maya): EventBus fan-out, CommandBus dispatch,
+Settings get/set/save, ToolRegistry discovery over synthetic plugin trees,
+JobCenter submission throughput and latency, and logging throughput.
+
+Every case is timed as --repeat samples (each the best of 3 runs of at
+least --min-time seconds) and reported as the median time per operation.
+--save writes the samples to a JSON baseline; --compare runs the suite again
+and tests each case against the baseline with a Mann-Whitney U test. A case
+counts as a regression when it is significantly slower (p < --alpha) and
+its median is more than --threshold slower. The exit code is 1 if any case
+regressed, so the comparison can gate CI.
+
+Usage:
+    python tools/bench_suite.py [-k registry] [--repeat 15] [--save baseline.json]
+    python tools/bench_suite.py --compare baseline.json [--threshold 0.10] [--alpha 0.01]
+    python tools/bench_suite.py --list
+
+Baselines are only comparable on the same machine and Python; --compare
+warns when the recorded environment differs.
+"""
+import argparse
+import contextlib
+import datetime
+import json
+import logging
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import timeit
+
+os.environ.setdefault("HUB_QT", "none")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from hub.core.dispatch import SyncDispatcher  # noqa: E402
+from hub.core.event_bus import EventBus  # noqa: E402
+from hub.core.job_center import JobCenter  # noqa: E402
+from hub.core.logging import ConsoleHandler  # noqa: E402
+from hub.core.registry import ToolRegistry  # noqa: E402
+from hub.core.settings import Settings  # noqa: E402
+
+from bench_command_bus import build_bus  # noqa: E402
+
+BASELINE_VERSION = 1
+
+# name -> (setup generator function, operations per call)
+CASES = {}
+
+
+def case(name, ops=1, **params):
+    """Register a benchmark case.
+
+    The decorated function is a generator: it sets up, yields the callable
+    to time, and cleans up after the yield. Keyword arguments given as lists
+    expand into one case per value, e.g. subscribers=[1, 10] registers
+    "name[subscribers=1]" and "name[subscribers=10]".
+
+    Args:
+        name: Case name ("component.operation")
+        ops: Operations per call of the yielded callable (results are per op)
+        **params: Parameter name -> list of values
+    """
+    def decorator(fn):
+        if not params:
+            CASES[name] = (contextlib.contextmanager(fn), ops, {})
+            return fn
+        (param, values), = params.items()
+        for value in values:
+            CASES[f"{name}[{param}={value}]"] = (contextlib.contextmanager(fn), ops, {param: value})
+        return fn
+    return decorator
+
+
+# ---- cases ----
+
+@case("event_bus.publish", subscribers=[0, 1, 10, 100])
+def _event_bus_publish(subscribers):
+    bus = EventBus()
+    for _ in range(subscribers):
+        bus.subscribe("bench/topic", lambda payload: None)
+    payload = {"value": 1}
+    yield lambda: bus.publish("bench/topic", payload)
+
+
+@case("command_bus.dispatch[bare]")
+def _command_bus_bare():
+    bus = build_bus(False)
+    yield lambda: bus.dispatch("noop", value=1)
+
+
+@case("command_bus.dispatch[pipeline]")
+def _command_bus_pipeline():
+    bus = build_bus(True)
+    yield lambda: bus.dispatch("noop", value=1)
+
+
+@case("command_bus.dispatch_many[pipeline]", ops=100)
+def _command_bus_many():
+    bus = build_bus(True)
+    batch = [("noop", {"value": 1})] * 100
+    yield lambda: bus.dispatch_many(batch)
+
+
+@contextlib.contextmanager
+def _settings(keys=500):
+    with tempfile.TemporaryDirectory() as directory:
+        settings = Settings(os.path.join(directory, "bench_settings.json"))
+        for i in range(keys):
+            settings.set(f"poly.tool_{i % 50}.param_{i}", float(i))
+        settings.register_schema("poly.smooth_normals", {"angle": {"type": "float", "default": 60.0}})
+        settings.save()
+        yield settings
+
+
+@case("settings.get")
+def _settings_get():
+    with _settings() as settings:
+        yield lambda: settings.get("poly.tool_7.param_457")
+
+
+@case("settings.get[schema default]")
+def _settings_get_default():
+    with _settings() as settings:
+        yield lambda: settings.get("poly.smooth_normals.angle")
+
+
+@case("settings.set")
+def _settings_set():
+    with _settings() as settings:
+        values = iter(range(10 ** 12))  # a new value every call (unchanged values are skipped)
+        yield lambda: settings.set("poly.tool_7.param_457", next(values))
+
+
+@case("settings.save")
+def _settings_save():
+    with _settings() as settings:
+        values = iter(range(10 ** 12))
+
+        def op():
+            settings.set("poly.tool_7.param_457", next(values))
+            settings.save()
+        yield op
+
+
+def _write_plugin_tree(root, count):
+    """Write count manifest-only plugins in 10 categories under root."""
+    for i in range(count):
+        plugin_dir = os.path.join(root, f"cat_{i % 10}", f"tool_{i}")
+        os.makedirs(plugin_dir)
+        manifest = {
+            "key": f"cat_{i % 10}.tool_{i}",
+            "label": f"Tool {i}",
+            "category": f"cat_{i % 10}",
+            "entry": f"bench.cat_{i % 10}.tool_{i}.plugin:Tool",
+            "settings": {"angle": {"type": "float", "default": 60.0}},
+        }
+        with open(os.path.join(plugin_dir, "manifest.json"), "w", encoding="utf-8") as f:
+            json.dump(manifest, f)
+
+
+@case("registry.discover", plugins=[10, 100, 1000])
+def _registry_discover(plugins):
+    with tempfile.TemporaryDirectory() as root:
+        _write_plugin_tree(root, plugins)
+        assert len(ToolRegistry(root).list_tools()) == plugins
+        yield lambda: ToolRegistry(root)
+
+
+@case("job_center.submit[inline]")
+def _job_center_inline():
+    job_center = JobCenter(dispatcher=SyncDispatcher())
+    yield lambda: job_center.run_in_thread(_noop, callback=_noop)
+
+
+@case("job_center.throughput[threaded]", ops=100)
+def _job_center_throughput():
+    job_center = JobCenter(dispatcher=SyncDispatcher(), threaded=True)
+
+    def op():
+        for _ in range(100):
+            job_center.run_in_thread(_noop, callback=_noop)
+        job_center.wait()
+    yield op
+    job_center.wait()
+
+
+@case("job_center.latency[threaded]")
+def _job_center_latency():
+    job_center = JobCenter(dispatcher=SyncDispatcher(), threaded=True)
+    done = threading.Event()
+
+    def op():
+        # Submission to callback, i.e. the round trip through a worker thread
+        done.clear()
+        job_center.run_in_thread(_noop, callback=lambda result: done.set())
+        done.wait()
+    yield op
+    job_center.wait()
+
+
+class _NullStream:
+    """stdout replacement that discards output (the formatting is still done)."""
+
+    def write(self, text):
+        return len(text)
+
+    def flush(self):
+        pass
+
+
+@contextlib.contextmanager
+def _bench_logger():
+    logger = logging.getLogger("bench.logging")
+    handler = ConsoleHandler()
+    handler.setFormatter(logging.Formatter(
+        fmt='[%(asctime)s] [%(levelname)-8s] [%(name)s] %(message)s', datefmt='%H:%M:%S'))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    try:
+        with contextlib.redirect_stdout(_NullStream()):
+            yield logger
+    finally:
+        logger.removeHandler(handler)
+
+
+@case("logging.info[emitted]")
+def _logging_emitted():
+    with _bench_logger() as logger:
+        yield lambda: logger.info(f"Job #{42} completed successfully")
+
+
+@case("logging.debug[filtered]")
+def _logging_filtered():
+    with _bench_logger() as logger:
+        yield lambda: logger.debug(f"Job #{42} completed successfully")
+
+
+def _noop(*args, **kwargs):
+    return None
+
+
+# ---- runner ----
+
+def measure(name, repeat, min_time):
+    """Time one case.
+
+    Args:
+        name: Case name
+        repeat: Number of samples
+        min_time: Minimum seconds per timing run (sets the call count)
+
+    Returns:
+        Result dict: number (calls per sample), samples (seconds per op)
+    """
+    setup, ops, params = CASES[name]
+    with setup(**params) as fn:
+        timer = timeit.Timer(fn)
+        # Calibrate (also warms up caches and lazily created state)
+        number = 1
+        while timer.timeit(number) < min_time:
+            number *= 2
+        # Each sample is the best of 3 runs, which filters out most
+        # scheduler preemptions and keeps the samples comparable across runs
+        samples = [min(timer.repeat(3, number)) / (number * ops) for _ in range(repeat)]
+    return {"number": number, "ops": ops, "samples": samples}
+
+
+def summarize(samples):
+    """Median and interquartile range of samples."""
+    quartiles = statistics.quantiles(samples, n=4) if len(samples) > 1 else [samples[0]] * 3
+    return {"median": statistics.median(samples), "iqr": quartiles[2] - quartiles[0]}
+
+
+def mann_whitney_p(a, b):
+    """Two-sided p-value of the Mann-Whitney U test (normal approximation).
+
+    Distribution-free, so it suits timing samples (skewed, with outliers).
+
+    Args:
+        a: First sample list
+        b: Second sample list
+
+    Returns:
+        float: p-value (1.0 if the samples cannot be told apart)
+    """
+    n1, n2 = len(a), len(b)
+    if not n1 or not n2:
+        return 1.0
+    values = sorted([(value, 0) for value in a] + [(value, 1) for value in b])
+    n = n1 + n2
+    ranks = [0.0] * n
+    tie_term = 0
+    i = 0
+    while i < n:
+        j = i
+        while j + 1 < n and values[j + 1][0] == values[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2 + 1
+        tie_term += (j - i + 1) ** 3 - (j - i + 1)
+        i = j + 1
+    rank_sum = sum(rank for rank, (_, group) in zip(ranks, values) if group == 0)
+    u = rank_sum - n1 * (n1 + 1) / 2
+    mean = n1 * n2 / 2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (abs(u - mean) - 0.5) / math.sqrt(variance)  # continuity correction
+    return min(1.0, math.erfc(max(z, 0.0) / math.sqrt(2)))
+
+
+def environment():
+    """Describe the machine and interpreter the results come from."""
+    env = {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+    }
+    try:
+        env["commit"] = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=5,
+            cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        env["commit"] = None
+    return env
+
+
+def run_suite(names, repeat, min_time):
+    """Run cases and print one line per case.
+
+    Returns:
+        Baseline dict (see --save)
+    """
+    results = {}
+    for name in names:
+        result = measure(name, repeat, min_time)
+        result.update(summarize(result["samples"]))
+        results[name] = result
+        print(f"{name:<44} {_format_time(result['median']):>10}/op "
+              f"(IQR {_format_time(result['iqr'])}, {1 / result['median']:,.0f} op/s)", flush=True)
+    return {
+        "version": BASELINE_VERSION,
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "environment": environment(),
+        "config": {"repeat": repeat, "min_time": min_time},
+        "cases": results,
+    }
+
+
+def compare(baseline, current, threshold, alpha):
+    """Compare a run against a baseline and print a verdict per case.
+
+    Args:
+        baseline: Baseline dict
+        current: Baseline dict of the new run
+        threshold: Minimum relative slowdown (or speedup) to report
+        alpha: Significance level
+
+    Returns:
+        List of regressed case names
+    """
+    for key, value in baseline.get("environment", {}).items():
+        if key != "commit" and current["environment"].get(key) != value:
+            print(f"warning: baseline {key} is {value!r}, this run {current['environment'].get(key)!r}")
+    print(f"\n{'case':<44} {'baseline':>10} {'current':>10} {'change':>8} {'p':>8}  verdict")
+    regressions = []
+    for name, result in current["cases"].items():
+        old = baseline["cases"].get(name)
+        if old is None:
+            print(f"{name:<44} {'-':>10} {_format_time(result['median']):>10} {'':>8} {'':>8}  new")
+            continue
+        ratio = result["median"] / old["median"] - 1
+        p = mann_whitney_p(old["samples"], result["samples"])
+        verdict = "ok"
+        if p < alpha and ratio > threshold:
+            verdict = "REGRESSION"
+            regressions.append(name)
+        elif p < alpha and ratio < -threshold:
+            verdict = "faster"
+        print(f"{name:<44} {_format_time(old['median']):>10} {_format_time(result['median']):>10} "
+              f"{ratio:+8.1%} {p:8.4f}  {verdict}")
+    return regressions
+
+
+def _format_time(seconds):
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.1f} ns"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-k", dest="pattern", help="Only run cases whose name contains this")
+    parser.add_argument("--list", action="store_true", help="List cases and exit")
+    parser.add_argument("--repeat", type=int, default=15, help="Samples per case")
+    parser.add_argument("--min-time", type=float, default=0.01, help="Minimum seconds per timing run")
+    parser.add_argument("--save", metavar="PATH", help="Write results as a JSON baseline")
+    parser.add_argument("--compare", metavar="PATH", help="Compare against a JSON baseline")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="Minimum relative slowdown that counts as a regression")
+    parser.add_argument("--alpha", type=float, default=0.01, help="Significance level")
+    args = parser.parse_args(argv)
+
+    names = [name for name in CASES if not args.pattern or args.pattern in name]
+    if args.list:
+        print("\n".join(names))
+        return 0
+    baseline = None
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline.get("version") != BASELINE_VERSION:
+            parser.error(f"{args.compare}: unsupported baseline version {baseline.get('version')}")
+        names = [name for name in names if name in baseline["cases"]] or names
+
+    # Keep the hub's own log output out of the measurements
+    logging.getLogger().setLevel(logging.WARNING)
+    current = run_suite(names, args.repeat, args.min_time)
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(current, f, indent=2)
+        print(f"\nBaseline written to {args.save}")
+    if baseline is not None:
+        regressions = compare(baseline, current, args.threshold, args.alpha)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s): {', '.join(regressions)}")
+            return 1
+        print("\nNo significant regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,442 @@
+"""End-to-end load test for the tool execution pipeline (fake DCC backend).
+
+Builds the headless core (see hub.bootstrap) on a populated fake scene and
+runs a main loop standing in for the Qt event loop: it is the JobCenter
+dispatcher and the CommandBus main-thread scheduler, so work flows exactly
+as in the UI. Open-loop load generators (Poisson arrivals) feed it:
+
+    tools   artists clicking tools: dispatch_async("tool.execute") on a
+            random selection, through the full middleware pipeline
+    jobs    AIGC-style submissions: JobCenter jobs that wait on a simulated
+            service (exponential duration) and report progress
+    events  a recorded event stream replayed onto the EventBus
+
+Latency is measured from each arrival's scheduled time to its completion
+on the main thread, so time spent queued behind other work counts. Every
+--interval the harness samples the main-loop queue depth, jobs in flight,
+completions and memory (RSS, or traced memory with --tracemalloc); the
+summary reports throughput, latency percentiles, queue depths and memory
+growth, and --report writes everything (including the timeline) as JSON.
+
+Usage:
+    python tools/load_test.py [--duration 30] [--artists 8] [--click-rate 0.5]
+                              [--job-rate 4] [--job-time 0.2]
+                              [--replay events.jsonl] [--replay-speed 2]
+                              [--record events.jsonl] [--report load.json]
+                              [--tracemalloc]
+
+--record writes every event published during the run as JSON lines
+({"t": seconds, "topic": ..., "payload": ...}); such a file (or one
+captured elsewhere in the same format) can be replayed with --replay.
+"""
+import argparse
+import json
+import logging
+import os
+import queue
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+
+os.environ["HUB_DCC"] = "fake"
+os.environ.setdefault("HUB_QT", "none")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from hub.bootstrap import build_core, detect_dcc  # noqa: E402
+from hub.core.dispatch import Dispatcher  # noqa: E402
+from hub.core.event_bus import EventBus  # noqa: E402
+from hub.core.settings import Settings  # noqa: E402
+from hub.core.state_store import StateStore  # noqa: E402
+
+DEFAULT_TOOLS = ["poly.smooth_normals"]
+
+
+class MainLoop(Dispatcher):
+    """Queue-driven stand-in for the Qt main thread."""
+
+    name = "load-test"
+
+    def __init__(self):
+        self._queue = queue.Queue()
+        self.max_depth = 0
+
+    def call_soon(self, fn):
+        self._queue.put(fn)
+
+    @property
+    def depth(self):
+        """Calls waiting to run."""
+        return self._queue.qsize()
+
+    def run(self, until, tick=None):
+        """Run queued calls on this thread.
+
+        Args:
+            until: Callable returning True when the loop should stop
+            tick: Optional callable run once per iteration (sampling)
+        """
+        while not until():
+            self.max_depth = max(self.max_depth, self._queue.qsize())
+            if tick is not None:
+                tick()
+            try:
+                fn = self._queue.get(timeout=0.01)
+            except queue.Empty:
+                continue
+            try:
+                fn()
+            except Exception as e:
+                print(f"main loop: {type(e).__name__}: {e}", file=sys.stderr)
+
+
+class Stream:
+    """Statistics of one load stream (updated on the main thread)."""
+
+    def __init__(self, name):
+        self.name = name
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.latencies = []  # seconds, completed and failed
+
+    def done(self, scheduled, ok):
+        self.latencies.append(time.perf_counter() - scheduled)
+        self.completed += 1
+        if not ok:
+            self.failed += 1
+
+    def summary(self, elapsed):
+        latencies = sorted(self.latencies)
+        return {
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "outstanding": self.submitted - self.completed,
+            "throughput": self.completed / elapsed if elapsed else 0.0,
+            "latency_ms": {
+                "p50": _percentile(latencies, 50) * 1e3,
+                "p90": _percentile(latencies, 90) * 1e3,
+                "p99": _percentile(latencies, 99) * 1e3,
+                "max": (latencies[-1] if latencies else 0.0) * 1e3,
+                "mean": (statistics.fmean(latencies) if latencies else 0.0) * 1e3,
+            },
+        }
+
+
+def _percentile(sorted_values, percent):
+    """Nearest-rank percentile of an already sorted list (0.0 when empty)."""
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, round(percent / 100 * len(sorted_values) + 0.5) - 1))
+    return sorted_values[index]
+
+
+def _arrivals(rate, stop, emit, seed):
+    """Generator thread body: call emit(scheduled_time) at Poisson arrivals.
+
+    Arrival times are fixed in advance, so a slow consumer does not slow
+    the offered load down (no coordinated omission).
+    """
+    rng = random.Random(seed)
+    next_time = time.perf_counter()
+    while not stop.is_set():
+        next_time += rng.expovariate(rate)
+        delay = next_time - time.perf_counter()
+        if delay > 0 and stop.wait(delay):
+            return
+        emit(next_time)
+
+
+def _rss_bytes():
+    """Resident set size of this process (Linux; 0 elsewhere)."""
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+def _memory_bytes():
+    return tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else _rss_bytes()
+
+
+def _slope(points):
+    """Least-squares slope of (x, y) points (0.0 if undefined)."""
+    if len(points) < 2:
+        return 0.0
+    mean_x = statistics.fmean(x for x, _ in points)
+    mean_y = statistics.fmean(y for _, y in points)
+    denominator = sum((x - mean_x) ** 2 for x, _ in points)
+    if not denominator:
+        return 0.0
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / denominator
+
+
+def load_events(path):
+    """Read a recorded event stream (JSON lines with t, topic, payload)."""
+    events = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                event = json.loads(line)
+                events.append((float(event.get("t", 0.0)), event["topic"], event.get("payload")))
+    events.sort(key=lambda event: event[0])
+    return events
+
+
+class EventRecorder:
+    """Capture every event published on an EventBus as JSON lines."""
+
+    def __init__(self, evt_bus, path):
+        self._file = open(path, "w", encoding="utf-8")
+        self._lock = threading.Lock()
+        self._start = time.perf_counter()
+        self._publish = evt_bus.publish
+
+        def publish(topic, payload):
+            line = json.dumps({"t": round(time.perf_counter() - self._start, 6), "topic": topic,
+                               "payload": payload}, default=repr)
+            with self._lock:
+                self._file.write(line + "\n")
+            self._publish(topic, payload)
+
+        evt_bus.publish = publish
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+
+def build_scene(dcc, meshes, subdivisions):
+    """Fill the fake scene with grid meshes; returns their names."""
+    names = [f"pGrid{i}" for i in range(meshes)]
+    dcc.scene.load({"meshes": [
+        {"name": name, "type": "grid", "subdivisions": subdivisions, "size": 10.0, "wave": 0.5}
+        for name in names
+    ]})
+    return names
+
+
+def run_load(args):
+    """Run the load test.
+
+    Returns:
+        Report dict
+    """
+    if args.tracemalloc:
+        tracemalloc.start(10)
+
+    work_dir = tempfile.mkdtemp(prefix="hub_load_")
+    evt_bus = EventBus()
+    recorder = EventRecorder(evt_bus, args.record) if args.record else None
+    loop = MainLoop()
+    dcc = detect_dcc()
+    meshes = build_scene(dcc, args.meshes, args.subdivisions)
+    core = build_core(dcc=dcc, evt_bus=evt_bus, dispatcher=loop,
+                      settings=Settings(os.path.join(work_dir, "user_settings.json"), event_bus=evt_bus),
+                      state=StateStore())
+    core.cmd_bus.set_main_thread_scheduler(loop.call_soon)
+    tools = [key for key in args.tool or DEFAULT_TOOLS if core.registry.get_manifest(key)]
+    if not tools:
+        raise ValueError(f"No known tool in {args.tool or DEFAULT_TOOLS}")
+    events = load_events(args.replay) if args.replay else []
+
+    streams = {name: Stream(name) for name in ("tools", "jobs", "events")}
+    rng = random.Random(args.seed)
+    stop = threading.Event()
+
+    def click(scheduled):
+        # Main thread: an artist picks a selection and a tool
+        stream = streams["tools"]
+        stream.submitted += 1
+        dcc.scene.select(rng.sample(meshes, rng.randint(1, min(3, len(meshes)))))
+        try:
+            future = core.cmd_bus.dispatch_async(
+                "tool.execute", key=rng.choice(tools), angle=rng.choice((30.0, 45.0, 60.0, 90.0)))
+        except Exception:
+            stream.done(scheduled, False)
+            return
+        future.add_done_callback(lambda f: stream.done(scheduled, f.exception() is None))
+
+    def submit_job(scheduled):
+        # Main thread: submit a job that waits on a simulated service
+        stream = streams["jobs"]
+        stream.submitted += 1
+        duration = rng.expovariate(1.0 / args.job_time) if args.job_time > 0 else 0.0
+        job_center = core.job_center
+
+        def work():
+            job_id = job_center.current_job_id()
+            steps = 4
+            for step in range(steps):
+                time.sleep(duration / steps)
+                job_center.report_progress((step + 1) / steps, job_id=job_id)
+            return {"bytes": 1024}
+
+        job_center.run_in_thread(work, callback=lambda result: stream.done(scheduled, True),
+                                 error_callback=lambda error: stream.done(scheduled, False))
+
+    def replay():
+        # Replay thread: publish recorded events on the main thread, looping
+        stream = streams["events"]
+        span = (events[-1][0] if events else 0.0) / args.replay_speed + 0.001
+        start = time.perf_counter()
+        cycle = 0
+        while events and not stop.is_set():
+            for offset, topic, payload in events:
+                scheduled = start + cycle * span + offset / args.replay_speed
+                delay = scheduled - time.perf_counter()
+                if delay > 0 and stop.wait(delay):
+                    return
+
+                def publish(scheduled=scheduled, topic=topic, payload=payload):
+                    evt_bus.publish(topic, payload)
+                    stream.done(scheduled, True)
+                stream.submitted += 1
+                loop.call_soon(publish)
+            cycle += 1
+
+    generators = []
+    if args.artists and args.click_rate > 0:
+        generators.append(threading.Thread(target=_arrivals, daemon=True, name="load-tools", args=(
+            args.artists * args.click_rate, stop, lambda t: loop.call_soon(lambda: click(t)), args.seed)))
+    if args.job_rate > 0:
+        generators.append(threading.Thread(target=_arrivals, daemon=True, name="load-jobs", args=(
+            args.job_rate, stop, lambda t: loop.call_soon(lambda: submit_job(t)), args.seed + 1)))
+    if events:
+        generators.append(threading.Thread(target=replay, daemon=True, name="load-events"))
+
+    timeline = []
+    baseline_snapshot = tracemalloc.take_snapshot() if args.tracemalloc else None
+    start = time.perf_counter()
+    next_sample = start
+
+    def sample():
+        nonlocal next_sample
+        now = time.perf_counter()
+        if now < next_sample:
+            return
+        next_sample += args.interval
+        timeline.append({
+            "t": round(now - start, 3),
+            "queue_depth": loop.depth,
+            "jobs_in_flight": core.job_center.active_count(),
+            "completed": {name: stream.completed for name, stream in streams.items()},
+            "memory": _memory_bytes(),
+        })
+        if args.live:
+            point = timeline[-1]
+            print(f"t={point['t']:6.1f}s queue={point['queue_depth']:4d} jobs={point['jobs_in_flight']:4d} "
+                  f"done={sum(point['completed'].values()):7d} mem={point['memory'] / 2 ** 20:7.1f} MB",
+                  flush=True)
+
+    for thread in generators:
+        thread.start()
+    end = start + args.duration
+    loop.run(until=lambda: time.perf_counter() >= end, tick=sample)
+    stop.set()
+    for thread in generators:
+        thread.join()
+    # Drain: let outstanding work finish (its latency still counts)
+    drain_end = time.perf_counter() + args.drain
+    loop.run(until=lambda: time.perf_counter() >= drain_end or (
+        not loop.depth and not core.job_center.active_count()
+        and all(s.submitted == s.completed for s in streams.values())), tick=sample)
+    elapsed = time.perf_counter() - start
+    next_sample = 0.0
+    sample()
+
+    growth_sites = []
+    if args.tracemalloc:
+        stats = tracemalloc.take_snapshot().compare_to(baseline_snapshot, "lineno")
+        growth_sites = [{"site": str(stat.traceback[0]), "size_diff": stat.size_diff, "count_diff": stat.count_diff}
+                        for stat in stats[:args.top] if stat.size_diff > 0]
+        tracemalloc.stop()
+    if recorder is not None:
+        recorder.close()
+    core.shutdown()
+
+    # Memory trend after the first tenth of the run (start-up allocations)
+    steady = [(point["t"], point["memory"]) for point in timeline if point["t"] >= args.duration / 10]
+    depths = [point["queue_depth"] for point in timeline]
+    in_flight = [point["jobs_in_flight"] for point in timeline]
+    return {
+        "config": {key: value for key, value in vars(args).items() if key != "report"},
+        "tools": tools,
+        "duration": round(elapsed, 3),
+        "streams": {name: stream.summary(elapsed) for name, stream in streams.items() if stream.submitted},
+        "queue_depth": {"max": loop.max_depth, "mean": statistics.fmean(depths) if depths else 0.0},
+        "jobs_in_flight": {"max": max(in_flight, default=0),
+                           "mean": statistics.fmean(in_flight) if in_flight else 0.0},
+        "memory": {
+            "source": "tracemalloc" if args.tracemalloc else "rss",
+            "start": timeline[0]["memory"] if timeline else 0,
+            "end": timeline[-1]["memory"] if timeline else 0,
+            "slope_bytes_per_s": _slope(steady),
+            "growth_sites": growth_sites,
+        },
+        "timeline": timeline,
+    }
+
+
+def print_report(report):
+    print(f"\n{'stream':<8} {'done':>8} {'failed':>7} {'left':>6} {'rate/s':>9} "
+          f"{'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+    for name, stream in report["streams"].items():
+        latency = stream["latency_ms"]
+        print(f"{name:<8} {stream['completed']:>8} {stream['failed']:>7} {stream['outstanding']:>6} "
+              f"{stream['throughput']:>9.1f} {latency['p50']:>9.2f} {latency['p90']:>9.2f} "
+              f"{latency['p99']:>9.2f} {latency['max']:>9.2f}")
+    depth, jobs, memory = report["queue_depth"], report["jobs_in_flight"], report["memory"]
+    print(f"\nmain-loop queue depth: max {depth['max']}, mean {depth['mean']:.1f}")
+    print(f"jobs in flight:        max {jobs['max']}, mean {jobs['mean']:.1f}")
+    print(f"memory ({memory['source']}): {memory['start'] / 2 ** 20:.1f} MB -> {memory['end'] / 2 ** 20:.1f} MB, "
+          f"trend {memory['slope_bytes_per_s'] * 60 / 1024:+.1f} KB/min")
+    for site in memory["growth_sites"]:
+        print(f"  {site['size_diff'] / 1024:+9.1f} KB {site['count_diff']:+7d} blocks  {site['site']}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--duration", type=float, default=30.0, help="Load phase in seconds")
+    parser.add_argument("--drain", type=float, default=10.0, help="Max seconds to finish outstanding work")
+    parser.add_argument("--artists", type=int, default=8, help="Simulated artists")
+    parser.add_argument("--click-rate", type=float, default=0.5, help="Tool clicks per artist per second")
+    parser.add_argument("--tool", action="append", default=[],
+                        help=f"Tool key to click (repeatable; default: {', '.join(DEFAULT_TOOLS)})")
+    parser.add_argument("--job-rate", type=float, default=4.0, help="Job submissions per second")
+    parser.add_argument("--job-time", type=float, default=0.2, help="Mean simulated job duration (s)")
+    parser.add_argument("--replay", metavar="JSONL", help="Recorded event stream to replay")
+    parser.add_argument("--replay-speed", type=float, default=1.0, help="Replay rate multiplier")
+    parser.add_argument("--record", metavar="JSONL", help="Record all published events to this file")
+    parser.add_argument("--meshes", type=int, default=20, help="Meshes in the fake scene")
+    parser.add_argument("--subdivisions", type=int, default=10, help="Grid subdivisions per mesh")
+    parser.add_argument("--interval", type=float, default=1.0, help="Sampling interval (s)")
+    parser.add_argument("--tracemalloc", action="store_true",
+                        help="Track Python allocations (slower; reports top growth sites)")
+    parser.add_argument("--top", type=int, default=10, help="Growth sites to report with --tracemalloc")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed")
+    parser.add_argument("--live", action="store_true", help="Print every sample while running")
+    parser.add_argument("--report", help="Write the full report (with timeline) as JSON")
+    parser.add_argument("--verbose", action="store_true", help="Keep the hub's INFO logging")
+    args = parser.parse_args(argv)
+    if args.replay_speed <= 0:
+        parser.error("--replay-speed must be positive")
+
+    if not args.verbose:
+        logging.getLogger().setLevel(logging.WARNING)
+    report = run_load(args)
+    print_report(report)
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nReport written to {args.report}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())